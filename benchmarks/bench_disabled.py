@@ -0,0 +1,64 @@
+"""
+Measure the overhead of `pdlog` when the `pdlog` logger is above INFO.
+
+Run with `python -m benchmarks.bench_disabled` from the root of the repository, so
+that `pdlog` is imported from the checkout. Each row compares the best of several
+repeats of `df.log.<method>` against `df.<method>`; the ratio should be within
+timing noise of 1.0.
+"""
+import logging
+import timeit
+from typing import Any
+from typing import Dict
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+import pdlog  # noqa
+
+
+N_ROWS = 1_000_000
+N_COLS = 10
+REPEAT = 5
+
+CASES: Tuple[Tuple[str, Dict[str, Any]], ...] = (
+    ("dropna", {}),
+    ("drop_duplicates", {}),
+    ("query", {"expr": "c0 > 0"}),
+    ("head", {}),
+    ("drop", {"columns": ["c0"]}),
+    ("rename", {"columns": {"c0": "x"}}),
+    ("reset_index", {}),
+    ("fillna", {"value": 0}),
+    ("ffill", {}),
+)
+
+
+def _frame() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((N_ROWS, N_COLS))
+    data[rng.random(data.shape) < 0.1] = np.nan
+    return pd.DataFrame(data, columns=[f"c{i}" for i in range(N_COLS)])
+
+
+def _best(fn: Any) -> float:
+    # as many calls per repeat as take at least 0.2s, so that fast methods such as
+    # `head` aren't timed from a handful of calls
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=REPEAT, number=number)) / number
+
+
+def main() -> None:
+    logging.getLogger("pdlog").setLevel(logging.WARNING)
+    df = _frame()
+    print(f"{'method':<16} {'pandas (s)':>12} {'pdlog (s)':>12} {'ratio':>8}")
+    for method, kwargs in CASES:
+        raw = _best(lambda: getattr(df, method)(**kwargs))
+        logged = _best(lambda: getattr(df.log, method)(**kwargs))
+        print(f"{method:<16} {raw:>12.6f} {logged:>12.6f} {logged / raw:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
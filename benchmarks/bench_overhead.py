@@ -0,0 +1,273 @@
+"""
+Measure the overhead of `pdlog` over plain `pandas` with the `pdlog` logger at INFO.
+
+Run with `python -m benchmarks.bench_overhead` from the root of the repository, so
+that `pdlog` is imported from the checkout. Every method of `df.log` is timed
+against the same `pandas` call over a grid of frame sizes, dtypes and index types,
+for example:
+
+    python -m benchmarks.bench_overhead --rows 1e3 1e5 1e7 --dtypes float object
+
+Each row reports the best of several repeats of both calls and their ratio, and
+the peak memory allocated by a single call of each (traced with `tracemalloc`).
+Methods that don't apply to a dtype, such as `interpolate` on strings, are listed
+as "n/a". With `--fail-above`, the exit status is 1 if any time ratio exceeds it,
+to catch regressions in CI.
+"""
+import argparse
+import logging
+import sys
+import timeit
+import tracemalloc
+import warnings
+from itertools import product
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+import pdlog
+from pdlog.string import nbytes
+
+
+ROWS = (1_000, 10_000, 100_000, 1_000_000)
+COLS = (10,)
+DTYPES = ("float", "int", "object", "category")
+INDEXES = ("range", "datetime", "multi")
+REPEAT = 5
+
+# Fraction of missing values in float, object and category columns
+NA_FRACTION = 0.1
+
+# Distinct values of object and category columns
+N_STRINGS = 1_000
+
+# The object a method is called on, and its arguments
+Call = Tuple[Any, Tuple[Any, ...], Dict[str, Any]]
+
+
+def _frame(rows: int, cols: int, dtype: str, index: str) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    if dtype == "float":
+        data: Any = rng.standard_normal((rows, cols))
+        data[rng.random(data.shape) < NA_FRACTION] = np.nan
+    elif dtype == "int":
+        data = rng.integers(0, 1_000_000, (rows, cols))
+    else:
+        strings = np.array([f"s{i}" for i in range(N_STRINGS)] + [None], dtype=object)
+        codes = rng.integers(0, N_STRINGS, (rows, cols))
+        codes[rng.random(codes.shape) < NA_FRACTION] = N_STRINGS
+        data = strings[codes]
+    df = pd.DataFrame(data, columns=[f"c{i}" for i in range(cols)])
+    if dtype == "category":
+        df = df.astype(pd.CategoricalDtype(strings[:-1]))
+    positions = np.arange(rows)
+    if index == "datetime":
+        df.index = pd.date_range("2020-01-01", periods=rows, freq="s")
+    elif index == "multi":
+        df.index = pd.MultiIndex.from_arrays([positions // 100, positions % 100])
+    return df
+
+
+def _first_value(df: pd.DataFrame) -> Any:
+    return df["c0"].dropna().iloc[0]
+
+
+def _exploded(df: pd.DataFrame) -> pd.DataFrame:
+    lists = np.empty(len(df), dtype=object)
+    lists.fill([0, 1])
+    return df.assign(c0=lists)
+
+
+def _pivoted(df: pd.DataFrame) -> pd.DataFrame:
+    positions = np.arange(len(df))
+    return df.reset_index(drop=True).assign(row=positions // 4, col=positions % 4)
+
+
+def _converted(df: pd.DataFrame) -> Any:
+    dtype = df.dtypes.iloc[0]
+    if dtype.kind in "iuf":
+        return f"{dtype.kind}4"
+    return object if dtype == "category" else "category"
+
+
+# How to call each method of `df.log` on a frame
+CASES: Dict[str, Callable[[pd.DataFrame], Call]] = {
+    "dropna": lambda df: (df, (), {}),
+    "drop_duplicates": lambda df: (df, (), {}),
+    "query": lambda df: (df, ("c0 == c0",), {}),
+    "head": lambda df: (df, (len(df) // 2,), {}),
+    "tail": lambda df: (df, (len(df) // 2,), {}),
+    "sample": lambda df: (df, (), {"frac": 0.5, "random_state": 0}),
+    "drop": lambda df: (df, (), {"columns": ["c0"]}),
+    "nlargest": lambda df: (df, (10, "c0"), {}),
+    "nsmallest": lambda df: (df, (10, "c0"), {}),
+    "loc[]": lambda df: (df, (df["c0"].notna().to_numpy(),), {}),
+    "iloc[]": lambda df: (df, (slice(None, None, 2),), {}),
+    "set_index": lambda df: (df, ("c0",), {}),
+    "reset_index": lambda df: (df, (), {}),
+    "rename": lambda df: (df, (), {"columns": {"c0": "x"}}),
+    "pivot": lambda df: (
+        _pivoted(df),
+        (),
+        {"index": "row", "columns": "col", "values": "c0"},
+    ),
+    "pivot_table": lambda df: (
+        df,
+        (),
+        {"values": "c0", "index": np.arange(len(df)) % 100},
+    ),
+    "melt": lambda df: (df, (), {}),
+    "explode": lambda df: (_exploded(df), ("c0",), {}),
+    "stack": lambda df: (df, (), {}),
+    "unstack": lambda df: (df, (), {}),
+    "fillna": lambda df: (df, (_first_value(df),), {}),
+    "bfill": lambda df: (df, (), {}),
+    "ffill": lambda df: (df, (), {}),
+    "interpolate": lambda df: (df, (), {}),
+    "where": lambda df: (df, (df.notna(),), {}),
+    "mask": lambda df: (df, (df.isna(),), {}),
+    "clip": lambda df: (df, (), {"lower": 0}),
+    "replace": lambda df: (df, (_first_value(df), df["c0"].dropna().iloc[-1]), {}),
+    "astype": lambda df: (df, (_converted(df),), {}),
+    "assign": lambda df: (df, (), {"x": 1}),
+    "convert_dtypes": lambda df: (df, (), {}),
+    "merge": lambda df: (
+        df,
+        (df[["c0"]].drop_duplicates().head(1_000),),
+        {"on": "c0"},
+    ),
+    "join": lambda df: (df, (df.iloc[::2, :1],), {"rsuffix": "_r"}),
+}
+
+
+class _FormattingHandler(logging.Handler):
+    """Format records, as a real handler would, without writing them anywhere."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.format(record)
+
+
+def _call(obj: Any, method: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+    if method.endswith("[]"):
+        return getattr(obj, method[:-2])[args[0]]
+    return getattr(obj, method)(*args, **kwargs)
+
+
+def _best(fn: Callable[[], Any], repeat: int) -> float:
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def _peak(fn: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _measure(df: pd.DataFrame, method: str, repeat: int) -> Optional[Dict[str, Any]]:
+    obj, args, kwargs = CASES[method](df)
+    try:
+        _call(obj, method, args, kwargs)
+    except (TypeError, ValueError, NotImplementedError):
+        return None
+    raw = lambda: _call(obj, method, args, kwargs)  # noqa: E731
+    logged = lambda: _call(obj.log, method, args, kwargs)  # noqa: E731
+    return {
+        "pandas_time": _best(raw, repeat),
+        "pdlog_time": _best(logged, repeat),
+        "pandas_peak": _peak(raw),
+        "pdlog_peak": _peak(logged),
+    }
+
+
+def run(
+    rows: Sequence[int],
+    cols: Sequence[int],
+    dtypes: Sequence[str],
+    indexes: Sequence[str],
+    methods: Sequence[str],
+    repeat: int = REPEAT,
+) -> pd.DataFrame:
+    """Measure every combination of the arguments, returning a row per combination."""
+    results: List[Dict[str, Any]] = []
+    print(
+        f"{'rows':>10} {'cols':>4} {'dtype':<8} {'index':<8} {'method':<16} "
+        f"{'pandas (s)':>11} {'pdlog (s)':>11} {'ratio':>7} "
+        f"{'pandas peak':>11} {'pdlog peak':>11} {'ratio':>7}"
+    )
+    for n_rows, n_cols, dtype, index in product(rows, cols, dtypes, indexes):
+        df = _frame(n_rows, n_cols, dtype, index)
+        for method in methods:
+            prefix = f"{n_rows:>10} {n_cols:>4} {dtype:<8} {index:<8} {method:<16}"
+            measures = _measure(df, method, repeat)
+            if measures is None:
+                print(f"{prefix} {'n/a':>11}", flush=True)
+                continue
+            row = {
+                "rows": n_rows,
+                "cols": n_cols,
+                "dtype": dtype,
+                "index": index,
+                "method": method,
+                **measures,
+                "time_ratio": measures["pdlog_time"] / measures["pandas_time"],
+                "memory_ratio": measures["pdlog_peak"]
+                / max(measures["pandas_peak"], 1),
+            }
+            results.append(row)
+            print(
+                f"{prefix} {row['pandas_time']:>11.6f} {row['pdlog_time']:>11.6f} "
+                f"{row['time_ratio']:>7.2f} {nbytes(row['pandas_peak']):>11} "
+                f"{nbytes(row['pdlog_peak']):>11} {row['memory_ratio']:>7.2f}",
+                flush=True,
+            )
+    return pd.DataFrame(results)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", nargs="+", type=lambda s: int(float(s)), default=ROWS)
+    parser.add_argument("--cols", nargs="+", type=int, default=COLS)
+    parser.add_argument("--dtypes", nargs="+", choices=DTYPES, default=DTYPES)
+    parser.add_argument("--indexes", nargs="+", choices=INDEXES, default=INDEXES)
+    parser.add_argument("--methods", nargs="+", choices=list(CASES), default=CASES)
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--csv", help="write the results to this CSV file")
+    parser.add_argument(
+        "--fail-above",
+        type=float,
+        help="exit with status 1 if any time ratio exceeds this",
+    )
+    args = parser.parse_args(argv)
+
+    # e.g. deprecations of the pandas calls being measured
+    warnings.simplefilter("ignore")
+    pdlog_logger = logging.getLogger("pdlog")
+    pdlog_logger.setLevel(logging.INFO)
+    pdlog_logger.addHandler(_FormattingHandler())
+    pdlog_logger.propagate = False
+    with pdlog.option_context(advise=False, profile=False):
+        results = run(
+            args.rows, args.cols, args.dtypes, args.indexes, args.methods, args.repeat
+        )
+
+    if args.csv:
+        results.to_csv(args.csv, index=False)
+    if args.fail_above is not None and (results["time_ratio"] > args.fail_above).any():
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
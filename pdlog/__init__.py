@@ -1,6 +1,56 @@
 from . import accessor
+from . import advisor
+from . import audit
+from . import config
+from . import filters
+from . import formatters
+from . import handlers
 from . import logging
+from . import parallel
+from . import pipeline
+from . import stats
+from . import streaming
 from . import string
+from . import tracking
+from .accessor import concat
+from .accessor import partitioned
+from .accessor import register_method
+from .accessor import register_strategy
+from .config import get_option
+from .config import option_context
+from .config import set_option
+from .filters import AggregatingFilter
+from .formatters import JSONFormatter
+from .logging import context
+from .streaming import stream
+from .tracking import track
 
 
-__all__ = ["accessor", "logging", "string"]
+__all__ = [
+    "accessor",
+    "advisor",
+    "audit",
+    "config",
+    "filters",
+    "formatters",
+    "handlers",
+    "logging",
+    "parallel",
+    "pipeline",
+    "stats",
+    "streaming",
+    "string",
+    "tracking",
+    "concat",
+    "partitioned",
+    "register_method",
+    "register_strategy",
+    "get_option",
+    "option_context",
+    "set_option",
+    "AggregatingFilter",
+    "JSONFormatter",
+    "context",
+    "stream",
+    "track",
+]
@@ -1,56 +1,303 @@
+from functools import partial
 from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Iterable
+from typing import Optional
 
 import pandas as pd
 
+from . import advisor
 from . import logging
+from .config import get_option
+from .parallel import Partitioned
+from .pipeline import Pipeline
+
+
+def _advised(result: Any) -> Any:
+    return advisor.advise(result) if get_option("advise") else result
+
+
+def concat(objs: Any, *args: Any, **kwargs: Any) -> Any:
+    """
+    Concatenate pandas objects like `pd.concat`, logging the rows of each input, the
+    columns missing from some inputs and the dtypes that were upcast.
+    """
+    return _advised(logging.log_concat(objs, *args, **kwargs))
+
+
+def partitioned(
+    frames: Iterable[pd.DataFrame],
+    name: str = "partitioned",
+    executor: str = "thread",
+    max_workers: Optional[int] = None,
+) -> Partitioned:
+    """
+    Run `df.log` methods on each of `frames` in parallel, in a pool of threads or of
+    processes depending on `executor`, returning the list of results.
+
+    A single summary per function is logged with totals over all partitions, rather
+    than one message per partition. Messages above INFO, such as partitions that
+    lost all their rows, are still logged per partition, tagged with its position.
+
+    >>> frames = [pd.DataFrame({"x": [1, None]}), pd.DataFrame({"x": [2, 3]})]
+    >>> [len(df) for df in partitioned(frames).dropna()]
+    [1, 2]
+    """
+    return Partitioned(list(frames), METHODS, name, executor, max_workers)
+
+
+# Logging functions, called as `strategy(df, method_name, *args, **kwargs)`
+STRATEGIES: Dict[str, Callable[..., Any]] = {
+    "filter": logging.log_filter,
+    "change_index": logging.log_change_index,
+    "rename": logging.log_rename,
+    "reshape": logging.log_reshape,
+    "fillna": logging.log_fillna,
+    "replace": logging.log_replace,
+    "change_dtype": logging.log_change_dtype,
+    "merge": logging.log_merge,
+    "change_values": logging.log_change_values,
+}
+
+# `pd.DataFrame` methods logged by `df.log`, and their strategy. Names ending with
+# "[]" are indexers, e.g. `df.log.loc[key]`.
+METHODS: Dict[str, str] = {
+    "dropna": "filter",
+    "drop_duplicates": "filter",
+    "query": "filter",
+    "head": "filter",
+    "tail": "filter",
+    "sample": "filter",
+    "drop": "filter",
+    "nlargest": "filter",
+    "nsmallest": "filter",
+    "loc[]": "filter",
+    "iloc[]": "filter",
+    "set_index": "change_index",
+    "reset_index": "change_index",
+    "rename": "rename",
+    "pivot": "reshape",
+    "pivot_table": "reshape",
+    "melt": "reshape",
+    "explode": "reshape",
+    "stack": "reshape",
+    "unstack": "reshape",
+    "fillna": "fillna",
+    "bfill": "fillna",
+    "ffill": "fillna",
+    "interpolate": "fillna",
+    "where": "replace",
+    "mask": "replace",
+    "clip": "replace",
+    "replace": "replace",
+    "astype": "change_dtype",
+    "assign": "change_dtype",
+    "convert_dtypes": "change_dtype",
+    "merge": "merge",
+    "join": "merge",
+}
+
+# `pd.Series` methods logged by `series.log`, and their strategy
+SERIES_METHODS: Dict[str, str] = {
+    "dropna": "filter",
+    "drop_duplicates": "filter",
+    "head": "filter",
+    "tail": "filter",
+    "sample": "filter",
+    "loc[]": "filter",
+    "iloc[]": "filter",
+    "fillna": "fillna",
+    "bfill": "fillna",
+    "ffill": "fillna",
+    "map": "change_values",
+    "replace": "change_values",
+    "astype": "change_values",
+    "where": "change_values",
+    "mask": "change_values",
+    "clip": "change_values",
+}
+
+# Accessors of `pd.Series` whose methods and properties `series.log` logs, e.g.
+# `series.log.str.lower()`
+SERIES_NAMESPACES = ("str", "dt", "cat")
+
+# `LogAccessor` methods that aren't generated from `METHODS`
+_RESERVED = frozenset(("groupby", "memory_report", "pipeline"))
 
 
 @pd.api.extensions.register_dataframe_accessor("log")
 class LogAccessor:
+    """
+    Methods of `pd.DataFrame` with logging, generated from `METHODS` and
+    `STRATEGIES`, see `register_method`.
+    """
+
     def __init__(self, data: pd.DataFrame):
         self._data = data
 
-    def dropna(self, *args: Any, **kwargs: Any) -> pd.DataFrame:
-        return logging.log_filter(self._data, "dropna", *args, **kwargs)
+    def memory_report(self, deep: Optional[bool] = None) -> pd.DataFrame:
+        """See `pdlog.advisor.memory_report`."""
+        return advisor.memory_report(self._data, deep)
+
+    def pipeline(self) -> Pipeline:
+        """
+        Start a chain of logged operations, run with `Pipeline.run`.
+
+        >>> df = pd.DataFrame({"x": [1, None]})
+        >>> df.log.pipeline().dropna().astype(int).run()
+           x
+        0  1
+        """
+        return Pipeline(self._data, METHODS)
+
+    def groupby(self, *args: Any, **kwargs: Any) -> "LogGroupBy":
+        return LogGroupBy(self._data, self._data.groupby(*args, **kwargs))
+
+
+@pd.api.extensions.register_series_accessor("log")
+class LogSeriesAccessor:
+    """
+    Methods of `pd.Series` with logging, generated from `SERIES_METHODS`, and the
+    `str`, `dt` and `cat` accessors with logging.
+    """
+
+    def __init__(self, data: pd.Series):
+        self._data = data
+
+
+class _LogNamespace:
+    """
+    An accessor of a series, such as `str`, whose methods and properties log with
+    `pdlog.logging.log_change_values`.
+    """
+
+    def __init__(self, data: pd.Series, name: str):
+        # fail early, like pandas, for accessors invalid for the series' dtype
+        self._namespace = getattr(data, name)
+        self._data = data
+        self._name = name
+
+    def __getattr__(self, attribute: str) -> Any:
+        name = f"{self._name}.{attribute}"
+        if isinstance(getattr(type(self._namespace), attribute, None), property):
+            return logging.log_change_values(self._data, name)
+        getattr(self._namespace, attribute)  # raise AttributeError for unknown names
+        return partial(logging.log_change_values, self._data, name)
+
+    def __dir__(self) -> List[str]:
+        return dir(self._namespace)
+
+
+def _namespace(name: str) -> Any:
+    def namespace(self: LogSeriesAccessor) -> _LogNamespace:
+        return _LogNamespace(self._data, name)
+
+    namespace.__doc__ = f"`pd.Series.{name}` with logging."
+    return property(namespace)
+
+
+class _LogIndexer:
+    def __init__(self, data: Any, name: str, strategy: Callable[..., Any]):
+        self._data = data
+        self._name = name
+        self._strategy = strategy
+
+    def __getitem__(self, key: Any) -> Any:
+        return _advised(self._strategy(self._data, self._name, key))
+
+
+def _attribute(name: str) -> str:
+    return name[:-2] if name.endswith("[]") else name
+
 
-    def drop_duplicates(self, *args: Any, **kwargs: Any) -> pd.DataFrame:
-        return logging.log_filter(self._data, "drop_duplicates", *args, **kwargs)
+def _method(name: str, strategy: Callable[..., Any], cls: type = pd.DataFrame) -> Any:
+    if name.endswith("[]"):
 
-    def query(self, *args: Any, **kwargs: Any) -> pd.DataFrame:
-        return logging.log_filter(self._data, "query", *args, **kwargs)
+        def indexer(self: Any) -> _LogIndexer:
+            return _LogIndexer(self._data, name, strategy)
 
-    def head(self, *args: Any, **kwargs: Any) -> pd.DataFrame:
-        return logging.log_filter(self._data, "head", *args, **kwargs)
+        indexer.__doc__ = f"`pd.{cls.__name__}.{_attribute(name)}` with logging."
+        return property(indexer)
 
-    def tail(self, *args: Any, **kwargs: Any) -> pd.DataFrame:
-        return logging.log_filter(self._data, "tail", *args, **kwargs)
+    def method(self: Any, *args: Any, **kwargs: Any) -> Any:
+        return _advised(strategy(self._data, name, *args, **kwargs))
 
-    def sample(self, *args: Any, **kwargs: Any) -> pd.DataFrame:
-        return logging.log_filter(self._data, "sample", *args, **kwargs)
+    method.__name__ = name
+    method.__doc__ = f"`pd.{cls.__name__}.{name}` with logging."
+    return method
 
-    def drop(self, *args: Any, **kwargs: Any) -> pd.DataFrame:
-        return logging.log_filter(self._data, "drop", *args, **kwargs)
 
-    def set_index(self, *args: Any, **kwargs: Any) -> pd.DataFrame:
-        return logging.log_change_index(self._data, "set_index", *args, **kwargs)
+def register_strategy(name: str, strategy: Callable[..., Any]) -> None:
+    """
+    Register a logging function to use with `register_method`.
+
+    `strategy` is called with the dataframe, the name of the method and its
+    arguments, and should call the method and log, like the functions of
+    `pdlog.logging`. Methods are bound to strategies when they are registered, so
+    replacing a strategy only affects methods registered afterwards.
+    """
+    STRATEGIES[name] = strategy
+
+
+def register_method(name: str, strategy: str) -> None:
+    """
+    Add a `df.log.<name>` method, logging `df.<name>` with a registered strategy.
+
+    A `name` ending with "[]" adds an indexer instead, e.g. "loc[]" for
+    `df.log.loc[key]`. The method is generated once, so calls don't look up the
+    registry.
+    """
+    if strategy not in STRATEGIES:
+        raise KeyError(f"unknown strategy: {strategy}")
+    if _attribute(name) in _RESERVED:
+        raise ValueError(f"can't override the {name} method of LogAccessor")
+    METHODS[name] = strategy
+    setattr(LogAccessor, _attribute(name), _method(name, STRATEGIES[strategy]))
+
+
+for _name, _strategy in METHODS.items():
+    setattr(LogAccessor, _attribute(_name), _method(_name, STRATEGIES[_strategy]))
+
+for _name, _strategy in SERIES_METHODS.items():
+    _series_method = _method(_name, STRATEGIES[_strategy], pd.Series)
+    setattr(LogSeriesAccessor, _attribute(_name), _series_method)
+
+for _name in SERIES_NAMESPACES:
+    setattr(LogSeriesAccessor, _name, _namespace(_name))
+
+
+class LogGroupBy:
+    """
+    A `groupby` of a dataframe whose `agg`, `filter`, `apply` and `transform`
+    methods log, see `pdlog.logging.log_groupby`.
+    """
+
+    def __init__(self, data: pd.DataFrame, groupby: Any):
+        self._data = data
+        self._groupby = groupby
 
-    def reset_index(self, *args: Any, **kwargs: Any) -> pd.DataFrame:
-        return logging.log_change_index(self._data, "reset_index", *args, **kwargs)
+    def __getitem__(self, key: Any) -> "LogGroupBy":
+        return LogGroupBy(self._data, self._groupby[key])
 
-    def rename(self, *args: Any, **kwargs: Any) -> pd.DataFrame:
-        return logging.log_rename(self._data, "rename", *args, **kwargs)
+    def _call(self, function_name: str, *args: Any, **kwargs: Any) -> Any:
+        return _advised(
+            logging.log_groupby(
+                self._data, self._groupby, function_name, *args, **kwargs
+            )
+        )
 
-    def pivot(self, *args: Any, **kwargs: Any) -> pd.DataFrame:
-        return logging.log_reshape(self._data, "pivot", *args, **kwargs)
+    def agg(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call("agg", *args, **kwargs)
 
-    def melt(self, *args: Any, **kwargs: Any) -> pd.DataFrame:
-        return logging.log_reshape(self._data, "melt", *args, **kwargs)
+    aggregate = agg
 
-    def fillna(self, *args: Any, **kwargs: Any) -> pd.DataFrame:
-        return logging.log_fillna(self._data, "fillna", *args, **kwargs)
+    def filter(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call("filter", *args, **kwargs)
 
-    def bfill(self, *args: Any, **kwargs: Any) -> pd.DataFrame:
-        return logging.log_fillna(self._data, "bfill", *args, **kwargs)
+    def apply(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call("apply", *args, **kwargs)
 
-    def ffill(self, *args: Any, **kwargs: Any) -> pd.DataFrame:
-        return logging.log_fillna(self._data, "ffill", *args, **kwargs)
+    def transform(self, *args: Any, **kwargs: Any) -> Any:
+        return self._call("transform", *args, **kwargs)
@@ -0,0 +1,230 @@
+"""
+Suggest dtype downcasts that reduce the memory usage of a dataframe.
+
+Integers are downcast to the smallest integer type holding their range, floats to
+float32 when their range allows it (at the cost of precision) and object columns
+with few distinct values to categoricals. Ranges take a single vectorized pass
+over numeric columns. Cardinality is first estimated on a sample of rows, and
+only columns that look categorical get their distinct values counted, stopping as
+soon as there are too many.
+"""
+import logging
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import get_option
+from .logging import log_change_dtype
+from .logging import logger
+from .string import Lazy
+from .string import nbytes
+from .string import summarize_counts
+
+
+# Object columns are suggested as categoricals if they have fewer distinct values
+# than this fraction of their length
+CATEGORY_RATIO = 0.5
+
+# Rows of an object column whose distinct values are counted at a time
+_CHUNK_ROWS = 65_536
+
+
+def _nullable(dtype: "np.dtype[Any]") -> Any:
+    """Return the nullable extension dtype matching `dtype`, e.g. "Int8" for int8."""
+    prefix = {"i": "Int", "u": "UInt", "f": "Float"}[dtype.kind]
+    return pd.api.types.pandas_dtype(f"{prefix}{dtype.itemsize * 8}")
+
+
+def _downcast_number(series: pd.Series) -> Any:
+    """
+    Return the smallest dtype holding the values of numeric `series`, a nullable
+    dtype such as "Int8" if `series` has one, or `None` if it can't be downcast.
+    """
+    dtype = series.dtype
+    extension = isinstance(dtype, pd.api.extensions.ExtensionDtype)
+    candidate: "Optional[np.dtype[Any]]" = None
+    if dtype.kind in "iu":
+        low, high = series.min(), series.max()
+        if pd.isna(low):
+            return None
+        for itemsize in (1, 2, 4):
+            if itemsize >= dtype.itemsize:
+                return None
+            info = np.iinfo(np.dtype(f"{dtype.kind}{itemsize}"))
+            if info.min <= low and high <= info.max:
+                candidate = np.dtype(f"{dtype.kind}{itemsize}")
+                break
+    elif dtype.kind == "f" and dtype.itemsize == 8:
+        high = series.abs().max()
+        if not pd.isna(high) and not high > np.finfo(np.float32).max:
+            candidate = np.dtype(np.float32)
+    if candidate is None:
+        return None
+    return _nullable(candidate) if extension else candidate
+
+
+def _uniques_at_most(series: pd.Series, limit: int) -> Optional[pd.Index]:
+    """Return the distinct values of `series`, or `None` if there are over `limit`."""
+    uniques = pd.Index([])
+    for start in range(0, len(series), _CHUNK_ROWS):
+        chunk = series.iloc[start : start + _CHUNK_ROWS]
+        uniques = uniques.append(pd.Index(chunk.dropna().unique())).unique()
+        if len(uniques) > limit:
+            return None
+    return uniques
+
+
+def _categories(series: pd.Series) -> Optional[pd.Index]:
+    """Return the categories of `series` if it should be a categorical."""
+    limit = int(len(series) * CATEGORY_RATIO)
+    size = get_option("sample_size")
+    try:
+        if len(series) > size:
+            rng = np.random.default_rng(get_option("random_state"))
+            sample = series.take(rng.choice(len(series), size=size, replace=False))
+            if sample.nunique() > size * CATEGORY_RATIO:
+                return None
+        return _uniques_at_most(series, limit)
+    except TypeError:
+        # unhashable values, such as lists, can't be categories
+        return None
+
+
+def _code_itemsize(n_categories: int) -> int:
+    for itemsize in (1, 2, 4):
+        if n_categories < 2 ** (8 * itemsize - 1):
+            return itemsize
+    return 8
+
+
+def _suggest(df: pd.DataFrame, deep: bool) -> Dict[int, Tuple[Any, int]]:
+    """
+    Return the suggested dtype and projected memory usage of columns of `df`, by
+    position rather than label, which may be duplicated.
+    """
+    suggestions: Dict[int, Tuple[Any, int]] = {}
+    for i, dtype in enumerate(df.dtypes):
+        series = df.iloc[:, i]
+        if not len(series):
+            continue
+        if dtype.kind in "iuf":
+            downcast = _downcast_number(series)
+            if downcast is not None:
+                itemsize = downcast.itemsize
+                if isinstance(downcast, pd.api.extensions.ExtensionDtype):
+                    # and a byte per value for the mask of missing values
+                    itemsize += 1
+                suggestions[i] = (downcast, len(series) * itemsize)
+        elif dtype == object:
+            categories = _categories(series)
+            if categories is not None:
+                memory = len(series) * _code_itemsize(len(categories))
+                # not `categories.memory_usage`, which counts its hash table
+                memory += pd.Series(categories).memory_usage(index=False, deep=deep)
+                if memory < series.memory_usage(index=False, deep=deep):
+                    suggestions[i] = ("category", memory)
+    return suggestions
+
+
+def _by_label(
+    df: pd.DataFrame, suggestions: Dict[int, Tuple[Any, int]]
+) -> Dict[Any, Any]:
+    """
+    Return the suggested dtypes by column label, suitable for `df.astype`, leaving
+    out labels shared by columns that wouldn't all be downcast to the same dtype.
+    """
+    dtypes: Dict[Any, Any] = {}
+    conflicting = set()
+    for i, column in enumerate(df.columns):
+        dtype = suggestions[i][0] if i in suggestions else None
+        if column in dtypes and dtypes[column] != dtype:
+            conflicting.add(column)
+        dtypes[column] = dtype
+    return {
+        column: dtype
+        for column, dtype in dtypes.items()
+        if dtype is not None and column not in conflicting
+    }
+
+
+def suggest_dtypes(df: pd.DataFrame) -> Dict[Any, Any]:
+    """
+    Return a mapping from the columns of `df` that can be downcast to a dtype using
+    less memory, suitable for `df.astype`.
+
+    Columns sharing a label are only included if they can all be downcast to the
+    same dtype.
+
+    >>> df = pd.DataFrame({"i": [1, 200], "f": [0.5, 1.5], "s": ["a", "b"]})
+    >>> suggest_dtypes(df)
+    {'i': dtype('int16'), 'f': dtype('float32')}
+    >>> suggest_dtypes(pd.DataFrame({"s": ["a"] * 3 + ["b"]}))
+    {'s': 'category'}
+    """
+    return _by_label(df, _suggest(df, False))
+
+
+def memory_report(df: pd.DataFrame, deep: Optional[bool] = None) -> pd.DataFrame:
+    """
+    Return the memory usage of each column of `df` with its suggested dtype, if any,
+    and the projected memory usage and bytes saved with it.
+
+    Memory usage is deep if `deep`, which defaults to the "memory_deep" option.
+    """
+    if deep is None:
+        deep = get_option("memory_deep")
+    suggestions = _suggest(df, deep)
+    memory = df.memory_usage(index=False, deep=deep).to_numpy()
+    suggested = [suggestions.get(i, (None, None)) for i in range(df.shape[1])]
+    report = pd.DataFrame(
+        {
+            "dtype": df.dtypes.to_numpy(),
+            "memory": memory,
+            "suggested": [dtype for dtype, _ in suggested],
+            "memory_after": [
+                m if after is None else after
+                for m, (_, after) in zip(memory, suggested)
+            ],
+        },
+        index=df.columns,
+    )
+    report["saved"] = report["memory"] - report["memory_after"]
+    return report
+
+
+def advise(df: Any) -> Any:
+    """
+    Log the downcasts suggested for `df` and the memory they would save.
+
+    With the "advise_apply" option, the downcasts are applied (and logged as an
+    `astype`) and the downcast dataframe is returned, otherwise `df` is.
+    """
+    apply = get_option("advise_apply")
+    if not isinstance(df, pd.DataFrame):
+        return df
+    if not apply and not logger.isEnabledFor(logging.INFO):
+        return df
+    deep = get_option("memory_deep")
+    suggestions = _suggest(df, deep)
+    if not suggestions:
+        return df
+    memory = df.memory_usage(index=False, deep=deep).to_numpy()
+    saved = int(sum(memory[i] - after for i, (_, after) in suggestions.items()))
+    transitions = {
+        df.columns[i]: f"{df.dtypes.iloc[i]} -> {dtype}"
+        for i, (dtype, _) in suggestions.items()
+    }
+    logger.info(
+        "advisor: downcast %s to save %s",
+        Lazy(summarize_counts, transitions, 5),
+        Lazy(nbytes, saved),
+        extra={"pdlog": {"advice": transitions, "saved": saved}},
+    )
+    dtypes = _by_label(df, suggestions)
+    if not apply or not dtypes:
+        return df
+    return log_change_dtype(df, "astype", dtypes)
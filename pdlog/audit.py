@@ -0,0 +1,128 @@
+"""
+Keep an audit trail of the rows dropped by filters, see the "audit_path" option.
+
+Every filter dropping rows writes them to a new file in the "audit_path" directory,
+in the "audit_format" format, so the trail grows by appending files while a stream
+of chunks is processed. Dropped rows are found with an anti-join of the input's
+index against the result's, and only those rows (up to "audit_max_rows" of them)
+are copied, rather than keeping a copy of the whole input.
+"""
+import os
+import time
+import uuid
+from itertools import count
+from pathlib import Path
+from typing import Any
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from .config import get_option
+
+
+FORMATS = {"pickle": "pkl", "parquet": "parquet", "feather": "feather"}
+
+# Identifies this run, as process IDs may be reused by later runs, e.g. in
+# containers, and numbers the files written by this process in order
+_run = f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}"
+_sequence = count()
+
+
+def _positions(
+    function_name: str, before: pd.Index, after: pd.Index
+) -> "np.ndarray[Any, Any]":
+    """
+    Return the positions in `before` of the labels that aren't in `after`.
+
+    Labels occurring several times in `before` and fewer times in `after` can't be
+    told apart: the positions of their last occurrences are returned.
+    """
+    n_before, n_kept = len(before), len(after)
+    # `head` and `tail` keep a prefix or suffix, whatever the labels
+    if function_name == "head":
+        return np.arange(n_kept, n_before)
+    if function_name == "tail":
+        return np.arange(n_before - n_kept)
+    if before.is_unique:
+        return np.flatnonzero(~before.isin(after))
+    # with duplicate labels, a label is dropped as many times as it occurs less
+    # often in `after`, keeping its first occurrences
+    uniques = before.unique()
+    codes = uniques.get_indexer(before)
+    kept = uniques.get_indexer(after)
+    kept_counts = np.bincount(kept[kept >= 0], minlength=len(uniques))
+    occurrence = pd.Series(codes).groupby(codes).cumcount().to_numpy()
+    return np.flatnonzero(occurrence >= kept_counts[codes])
+
+
+def _capped(positions: "np.ndarray[Any, Any]") -> "np.ndarray[Any, Any]":
+    max_rows = get_option("audit_max_rows")
+    if max_rows is None or len(positions) <= max_rows:
+        return positions
+    if get_option("audit_sampling") == "random":
+        rng = np.random.default_rng(get_option("random_state"))
+        return np.sort(rng.choice(positions, size=max_rows, replace=False))
+    return positions[:max_rows]
+
+
+def _write(rows: pd.DataFrame, path: Path, file_format: str) -> None:
+    if file_format != "pickle":
+        # keep the index (the labels of the dropped rows) as columns, and name
+        # columns with strings, as required by Arrow formats
+        rows = rows.reset_index()
+        rows.columns = rows.columns.map(str)
+    # never replace an existing file of the trail
+    with open(path, "xb") as file:
+        if file_format == "pickle":
+            rows.to_pickle(file)
+        elif file_format == "parquet":
+            rows.to_parquet(file)
+        else:
+            rows.to_feather(file)
+
+
+def spill(before: Any, after: Any, function_name: str) -> Optional[Path]:
+    """
+    Write the rows of `before` that were dropped from `after` by `function_name` to
+    a new file in the "audit_path" directory, returning its path.
+
+    If more rows than the "audit_max_rows" option were dropped, only the first of
+    them are written, or a random sample of them if the "audit_sampling" option is
+    "random". Nothing is written if no rows were dropped.
+    """
+    file_format = get_option("audit_format")
+    if file_format not in FORMATS:
+        raise ValueError(
+            f"audit_format must be one of {list(FORMATS)}, got {file_format!r}"
+        )
+    positions = _capped(_positions(function_name, before.index, after.index))
+    if not len(positions):
+        return None
+    rows = before.take(positions)
+    if rows.ndim == 1:
+        rows = rows.to_frame()
+    directory = Path(get_option("audit_path"))
+    directory.mkdir(parents=True, exist_ok=True)
+    name = f"{_run}-{os.getpid()}-{next(_sequence):06d}-{function_name.strip('[]')}"
+    path = directory / f"{name}.{FORMATS[file_format]}"
+    _write(rows, path, file_format)
+    return path
+
+
+def read(path: Any = None) -> pd.DataFrame:
+    """
+    Read the audit trail in `path`, by default the "audit_path" option, as a single
+    dataframe with the file each row comes from as its "audit_file" column.
+    """
+    directory = Path(get_option("audit_path") if path is None else path)
+    frames = []
+    for file in sorted(directory.iterdir(), key=lambda f: f.name):
+        file_format = next(
+            (k for k, ext in FORMATS.items() if file.suffix == f".{ext}"), None
+        )
+        if file_format is None:
+            continue
+        frame = getattr(pd, f"read_{file_format}")(file)
+        frames.append(frame.assign(audit_file=file.name))
+    return pd.concat(frames) if frames else pd.DataFrame()
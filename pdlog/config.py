@@ -0,0 +1,80 @@
+from contextlib import contextmanager
+from typing import Any
+from typing import Dict
+from typing import Iterator
+
+
+_options: Dict[str, Any] = {
+    # Number of columns processed at a time when computing statistics
+    "chunk_size": 64,
+    # Estimate statistics from a random sample of rows for frames longer than
+    # sample_size, rather than computing them exactly
+    "approximate": False,
+    "sample_size": 100_000,
+    "random_state": 0,
+    # Measure CPU time and the change in (shallow) memory usage of every logged
+    # call, optionally along with its peak memory allocations using tracemalloc
+    "profile": False,
+    "profile_tracemalloc": False,
+    # Report the deep memory usage of frames in type conversions, which counts the
+    # objects referenced by object columns at the cost of a pass over them
+    "memory_deep": False,
+    # After every logged operation, log the dtype downcasts that would reduce the
+    # memory usage of its result and, with advise_apply, apply them
+    "advise": False,
+    "advise_apply": False,
+    # Number of labels (or runs of consecutive labels, for a RangeIndex) reported
+    # at each end of the rows dropped by filters, 0 not to report them
+    "dropped_labels": 0,
+    # Write the rows dropped by filters to files in the audit_path directory, in
+    # the audit_format format ("pickle", "parquet" or "feather"), at most
+    # audit_max_rows of them per call, the first ones or, with audit_sampling set
+    # to "random", a random sample
+    "audit_path": None,
+    "audit_format": "pickle",
+    "audit_max_rows": 100_000,
+    "audit_sampling": "first",
+}
+
+
+def _check(name: str) -> None:
+    if name not in _options:
+        raise KeyError(f"unknown option: {name}")
+
+
+def get_option(name: str) -> Any:
+    """
+    Get the value of a `pdlog` option.
+
+    >>> get_option("chunk_size")
+    64
+    """
+    _check(name)
+    return _options[name]
+
+
+def set_option(name: str, value: Any) -> None:
+    """Set the value of a `pdlog` option."""
+    _check(name)
+    _options[name] = value
+
+
+@contextmanager
+def option_context(**options: Any) -> Iterator[None]:
+    """
+    Temporarily set `pdlog` options within a `with` block.
+
+    >>> with option_context(chunk_size=8):
+    ...     get_option("chunk_size")
+    8
+    >>> get_option("chunk_size")
+    64
+    """
+    for name in options:
+        _check(name)
+    previous = {name: _options[name] for name in options}
+    _options.update(options)
+    try:
+        yield
+    finally:
+        _options.update(previous)
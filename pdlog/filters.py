@@ -0,0 +1,122 @@
+import logging
+import threading
+import time
+from typing import Dict
+from typing import Hashable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from .logging import OBSERVATION
+from .logging import ROW
+from .string import plural
+
+
+class _Aggregate:
+    __slots__ = ("start", "record", "calls", "rows_dropped", "filled")
+
+    def __init__(self, start: float):
+        self.start = start
+        self.record: Optional[logging.LogRecord] = None
+        self.calls = 0
+        self.rows_dropped = 0
+        self.filled = 0
+
+    def add(self, record: logging.LogRecord) -> None:
+        payload = record.pdlog  # type: ignore
+        self.record = record
+        self.calls += 1
+        self.rows_dropped += payload["rows_before"] - payload["rows_after"]
+        self.filled += payload.get("filled", 0)
+
+
+class AggregatingFilter(logging.Filter):
+    """
+    Coalesce repeated `pdlog` records, e.g. from calls in a loop or groupby-apply.
+
+    The first record of each kind (same level, message template and function) is
+    passed through. Records of the same kind that follow within `window` seconds,
+    or up to `max_count` of them, are suppressed and accumulated. They are then
+    summarized in a single record, such as "dropna called 4812 more times in 1.0s:
+    dropped 12003 rows total", once the window or count is exceeded or on `flush`.
+    The record that closes a window is counted in its summary, and the next record
+    starts a new window.
+
+    Memory use is constant: one small accumulator per kind of record.
+
+    Add the filter to the `pdlog` logger:
+
+    >>> aggregate = AggregatingFilter(window=10)
+    >>> logging.getLogger("pdlog").addFilter(aggregate)
+    >>> aggregate.flush()
+    >>> logging.getLogger("pdlog").removeFilter(aggregate)
+    """
+
+    def __init__(self, window: float = 1.0, max_count: Optional[int] = None):
+        super().__init__()
+        self.window = window
+        self.max_count = max_count
+        self._aggregates: Dict[Hashable, _Aggregate] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        payload = getattr(record, "pdlog", None)
+        if payload is None or "function" not in payload or _is_summary(record):
+            return True
+        key = (record.levelno, record.msg, payload["function"])
+        now = time.monotonic()
+        with self._lock:
+            aggregate = self._aggregates.get(key)
+            if aggregate is None:
+                self._aggregates[key] = _Aggregate(now)
+                return True
+            aggregate.add(record)
+            full = self.max_count is not None and aggregate.calls >= self.max_count
+            if not full and now - aggregate.start < self.window:
+                return False
+            self._aggregates[key] = _Aggregate(now)
+        if aggregate.calls > 1:
+            _summarize(aggregate, record, now)
+        return True
+
+    def flush(self) -> None:
+        """Log a summary of every record suppressed so far."""
+        now = time.monotonic()
+        with self._lock:
+            pending: List[Tuple[Hashable, _Aggregate]] = list(self._aggregates.items())
+            self._aggregates.clear()
+        for _, aggregate in pending:
+            if aggregate.record is not None:
+                record = logging.makeLogRecord(aggregate.record.__dict__)
+                _summarize(aggregate, record, now)
+                logging.getLogger(record.name).handle(record)
+
+
+def _is_summary(record: logging.LogRecord) -> bool:
+    return "calls" in record.pdlog  # type: ignore
+
+
+def _summarize(aggregate: _Aggregate, record: logging.LogRecord, now: float) -> None:
+    """Rewrite `record` into a summary of `aggregate`."""
+    function = record.pdlog["function"]  # type: ignore
+    details: List[str] = []
+    if aggregate.rows_dropped > 0:
+        details.append(f"dropped {plural(aggregate.rows_dropped, ROW)} total")
+    elif aggregate.rows_dropped < 0:
+        details.append(f"added {plural(-aggregate.rows_dropped, ROW)} total")
+    if aggregate.filled:
+        details.append(f"filled {plural(aggregate.filled, OBSERVATION)} total")
+    record.msg = "%s called %s in %.1fs" + (": %s" if details else "")
+    record.args = (
+        function,
+        plural(aggregate.calls, "more time"),
+        now - aggregate.start,
+    )
+    if details:
+        record.args += (", ".join(details),)
+    record.pdlog = {  # type: ignore
+        "function": function,
+        "calls": aggregate.calls,
+        "rows_dropped": aggregate.rows_dropped,
+        "filled": aggregate.filled,
+    }
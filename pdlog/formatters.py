@@ -0,0 +1,50 @@
+import json
+import logging
+from typing import Any
+from typing import Dict
+from typing import Mapping
+
+import numpy as np
+import pandas as pd
+
+from .string import Lazy
+
+
+def _jsonable(obj: Any) -> Any:
+    if isinstance(obj, Lazy):
+        obj = obj.value()
+    if isinstance(obj, Mapping):
+        return {str(k): v for k, v in obj.items()}
+    if isinstance(obj, (pd.Index, np.ndarray)):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return str(obj)
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    Format records as single-line JSON objects.
+
+    Each object holds the record's time, level, logger name and message, along with
+    the fields of the structured payload that `pdlog.logging` attaches to its
+    records, so that log aggregators don't need to parse messages.
+
+    >>> record = logging.LogRecord("pdlog", logging.INFO, "", 0, "msg", (), None)
+    >>> record.pdlog = {"function": "dropna", "rows_before": 6, "rows_after": 5}
+    >>> JSONFormatter(datefmt="-").format(record)
+    '{"time": "-", "level": "INFO", "logger": "pdlog", "message": "msg", \
+"function": "dropna", "rows_before": 6, "rows_after": 5}'
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        data: Dict[str, Any] = {
+            "time": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        data.update(getattr(record, "pdlog", {}))
+        if record.exc_info:
+            data["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(data, default=_jsonable)
@@ -0,0 +1,208 @@
+import copy
+import logging
+import queue
+from contextlib import contextmanager
+from logging.handlers import QueueHandler
+from logging.handlers import QueueListener
+from typing import Any
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+from .logging import logger
+from .streaming import StreamCollector
+from .string import Lazy
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    Enqueue records on a bounded queue, either dropping or blocking when it's full.
+
+    Unlike `QueueHandler`, records are enqueued without being formatted, so that
+    formatting (including `pdlog`'s lazy message arguments) happens on the thread
+    of the `QueueListener` rather than the caller's.
+    """
+
+    def __init__(self, queue: "queue.Queue[Any]", policy: str = "drop"):
+        if policy not in ("drop", "block"):
+            raise ValueError(f"policy must be 'drop' or 'block', got {policy!r}")
+        super().__init__(queue)
+        self.policy = policy
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return copy.copy(record)
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.policy == "block":
+            self.queue.put(record)  # type: ignore
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _Listener(QueueListener):
+    def enqueue_sentinel(self) -> None:
+        # the queue may be full, wait for space rather than failing
+        self.queue.put(self._sentinel)  # type: ignore
+
+
+class _State:
+    def __init__(
+        self,
+        queue: "queue.Queue[Any]",
+        handler: BoundedQueueHandler,
+        listener: QueueListener,
+        handlers: List[logging.Handler],
+        propagate: bool,
+    ):
+        self.queue = queue
+        self.handler = handler
+        self.listener = listener
+        self.handlers = handlers
+        self.propagate = propagate
+
+
+_state: Optional[_State] = None
+
+
+def start_async(
+    handlers: Optional[Sequence[logging.Handler]] = None,
+    maxsize: int = 10_000,
+    policy: str = "drop",
+) -> BoundedQueueHandler:
+    """
+    Route `pdlog` records through a bounded queue to handlers on a background thread.
+
+    `handlers` default to those of the `pdlog` logger or, if it has none, of the root
+    logger, in which case `pdlog` records stop propagating to the root logger. When
+    the queue holds `maxsize` records, new records are dropped (and counted) with
+    the "drop" `policy`, or the caller waits for space with the "block" policy.
+
+    Call `flush` to wait until all queued records are handled, and `stop_async` to
+    shut down the background thread and restore the original handlers.
+    """
+    global _state
+    if _state is not None:
+        raise RuntimeError("pdlog is already logging asynchronously")
+    records: "queue.Queue[Any]" = queue.Queue(maxsize)
+    queue_handler = BoundedQueueHandler(records, policy)
+    own_handlers = list(logger.handlers)
+    propagate = logger.propagate
+    if handlers is None:
+        handlers = own_handlers or list(logging.getLogger().handlers)
+    if not own_handlers:
+        logger.propagate = False
+    for handler in own_handlers:
+        logger.removeHandler(handler)
+
+    listener = _Listener(records, *handlers, respect_handler_level=True)
+    logger.addHandler(queue_handler)
+    listener.start()
+    _state = _State(records, queue_handler, listener, own_handlers, propagate)
+    return queue_handler
+
+
+def flush() -> None:
+    """Wait until every queued record has been handled."""
+    if _state is not None:
+        _state.queue.join()
+
+
+def stop_async() -> None:
+    """
+    Handle the remaining queued records, stop the background thread, and restore
+    the `pdlog` logger's original handlers.
+
+    If any records were dropped because the queue was full, a warning is logged.
+    """
+    global _state
+    if _state is None:
+        return
+    state, _state = _state, None
+    state.listener.stop()
+    logger.removeHandler(state.handler)
+    for handler in state.handlers:
+        logger.addHandler(handler)
+    logger.propagate = state.propagate
+    if state.handler.dropped:
+        logger.warning("dropped %s records, the queue was full", state.handler.dropped)
+
+
+class WorkerQueueHandler(QueueHandler):
+    """
+    Send records to a queue shared with the parent process, see `init_worker`.
+
+    Messages are formatted and lazy payload fields evaluated before records are
+    enqueued, so that they can be pickled.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = super().prepare(record)
+        payload = getattr(record, "pdlog", None)
+        if payload is not None:
+            record.pdlog = {  # type: ignore
+                k: v.value() if isinstance(v, Lazy) else v for k, v in payload.items()
+            }
+        return record
+
+
+def init_worker(queue: Any, level: int = logging.INFO) -> None:
+    """
+    Send the records of the `pdlog` logger of a worker process to `queue`.
+
+    Pass it as the `initializer` of a process pool, with a queue shared with the
+    parent process, e.g. from `multiprocessing.Manager().Queue()`, and handle the
+    records in the parent with `merging`. Worker processes then don't write to any
+    handler themselves.
+    """
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logger.addHandler(WorkerQueueHandler(queue))
+    logger.setLevel(level)
+    logger.propagate = False
+
+
+class MergingHandler(logging.Handler):
+    """
+    Merge the records of `pdlog` operations into `collector`, handling other records,
+    and records above INFO, with the `pdlog` logger, see `merging`.
+    """
+
+    def __init__(self, collector: StreamCollector):
+        super().__init__()
+        self.collector = collector
+
+    def emit(self, record: logging.LogRecord) -> None:
+        payload = getattr(record, "pdlog", {})
+        merged = "function" in payload
+        if merged:
+            self.collector.collect(payload)
+        if not merged or record.levelno > logging.INFO:
+            logger.handle(record)
+
+
+@contextmanager
+def merging(
+    queue: Any, name: str = "merged", level: int = logging.INFO
+) -> Iterator[StreamCollector]:
+    """
+    Handle the records sent by worker processes to `queue`, see `init_worker`.
+
+    Records of `pdlog` operations are merged: on exit, a single summary per function
+    is logged at `level`, with totals and percentages over all partitions. Other
+    records, and records above INFO such as CRITICAL ones, are also handled by the
+    `pdlog` logger of this process as they arrive. Exit once the workers are done,
+    e.g. after shutting down the pool.
+    """
+    collector = StreamCollector(name, unit="partition")
+    listener = QueueListener(queue, MergingHandler(collector))
+    listener.start()
+    try:
+        yield collector
+    finally:
+        listener.stop()
+        collector.log(level, {"merged": name})
@@ -1,11 +1,42 @@
+import inspect
 import logging
+from abc import ABC
+from abc import abstractmethod
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from functools import partial
+from operator import attrgetter
 from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Tuple
 
+import numpy as np
 import pandas as pd
 
+from . import audit
+from .config import get_option
+from .stats import count_changed
+from .stats import count_na
+from .stats import count_value_changes
+from .stats import estimate
+from .stats import sample_positions
+from .string import Lazy
+from .string import approximately
+from .string import nbytes
 from .string import percent
 from .string import plural
+from .string import prettify
+from .string import sampled
 from .string import summarize
+from .string import summarize_counts
 
 
 logger = logging.getLogger("pdlog")
@@ -14,12 +45,411 @@ logger = logging.getLogger("pdlog")
 ROW = "row"
 COLUMN = "column"
 OBSERVATION = "observation"
+GROUP = "group"
 
 
 def _callattr(obj: Any, name: str, *args: Any, **kwargs: Any) -> Any:
+    if name.endswith("[]"):
+        # indexing, e.g. "loc[]" for `obj.loc[key]`
+        return getattr(obj, name[:-2])[args[0]]
+    if "." in name:
+        # a method or property of an accessor, e.g. "str.lower" or "dt.year"
+        attribute = attrgetter(name)(obj)
+        return attribute(*args, **kwargs) if callable(attribute) else attribute
     return getattr(obj, name)(*args, **kwargs)
 
 
+def _memory_usage(obj: Any, deep: bool = False) -> int:
+    if isinstance(obj, list):
+        return sum(_memory_usage(o, deep) for o in obj)
+    if not hasattr(obj, "memory_usage"):
+        return 0
+    return int(np.sum(obj.memory_usage(deep=deep)))
+
+
+def _shape(obj: Any) -> Tuple[int, int]:
+    if isinstance(obj, list):
+        # the inputs of `concat`, stacked along the rows
+        shapes = [_shape(o) for o in obj]
+        return sum(s[0] for s in shapes), max((s[1] for s in shapes), default=0)
+    ndim = getattr(obj, "ndim", 0)
+    if ndim == 2:
+        n_rows, n_cols = obj.shape
+        return n_rows, n_cols
+    # a scalar, e.g. selected with `loc`, counts as a single value
+    return (len(obj), 1) if ndim == 1 else (1, 1)
+
+
+def _columns(obj: Any) -> pd.Index:
+    """Return the columns of a frame, or the name of a series as its only column."""
+    if obj.ndim == 2:
+        return obj.columns
+    return pd.Index([] if obj.name is None else [obj.name])
+
+
+def _call(
+    df: pd.DataFrame, function_name: str, *args: Any, **kwargs: Any
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    Call a method on `df`, returning the result and a structured payload about it.
+
+    The payload is attached to the log record of every logging function as the
+    `pdlog` attribute, with numeric fields that don't need to be parsed out of
+    the message. Logging functions add their own fields to it.
+    """
+    return _measure(
+        df, function_name, partial(_callattr, df, function_name, *args, **kwargs)
+    )
+
+
+def _payload(
+    function_name: str, shape_before: Tuple[int, int], shape_after: Tuple[int, int]
+) -> Dict[str, Any]:
+    return {
+        "function": function_name,
+        "rows_before": shape_before[0],
+        "rows_after": shape_after[0],
+        "cols_before": shape_before[1],
+        "cols_after": shape_after[1],
+    }
+
+
+def _measure(
+    df: pd.DataFrame, function_name: str, fn: Callable[[], Any]
+) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Call `fn`, an operation on `df`, returning its result and a payload, see `_call`.
+
+    With the "profile" option set, the payload also holds the CPU time and the
+    shallow memory usage of the data before and after the call, and with the
+    "profile_tracemalloc" option, the peak memory allocated during the call.
+    """
+    profile = get_option("profile")
+    trace = profile and get_option("profile_tracemalloc")
+    rows_before, cols_before = _shape(df)
+    if profile:
+        memory_before = _cached(df, "memory", partial(_memory_usage, df))
+    if trace:
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        elif hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        traced_before = tracemalloc.get_traced_memory()[0]
+    if profile:
+        cpu_start = time.process_time()
+    start = time.perf_counter()
+
+    try:
+        result = fn()
+        elapsed = time.perf_counter() - start
+        if profile:
+            cpu_time = time.process_time() - cpu_start
+        if trace:
+            memory_peak = tracemalloc.get_traced_memory()[1] - traced_before
+    finally:
+        if trace and started_tracing:
+            tracemalloc.stop()
+
+    payload = _payload(function_name, (rows_before, cols_before), _shape(result))
+    payload["elapsed"] = elapsed
+    if trace:
+        payload["memory_peak"] = memory_peak
+    if profile:
+        memory_after = _memory_usage(result)
+        _remember(result, "memory", memory_after)
+        payload["cpu_time"] = cpu_time
+        payload["memory_before"] = memory_before
+        payload["memory_after"] = memory_after
+        payload["memory_delta"] = memory_after - memory_before
+    return result, payload
+
+
+def _profile(payload: Dict[str, Any]) -> str:
+    profile = (
+        f"{payload['elapsed']:.3f}s wall, {payload['cpu_time']:.3f}s cpu, "
+        f"memory {nbytes(payload['memory_delta'], sign=True)}"
+    )
+    if "memory_peak" in payload:
+        profile += f", peak {nbytes(payload['memory_peak'])}"
+    return profile
+
+
+class Collector(ABC):
+    """
+    Receives the payload of every record logged by `pdlog` while registered.
+
+    Register a collector with `collecting`. If any registered collector is `quiet`,
+    INFO records aren't emitted, only collected.
+    """
+
+    quiet = False
+
+    @abstractmethod
+    def collect(self, payload: Dict[str, Any]) -> None:
+        """Receive the payload of a record."""
+
+
+# Collectors and stats caches are context-local, so that threads and asyncio tasks
+# (which each run in their own context) don't collect each other's operations
+_collectors: ContextVar[Tuple[Collector, ...]] = ContextVar(
+    "pdlog_collectors", default=()
+)
+
+
+@contextmanager
+def collecting(
+    collector: Optional[Collector], exclusive: bool = False
+) -> Iterator[Optional[Collector]]:
+    """
+    Register `collector` within a `with` block.
+
+    If `exclusive`, the collectors of enclosing blocks don't receive the payloads
+    logged within it, e.g. as `collector` logs a summary of them for them to collect.
+    Without a `collector`, nothing is collected within the block.
+    """
+    outer = _collectors.get()
+    if exclusive:
+        _collectors.set(() if collector is None else (collector,))
+    else:
+        _collectors.set(outer if collector is None else outer + (collector,))
+    try:
+        yield collector
+    finally:
+        if exclusive:
+            _collectors.set(outer)
+        else:
+            # not reset with a token: a `pdlog.stream` may be closed after an
+            # enclosing block exits
+            _collectors.set(tuple(c for c in _collectors.get() if c is not collector))
+
+
+class _StatsCache:
+    """Statistics of the result of the last logged operation, see `caching`."""
+
+    def __init__(self) -> None:
+        self.frame: Any = None
+        self.stats: Dict[str, Any] = {}
+
+
+_cache: ContextVar[Optional[_StatsCache]] = ContextVar("pdlog_cache", default=None)
+
+
+@contextmanager
+def caching() -> Iterator[None]:
+    """
+    Reuse the statistics computed on the result of a logged operation, such as its
+    missing values, when it's the input of the next logged operation.
+
+    The result mustn't be modified in between, which `pdlog.pipeline` guarantees.
+    """
+    token = _cache.set(_StatsCache())
+    try:
+        yield
+    finally:
+        _cache.reset(token)
+
+
+def _cached(df: Any, name: str, compute: Callable[[], Any]) -> Any:
+    cache = _cache.get()
+    if cache is not None and cache.frame is df and name in cache.stats:
+        return cache.stats[name]
+    return compute()
+
+
+def _remember(df: Any, name: str, value: Any) -> None:
+    cache = _cache.get()
+    if cache is not None:
+        if cache.frame is not df:
+            cache.frame = df
+            cache.stats = {}
+        cache.stats[name] = value
+
+
+_tags: ContextVar[Mapping[str, Any]] = ContextVar("pdlog_tags", default={})
+
+
+@contextmanager
+def context(**tags: Any) -> Iterator[None]:
+    """
+    Tag the records logged within a `with` block, e.g. with the partition or task
+    they come from.
+
+    Tags are added to the structured payload as "context", and prefixed to messages.
+    They are context-local, so each thread or asyncio task can use its own, and
+    nested blocks add to the tags of enclosing ones.
+
+    >>> import pandas as pd
+    >>> with context(partition=3):
+    ...     _ = pd.DataFrame({"x": [1, None]}).log.dropna()  # [partition=3] dropna: ...
+    """
+    token = _tags.set({**_tags.get(), **tags})
+    try:
+        yield
+    finally:
+        _tags.reset(token)
+
+
+def _format_tags(tags: Mapping[str, Any]) -> str:
+    return ", ".join(f"{name}={value}" for name, value in tags.items())
+
+
+def _log(level: int, payload: Dict[str, Any], msg: str, *args: Any) -> None:
+    tags = _tags.get()
+    if tags:
+        payload["context"] = tags
+        msg = "[%s] " + msg
+        args = (Lazy(_format_tags, tags),) + args
+    collectors = _collectors.get()
+    for collector in collectors:
+        collector.collect(payload)
+    if level <= logging.INFO and any(collector.quiet for collector in collectors):
+        return
+    if "cpu_time" in payload:
+        msg += " [%s]"
+        args += (Lazy(_profile, payload),)
+    logger.log(level, msg, *args, extra={"pdlog": payload})
+
+
+def _enabled() -> bool:
+    """
+    Return whether `pdlog` would emit an INFO message or any collector is registered.
+
+    Every logging function checks this once up front and, if it is false, falls
+    straight through to the wrapped pandas call without computing diagnostics.
+    """
+    return bool(_collectors.get()) or logger.isEnabledFor(logging.INFO)
+
+
+def _dropped(before: pd.Index, after: pd.Index) -> List[Any]:
+    return before.difference(after).tolist()
+
+
+def _dropped_rows(function_name: str, before: pd.Index, after: pd.Index) -> pd.Index:
+    """Return the labels of `before` that aren't in `after`, the filtered index."""
+    if isinstance(before, pd.RangeIndex) and isinstance(after, pd.RangeIndex):
+        return before.difference(after)
+    return before[audit._positions(function_name, before, after)]
+
+
+def _ends(n_items: int, n: int) -> List[Optional[int]]:
+    """Return the positions of the first and last `n` of `n_items`, `None` between."""
+    if n_items <= 2 * n:
+        return list(range(n_items))
+    return [*range(n), None, *range(n_items - n, n_items)]
+
+
+def _summarize_rows(before: pd.Index, dropped: pd.Index, n: int) -> str:
+    """
+    Summarize the first and last `n` `dropped` labels, or runs of consecutive labels
+    such as `0:100` if `before` is a `RangeIndex`.
+    """
+    items: List[str] = []
+    if isinstance(before, pd.RangeIndex) and before.step == 1:
+        if isinstance(dropped, pd.RangeIndex) and dropped.step == 1:
+            starts, stops = np.array([dropped.start]), np.array([dropped.stop])
+        else:
+            values = dropped.to_numpy()
+            breaks = np.flatnonzero(np.diff(values) != 1)
+            starts = values[np.r_[0, breaks + 1]]
+            stops = values[np.r_[breaks, len(values) - 1]] + 1
+        for i in _ends(len(starts), n):
+            if i is None:
+                items.append("...")
+            elif stops[i] - starts[i] == 1:
+                items.append(str(starts[i]))
+            else:
+                items.append(f"{starts[i]}:{stops[i]}")
+    else:
+        for i in _ends(len(dropped), n):
+            items.append("..." if i is None else repr(prettify(dropped[i])))
+    return "[" + ", ".join(items) + "]"
+
+
+def _repeated(before: pd.Index, after: pd.Index) -> bool:
+    return bool(before.is_unique and not after.is_unique)
+
+
+def _is_filter(
+    function_name: str,
+    before: Any,
+    after: Any,
+    n_rows_dropped: int,
+    n_cols_dropped: int,
+) -> bool:
+    """
+    Return whether `after` only keeps rows and columns of `before`, like a filter.
+
+    Methods adding rows or columns raise, but indexers such as `loc[]` may select
+    rows or columns several times, e.g. `df.loc[[0, 0, 1]]`.
+    """
+    if function_name.endswith("[]"):
+        if n_rows_dropped < 0 or n_cols_dropped < 0:
+            return False
+        if _repeated(before.index, after.index):
+            return False
+        return before.ndim == 1 or not _repeated(before.columns, after.columns)
+    if n_rows_dropped < 0:
+        raise AssertionError(
+            f"function: {function_name} added rows, it is not a valid filter operation"
+        )
+    if n_cols_dropped < 0:
+        raise AssertionError(
+            f"function: {function_name} added columns, "
+            "it is not a valid filter operation"
+        )
+    return True
+
+
+def _check_filter_quietly(before: Any, after: Any, function_name: str) -> None:
+    """
+    Check the result of a filter with the logger disabled, only auditing its dropped
+    rows and logging if it dropped all rows, whatever the logging level.
+
+    Uses the lengths of the index and columns rather than building a payload, which
+    is only needed by these rare cases.
+    """
+    n_rows_before, n_rows_after = len(before), len(after)
+    n_rows_dropped = n_rows_before - n_rows_after
+    n_cols_dropped = 0 if before.ndim == 1 else len(before.columns) - len(after.columns)
+    if n_rows_dropped <= 0 or (n_rows_after and get_option("audit_path") is None):
+        if n_rows_dropped < 0 or n_cols_dropped < 0:
+            # raises unless an indexer selected rows or columns several times
+            _is_filter(function_name, before, after, n_rows_dropped, n_cols_dropped)
+        return
+    if not _is_filter(function_name, before, after, n_rows_dropped, n_cols_dropped):
+        return
+    payload = _payload(function_name, _shape(before), _shape(after))
+    if get_option("audit_path") is not None:
+        path = audit.spill(before, after, function_name)
+        payload["audit_file"] = None if path is None else str(path)
+    if n_rows_after == 0:
+        _log_dropped_all(payload, function_name, _columns(before), _columns(after))
+
+
+def _log_dropped_all(
+    payload: Dict[str, Any],
+    function_name: str,
+    before_columns: pd.Index,
+    after_columns: pd.Index,
+) -> None:
+    """Log that a filter dropped all rows, along with the columns it dropped."""
+    n_cols_dropped = len(before_columns) - len(after_columns)
+    if n_cols_dropped <= 0:
+        _log(logging.CRITICAL, payload, "%s: dropped all rows", function_name)
+        return
+    payload["dropped_columns"] = Lazy(_dropped, before_columns, after_columns)
+    _log(
+        logging.CRITICAL,
+        payload,
+        "%s: dropped %s (%s): %s and all rows",
+        function_name,
+        Lazy(plural, n_cols_dropped, COLUMN),
+        Lazy(percent, n_cols_dropped, len(before_columns)),
+        payload["dropped_columns"],
+    )
+
+
 def log_filter(
     df: pd.DataFrame, function_name: str, *args: Any, **kwargs: Any
 ) -> pd.DataFrame:
@@ -27,71 +457,145 @@ def log_filter(
     Perform a filter operation with logging.
 
     Filter operations are those which drop rows and/or columns, for example,
-    `pd.DataFrame.loc`.
+    `pd.DataFrame.loc`. Results with fewer dimensions, such as a single column
+    selected with `loc`, aren't logged, and indexers selecting rows or columns
+    several times only log the change in shape.
 
     Although some methods, like `pd.DataFrame.set_index`, can be considered filter
     operations, `log_filter` doesn't cater to their use-case thus they have their own
     specific logging functions.
+
+    With the "audit_path" option, dropped rows are also written to an audit trail,
+    see `pdlog.audit`. Filters called with `ignore_index=True` are called without it
+    and the index of their result is reset afterwards, since the labels of the index
+    identify the dropped rows.
     """
-    n_rows_before = df.shape[0]
-    n_cols_before = df.shape[1]
-    before_columns = df.columns
+    if not kwargs.get("ignore_index"):
+        return _log_filter(df, function_name, *args, **kwargs)
+    kwargs["ignore_index"] = False
+    result = _log_filter(df, function_name, *args, **kwargs)
+    if result is df:
+        result = result.copy(deep=False)
+    result.index = pd.RangeIndex(len(result))
+    return result
+
+
+def _log_filter(
+    df: pd.DataFrame, function_name: str, *args: Any, **kwargs: Any
+) -> pd.DataFrame:
+    before = df
+    ndim = df.ndim
+
+    if not _enabled():
+        df = _callattr(df, function_name, *args, **kwargs)
+        if getattr(df, "ndim", 0) == ndim:
+            _check_filter_quietly(before, df, function_name)
+        return df
+
+    df, payload = _call(df, function_name, *args, **kwargs)
 
-    df = _callattr(df, function_name, *args, **kwargs)
+    if getattr(df, "ndim", 0) != ndim:
+        # e.g. a single column, row or value selected with `loc`, not a filter
+        return df
 
-    n_rows_after = df.shape[0]
+    n_rows_before = payload["rows_before"]
+    n_rows_after = payload["rows_after"]
     n_rows_dropped = n_rows_before - n_rows_after
 
-    n_cols_after = df.shape[1]
+    n_cols_before = payload["cols_before"]
+    n_cols_after = payload["cols_after"]
     n_cols_dropped = n_cols_before - n_cols_after
 
-    if n_rows_dropped < 0:
-        raise AssertionError(
-            f"function: {function_name} added rows, it is not a valid filter operation"
-        )
-    if n_cols_dropped < 0:
-        raise AssertionError(
-            f"function: {function_name} added columns, "
-            "it is not a valid filter operation"
+    if not _is_filter(function_name, before, df, n_rows_dropped, n_cols_dropped):
+        # e.g. rows selected several times with `loc`
+        _log(
+            logging.INFO,
+            payload,
+            "%s: %s to %s, %s to %s",
+            function_name,
+            Lazy(plural, n_rows_before, ROW),
+            Lazy(plural, n_rows_after, ROW),
+            Lazy(plural, n_cols_before, COLUMN),
+            Lazy(plural, n_cols_after, COLUMN),
         )
+        return df
 
     dropped_rows = n_rows_dropped > 0
     dropped_cols = n_cols_dropped > 0
+    before_columns = _columns(before)
+    payload["dropped_columns"] = (
+        Lazy(_dropped, before_columns, _columns(df)) if dropped_cols else []
+    )
 
-    if n_rows_before == 0:
-        logger.info("%s: empty input dataframe", function_name)
+    if dropped_rows and get_option("audit_path") is not None:
+        # kept whatever the logging level, as an audit trail
+        path = audit.spill(before, df, function_name)
+        payload["audit_file"] = None if path is None else str(path)
+    # don't keep the input alive while logging, only its index
+    before_index = before.index
+    del before
+
+    # "dropped 2 columns (50%): ['y', 'z']", when columns were dropped
+    cols_msg = "%s (%s): %s"
+    cols_args = (
+        Lazy(plural, n_cols_dropped, COLUMN),
+        Lazy(percent, n_cols_dropped, n_cols_before),
+        payload["dropped_columns"],
+    )
+
+    # "dropped 3 rows (50%)", followed by their labels with the "dropped_labels"
+    # option
+    rows_msg = "%s (%s)"
+    rows_args: Tuple[Any, ...] = (
+        Lazy(plural, n_rows_dropped, ROW),
+        Lazy(percent, n_rows_dropped, n_rows_before),
+    )
+    n_labels = get_option("dropped_labels")
+    if n_labels and dropped_rows:
+        dropped_labels = Lazy(_dropped_rows, function_name, before_index, df.index)
+        payload["dropped_rows"] = Lazy(
+            _summarize_rows, before_index, dropped_labels, n_labels
+        )
+        rows_msg += ": %s"
+        rows_args += (payload["dropped_rows"],)
+
+    if n_rows_before == 0 and dropped_cols:
+        _log(
+            logging.INFO,
+            payload,
+            f"%s: empty input dataframe, dropped {cols_msg}",
+            function_name,
+            *cols_args,
+        )
+    elif n_rows_before == 0:
+        _log(logging.INFO, payload, "%s: empty input dataframe", function_name)
     elif n_rows_after == 0:
-        logger.critical("%s: dropped all rows", function_name)
+        _log_dropped_all(payload, function_name, before_columns, _columns(df))
     elif dropped_cols and dropped_rows:
-        dropped_cols = before_columns.difference(df.columns).tolist()
-        logger.info(
-            "%s: dropped %s (%s) and %s (%s), %s remaining",
+        _log(
+            logging.INFO,
+            payload,
+            f"%s: dropped {cols_msg} and {rows_msg}, %s remaining",
             function_name,
-            plural(n_cols_dropped, COLUMN),
-            percent(n_cols_dropped, n_cols_before),
-            plural(n_rows_dropped, ROW),
-            percent(n_rows_dropped, n_rows_before),
-            plural(n_rows_after, ROW),
+            *cols_args,
+            *rows_args,
+            Lazy(plural, n_rows_after, ROW),
         )
     elif dropped_cols:
-        dropped_cols = before_columns.difference(df.columns).tolist()
-        logger.info(
-            "%s: dropped %s (%s): %s",
-            function_name,
-            plural(n_cols_dropped, COLUMN),
-            percent(n_cols_dropped, n_cols_before),
-            dropped_cols,
+        _log(
+            logging.INFO, payload, f"%s: dropped {cols_msg}", function_name, *cols_args
         )
     elif dropped_rows:
-        logger.info(
-            "%s: dropped %s (%s), %s remaining",
+        _log(
+            logging.INFO,
+            payload,
+            f"%s: dropped {rows_msg}, %s remaining",
             function_name,
-            plural(n_rows_dropped, ROW),
-            percent(n_rows_dropped, n_rows_before),
-            plural(n_rows_after, ROW),
+            *rows_args,
+            Lazy(plural, n_rows_after, ROW),
         )
     else:
-        logger.info("%s: dropped no rows", function_name)
+        _log(logging.INFO, payload, "%s: dropped no rows", function_name)
 
     return df
 
@@ -99,67 +603,148 @@ def log_filter(
 def log_change_index(
     df: pd.DataFrame, function_name: str, *args: Any, **kwargs: Any
 ) -> pd.DataFrame:
+    if not _enabled():
+        return _callattr(df, function_name, *args, **kwargs)
 
-    before_index = summarize(df.index, 3)
+    before_index = df.index
     before_index_name = df.index.name
     before_index_type = type(df.index).__name__
 
-    df = _callattr(df, function_name, *args, **kwargs)
+    df, payload = _call(df, function_name, *args, **kwargs)
 
-    after_index = summarize(df.index, 3)
+    after_index = df.index
     after_index_name = df.index.name
     after_index_type = type(df.index).__name__
+    payload["index_before"] = before_index_name
+    payload["index_after"] = after_index_name
 
-    logger.info(
+    _log(
+        logging.INFO,
+        payload,
         "%s: set from '%s' (%s): %s to '%s' (%s): %s",
         function_name,
         before_index_name,
         before_index_type,
-        before_index,
+        Lazy(summarize, before_index, 3),
         after_index_name,
         after_index_type,
-        after_index,
+        Lazy(summarize, after_index, 3),
     )
 
     return df
 
 
+def _rename_mappers(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Tuple[Any, Any]:
+    """Return the `(index, columns)` mappers passed to `pd.DataFrame.rename`."""
+    index = kwargs.get("index")
+    columns = kwargs.get("columns")
+    mapper = args[0] if args else kwargs.get("mapper")
+    if mapper is not None:
+        if kwargs.get("axis", 0) in (0, "index", "rows"):
+            index = mapper
+        else:
+            columns = mapper
+    return index, columns
+
+
+def _renamed(before: pd.Index, after: pd.Index, mapper: Any) -> pd.Index:
+    """
+    Return the unique labels in `after` that aren't in `before`, in order.
+
+    This is equivalent to `after.difference(before)` without sorting, avoiding any
+    work proportional to the length of the index where possible:
+
+    - An index sharing its data with `before` has nothing renamed.
+    - With a dict-like mapper, only the positions of its keys are checked, using
+      the hash table pandas caches on unique indexes.
+    - Otherwise, falls back to a vectorized hash-based membership test.
+    """
+    if after.is_(before):
+        return after[:0]
+    if (
+        isinstance(mapper, Mapping)
+        and len(after) == len(before)
+        and not isinstance(before, pd.MultiIndex)
+        and before.is_unique
+    ):
+        positions = before.get_indexer(list(mapper))
+        candidates = after.take(positions[positions >= 0])
+        return candidates[before.get_indexer(candidates) < 0].unique()
+    if len(after) == len(before) and after.equals(before):
+        return after[:0]
+    return after[~after.isin(before)].unique()
+
+
 def log_rename(
     df: pd.DataFrame, function_name: str, *args: Any, **kwargs: Any
 ) -> pd.DataFrame:
+    """
+    Perform a rename operation with logging.
+
+    Renamed labels are those in the result that weren't in the input, see
+    `_renamed`. In approximate mode, renamed rows are estimated by comparing labels
+    at a sample of positions before and after the call. Renamed columns are always
+    exact.
+    """
+    if not _enabled():
+        return _callattr(df, function_name, *args, **kwargs)
 
     before_index = df.index
     before_columns = df.columns
+    positions = sample_positions(len(before_index))
 
-    df = _callattr(df, function_name, *args, **kwargs)
+    df, payload = _call(df, function_name, *args, **kwargs)
 
-    new_columns = df.columns.difference(before_columns).tolist()
-    new_rows = df.index.difference(before_index).tolist()
-    if new_columns and new_rows:
-        logger.info(
-            "%s: renamed %s and %s. rows: %s. columns: %s",
+    index_mapper, columns_mapper = _rename_mappers(args, kwargs)
+    new_columns = _renamed(before_columns, df.columns, columns_mapper)
+    if positions is not None and len(df.index) == len(before_index):
+        sample = df.index.take(positions)
+        new_rows = sample[sample != before_index.take(positions)]
+        n_rows, margin = estimate(len(new_rows), len(positions), len(before_index))
+        rows_renamed = Lazy(approximately, n_rows, margin, ROW)
+        note: Any = Lazy(sampled, len(positions), len(before_index))
+    else:
+        new_rows = _renamed(before_index, df.index, index_mapper)
+        n_rows = len(new_rows)
+        rows_renamed = Lazy(plural, n_rows, ROW)
+        note = ""
+    payload["approximate"] = positions is not None
+    payload["renamed_rows"] = n_rows
+    payload["renamed_columns"] = len(new_columns)
+
+    if len(new_columns) and len(new_rows):
+        _log(
+            logging.INFO,
+            payload,
+            "%s: renamed %s and %s. rows: %s. columns: %s%s",
             function_name,
-            plural(len(new_rows), ROW),
-            plural(len(new_columns), COLUMN),
-            summarize(new_rows),
-            summarize(new_columns),
+            rows_renamed,
+            Lazy(plural, len(new_columns), COLUMN),
+            Lazy(summarize, new_rows),
+            Lazy(summarize, new_columns),
+            note,
         )
-    elif new_rows:
-        logger.info(
-            "%s: renamed %s: %s",
+    elif len(new_rows):
+        _log(
+            logging.INFO,
+            payload,
+            "%s: renamed %s: %s%s",
             function_name,
-            plural(len(new_rows), ROW),
-            summarize(new_rows),
+            rows_renamed,
+            Lazy(summarize, new_rows),
+            note,
         )
-    elif new_columns:
-        logger.info(
+    elif len(new_columns):
+        _log(
+            logging.INFO,
+            payload,
             "%s: renamed %s: %s",
             function_name,
-            plural(len(new_columns), COLUMN),
-            summarize(new_columns),
+            Lazy(plural, len(new_columns), COLUMN),
+            Lazy(summarize, new_columns),
         )
     else:
-        logger.info("%s: renamed nothing", function_name)
+        _log(logging.INFO, payload, "%s: renamed nothing", function_name)
 
     return df
 
@@ -167,41 +752,729 @@ def log_rename(
 def log_reshape(
     df: pd.DataFrame, function_name: str, *args: Any, **kwargs: Any
 ) -> pd.DataFrame:
+    if not _enabled():
+        return _callattr(df, function_name, *args, **kwargs)
 
     before_shape = df.shape
     before_columns = df.columns
 
-    df = _callattr(df, function_name, *args, **kwargs)
+    df, payload = _call(df, function_name, *args, **kwargs)
 
-    logger.info(
+    _log(
+        logging.INFO,
+        payload,
         "%s: reshaped from %s to %s. old columns: %s. new columns: %s",
         function_name,
         before_shape,
         df.shape,
-        summarize(before_columns, max_items=5),
-        summarize(df.columns, max_items=5),
+        Lazy(summarize, before_columns, 5),
+        Lazy(summarize, _columns(df), 5),
     )
 
     return df
 
 
+def _filled_columns(
+    columns: pd.Index, filled: "np.ndarray[Any, Any]"
+) -> Dict[Any, int]:
+    return {columns[i]: int(filled[i]) for i in np.flatnonzero(filled)}
+
+
 def log_fillna(
     df: pd.DataFrame, function_name: str, *args: Any, **kwargs: Any
 ) -> pd.DataFrame:
+    """
+    Perform a fill operation with logging.
 
+    In approximate mode, missing values are only counted on a sample of rows and the
+    message reports an estimate of the total filled instead of per-column counts.
+    """
+    if not _enabled():
+        return _callattr(df, function_name, *args, **kwargs)
+
+    n_rows, n_cols = _shape(df)
+    n_obs = n_rows * n_cols
+    columns = _columns(df)
+    positions = sample_positions(n_rows)
+    if positions is None:
+        before_na = _cached(df, "na", partial(count_na, df))
+    else:
+        before_na = count_na(df.take(positions))
+
+    df, payload = _call(df, function_name, *args, **kwargs)
+
+    payload["approximate"] = positions is not None
+    if positions is not None:
+        filled = before_na - count_na(df.take(positions))
+        n_filled, margin = estimate(int(filled.sum()), len(positions) * n_cols, n_obs)
+        payload["filled"] = n_filled
+        payload["filled_margin"] = margin
+        _log(
+            logging.INFO,
+            payload,
+            "%s: filled %s (%s)%s",
+            function_name,
+            Lazy(approximately, n_filled, margin, OBSERVATION),
+            Lazy(percent, n_filled, n_obs),
+            Lazy(sampled, len(positions), df.shape[0]),
+        )
+        return df
+
+    after_na = count_na(df)
+    _remember(df, "na", after_na)
+    filled = before_na - after_na
+    n_filled = int(filled.sum())
+    payload["filled"] = n_filled
+    payload["filled_columns"] = Lazy(_filled_columns, columns, filled)
+    if filled.any() and df.ndim == 2:
+        _log(
+            logging.INFO,
+            payload,
+            "%s: filled %s (%s): %s",
+            function_name,
+            Lazy(plural, n_filled, OBSERVATION),
+            Lazy(percent, n_filled, n_obs),
+            Lazy(summarize_counts, payload["filled_columns"]),
+        )
+    else:
+        _log(
+            logging.INFO,
+            payload,
+            "%s: filled %s (%s)",
+            function_name,
+            Lazy(plural, n_filled, OBSERVATION),
+            Lazy(percent, n_filled, n_obs),
+        )
+
+    return df
+
+
+def log_replace(
+    df: pd.DataFrame, function_name: str, *args: Any, **kwargs: Any
+) -> pd.DataFrame:
+    """
+    Perform an operation replacing values with logging, e.g. `where` or `clip`.
+
+    Values are compared column chunk by column chunk, values missing both before
+    and after don't count as replaced.
+    """
+    if not _enabled():
+        return _callattr(df, function_name, *args, **kwargs)
+
+    before = df
+
+    df, payload = _call(df, function_name, *args, **kwargs)
+
+    if df.shape != before.shape:
+        raise AssertionError(
+            f"function: {function_name} changed the shape, "
+            "it is not a valid replace operation"
+        )
     n_obs = df.shape[0] * df.shape[1]
-    before_na = df.isna()
+    changed = count_changed(before, df)
+    n_changed = int(changed.sum())
+    payload["replaced"] = n_changed
+    payload["replaced_columns"] = Lazy(_filled_columns, before.columns, changed)
+    msg = "%s: replaced %s (%s)"
+    msg_args = [
+        function_name,
+        Lazy(plural, n_changed, OBSERVATION),
+        Lazy(percent, n_changed, n_obs),
+    ]
+    if n_changed:
+        msg += ": %s"
+        msg_args.append(Lazy(summarize_counts, payload["replaced_columns"]))
+    _log(logging.INFO, payload, msg, *msg_args)
+
+    return df
+
+
+def _converted_columns(
+    df: pd.DataFrame, function_name: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> "Optional[np.ndarray[Any, Any]]":
+    """
+    Return the positions of the existing columns a conversion applies to, or `None`
+    for all. Positions rather than labels, which may be duplicated.
+    """
+    if function_name == "assign":
+        keys = list(kwargs)
+    elif function_name == "astype":
+        dtype = args[0] if args else kwargs.get("dtype")
+        if not isinstance(dtype, Mapping):
+            return None
+        keys = list(dtype)
+    else:
+        return None
+    return np.flatnonzero(df.columns.isin(keys))
+
+
+def _dtype_changes(
+    before: List[Tuple[Any, Any]], after: List[Tuple[Any, Any]]
+) -> Tuple[Dict[Any, str], Dict[Any, str]]:
+    """Return the dtype transitions of existing columns, and the dtypes of new ones."""
+    n = len(before)
+    if [label for label, _ in after[:n]] == [label for label, _ in before]:
+        # columns kept in place, compared by position as labels may be duplicated
+        pairs = [(label, old, new) for (label, old), (_, new) in zip(before, after)]
+        new_columns = after[n:]
+    else:
+        before_dtypes = dict(before)
+        pairs = [(c, before_dtypes[c], d) for c, d in after if c in before_dtypes]
+        new_columns = [(c, d) for c, d in after if c not in before_dtypes]
+    changed = {label: f"{old} -> {new}" for label, old, new in pairs if old != new}
+    added = {label: str(dtype) for label, dtype in new_columns}
+    return changed, added
+
+
+def _count_na_columns(
+    df: pd.DataFrame, positions: "np.ndarray[Any, Any]"
+) -> "np.ndarray[Any, Any]":
+    return np.array([df.iloc[:, i].isna().sum() for i in positions], dtype=np.int64)
 
-    df = _callattr(df, function_name, *args, **kwargs)
 
-    filled_na = df.notna() & before_na
-    n_filled = filled_na.sum().sum()
+def log_change_dtype(
+    df: pd.DataFrame, function_name: str, *args: Any, **kwargs: Any
+) -> pd.DataFrame:
+    """
+    Perform a type conversion with logging, e.g. `astype` or `assign`.
+
+    Reports the dtype transition of each converted column, the new columns and
+    their dtypes, the values coerced to NA and the memory usage before and after.
+    Memory usage is shallow unless the "memory_deep" option is set, since the deep
+    memory usage of object columns takes a pass over every value.
+    """
+    if not _enabled():
+        return _callattr(df, function_name, *args, **kwargs)
+
+    deep = get_option("memory_deep")
+    before_dtypes = _dtypes(df)
+    positions = _converted_columns(df, function_name, args, kwargs)
+    if positions is None:
+        columns = df.columns
+        before_na = _cached(df, "na", partial(count_na, df))
+    else:
+        columns = df.columns[positions]
+        before_na = _count_na_columns(df, positions)
+    memory_before = _memory_usage(df, deep)
+
+    result, payload = _call(df, function_name, *args, **kwargs)
+
+    memory_after = _memory_usage(result, deep)
+    changed, added = _dtype_changes(before_dtypes, _dtypes(result))
+    # converted columns keep their positions, new ones are added after them
+    if positions is None:
+        after_na = count_na(result)
+        if result.columns[: len(columns)].equals(columns):
+            after_na = after_na[: len(columns)]
+        else:
+            after_na = after_na[result.columns.get_indexer(columns)]
+    else:
+        after_na = _count_na_columns(result, positions)
+    coerced = after_na - before_na
+    coerced[coerced < 0] = 0
+    n_coerced = int(coerced.sum())
+    payload.update(
+        {
+            "changed_dtypes": changed,
+            "new_columns": added,
+            "coerced": n_coerced,
+            "coerced_columns": Lazy(_filled_columns, columns, coerced),
+            "memory_before": memory_before,
+            "memory_after": memory_after,
+            "memory_delta": memory_after - memory_before,
+            "memory_deep": deep,
+        }
+    )
+
+    msg = "%s: "
+    msg_args: List[Any] = [function_name]
+    if added:
+        msg += "new columns: %s, "
+        msg_args.append(Lazy(summarize_counts, added, 5))
+    if changed:
+        msg += "changed dtypes: %s, "
+        msg_args.append(Lazy(summarize_counts, changed, 5))
+    elif not added:
+        msg += "no dtype changes, "
+    if n_coerced:
+        msg += "coerced %s to NA: %s, "
+        msg_args.append(Lazy(plural, n_coerced, OBSERVATION))
+        msg_args.append(Lazy(summarize_counts, payload["coerced_columns"], 5))
+    msg += "memory %s -> %s (%s)"
+    msg_args.append(Lazy(nbytes, memory_before))
+    msg_args.append(Lazy(nbytes, memory_after))
+    msg_args.append(Lazy(nbytes, memory_after - memory_before, True))
+
+    _log(logging.INFO, payload, msg, *msg_args)
+
+    return result
+
+
+def _groups_kept(
+    groupby: Any, df: pd.DataFrame, result: Any
+) -> "Optional[np.ndarray[Any, Any]]":
+    """
+    Return whether each group of a `groupby.filter` has rows in `result`, or None if
+    the index of `df` isn't unique, so that its labels don't identify rows.
+
+    Uses the vectorized group number of each row and a hash-based membership test of
+    the index.
+    """
+    if not df.index.is_unique:
+        return None
+    ids = groupby.ngroup().to_numpy()
+    kept = df.index.isin(result.index) & (ids >= 0)
+    return np.bincount(ids[kept].astype(np.int64), minlength=groupby.ngroups) > 0
+
+
+def _group_labels(groupby: Any) -> Optional[pd.Index]:
+    sizes = groupby.size()
+    return sizes.index if isinstance(sizes, pd.Series) else None
+
+
+def _groups_applied(
+    groupby: Any, df: pd.DataFrame, result: Any
+) -> "Optional[np.ndarray[Any, Any]]":
+    """
+    Return whether each group of a `groupby.apply` has rows in `result`, or None if
+    this can't be told from the index of `result`.
+
+    The group keys are the leading levels of the index when `apply` prepends them,
+    otherwise the index of `result` is a subset of the index of `df`.
+    """
+    labels = _group_labels(groupby)
+    index = getattr(result, "index", None)
+    if labels is None or not isinstance(index, pd.Index):
+        return None
+    names = list(labels.names)
+    n_levels = len(names)
+    if None not in names and list(index.names[:n_levels]) == names:
+        if index.nlevels > n_levels:
+            index = index.droplevel(list(range(n_levels, index.nlevels)))
+        return labels.isin(index)
+    if index.isin(df.index).all():
+        return _groups_kept(groupby, df, result)
+    return None
+
+
+def log_groupby(
+    df: pd.DataFrame, groupby: Any, function_name: str, *args: Any, **kwargs: Any
+) -> Any:
+    """
+    Perform an operation on a `groupby` of `df` with logging.
+
+    Supports `agg`, `filter`, `apply` and `transform`, reporting groups and rows in
+    and out, as well as any groups dropped entirely by `filter`, `agg` and `apply`.
+    Group statistics are computed with vectorized `size` and `ngroup` rather than by
+    iterating over groups.
+    """
+    name = f"groupby.{function_name}"
+    call = partial(_callattr, groupby, function_name, *args, **kwargs)
+    if not _enabled():
+        return call()
+
+    result, payload = _measure(df, name, call)
+
+    n_groups = groupby.ngroups
+    n_rows_before = payload["rows_before"]
+    n_rows_after = payload["rows_after"]
+    kept = None
+    if function_name == "filter":
+        kept = _groups_kept(groupby, df, result)
+    elif function_name in ("agg", "aggregate"):
+        labels = _group_labels(groupby)
+        if labels is not None:
+            kept = labels.isin(result.index)
+    elif function_name == "apply":
+        kept = _groups_applied(groupby, df, result)
+    if kept is not None:
+        n_groups_after: Optional[int] = int(kept.sum())
+    elif function_name == "transform":
+        n_groups_after = n_groups
+    else:
+        # unknown, e.g. for a filter of a frame with duplicate index labels
+        n_groups_after = None
+    n_groups_dropped = 0 if n_groups_after is None else n_groups - n_groups_after
+    payload["groups_before"] = n_groups
+    payload["groups_after"] = n_groups_after
+
+    if n_groups_dropped:
+        payload["dropped_groups"] = Lazy(_dropped_groups, groupby, kept)
+    if n_rows_before > 0 and n_rows_after == 0:
+        _log(logging.CRITICAL, payload, "%s: dropped all rows", name)
+    elif n_groups_dropped:
+        _log(
+            logging.INFO,
+            payload,
+            "%s: dropped %s (%s): %s and %s (%s), %s remaining",
+            name,
+            Lazy(plural, n_groups_dropped, GROUP),
+            Lazy(percent, n_groups_dropped, n_groups),
+            Lazy(summarize, payload["dropped_groups"]),
+            Lazy(plural, n_rows_before - n_rows_after, ROW),
+            Lazy(percent, n_rows_before - n_rows_after, n_rows_before),
+            Lazy(plural, n_rows_after, ROW),
+        )
+    else:
+        _log(
+            logging.INFO,
+            payload,
+            "%s: %s, %s to %s",
+            name,
+            Lazy(plural, n_groups, GROUP),
+            Lazy(plural, n_rows_before, ROW),
+            Lazy(plural, n_rows_after, ROW),
+        )
 
-    logger.info(
-        "%s: filled %s (%s)",
+    return result
+
+
+def _dropped_groups(groupby: Any, kept: "np.ndarray[Any, Any]") -> Any:
+    labels = _group_labels(groupby)
+    if labels is None:
+        return np.flatnonzero(~kept)
+    return labels[~kept]
+
+
+@lru_cache(maxsize=None)
+def _signature(function_name: str) -> inspect.Signature:
+    return inspect.signature(getattr(pd.DataFrame, function_name))
+
+
+def _key_values(frame: pd.DataFrame, keys: Any) -> List[Any]:
+    if keys is None:
+        return [frame.index.get_level_values(i) for i in range(frame.index.nlevels)]
+    if not isinstance(keys, list):
+        keys = [keys]
+    values = []
+    for key in keys:
+        if isinstance(key, (np.ndarray, pd.Series, pd.Index)):
+            values.append(key)
+        elif key in frame.columns:
+            values.append(frame[key])
+        else:
+            values.append(frame.index.get_level_values(key))
+    return values
+
+
+def _merge_keys(
+    df: pd.DataFrame, function_name: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> Optional[Tuple[List[Any], List[Any]]]:
+    """
+    Return the key values of the left and right sides of a `merge` or `join`.
+
+    Returns `None` if they can't be determined, e.g. when joining a list of frames.
+    """
+    try:
+        params = _signature(function_name).bind(df, *args, **kwargs).arguments
+    except TypeError:
+        return None
+    if function_name == "join":
+        other = params["other"]
+        if not isinstance(other, (pd.DataFrame, pd.Series)):
+            return None
+        on = params.get("on")
+        if on is not None or df.index.nlevels == other.index.nlevels == 1:
+            return _key_values(df, on), _key_values(other, None)
+        # multi-level indexes are joined on the levels they have in common, only
+        # handled if they're all the levels of `other`
+        levels = [name for name in other.index.names if name in df.index.names]
+        if not levels or None in levels or len(levels) != other.index.nlevels:
+            return None
+        return _key_values(df, levels), _key_values(other, levels)
+
+    right = params["right"]
+    if isinstance(right, pd.Series):
+        right = right.to_frame()
+    if params.get("how") == "cross":
+        return None
+    on = params.get("on")
+    left_on = params.get("left_on")
+    right_on = params.get("right_on")
+    left_index = params.get("left_index", False)
+    right_index = params.get("right_index", False)
+    if not (on is not None or left_on is not None or right_on is not None):
+        if not (left_index or right_index):
+            on = df.columns.intersection(right.columns).tolist()
+    left = _key_values(df, None if left_index else on if left_on is None else left_on)
+    right_keys = None if right_index else on if right_on is None else right_on
+    return left, _key_values(right, right_keys)
+
+
+def _combine_keys(
+    left: List[Any], right: List[Any]
+) -> Tuple["np.ndarray[Any, Any]", "np.ndarray[Any, Any]"]:
+    """Combine multiple key columns into a single integer key per row."""
+    n_left = len(left[0])
+    ids = np.zeros(n_left + len(right[0]), dtype=np.int64)
+    for left_values, right_values in zip(left, right):
+        values = pd.concat(
+            [pd.Series(np.asarray(left_values)), pd.Series(np.asarray(right_values))],
+            ignore_index=True,
+        )
+        codes, uniques = pd.factorize(values)
+        # missing keys get code 0: in `merge`, they match each other
+        ids, _ = pd.factorize(ids * (len(uniques) + 1) + codes + 1)
+    return ids[:n_left], ids[n_left:]
+
+
+def _key_ids(
+    left: List[Any], right: List[Any]
+) -> Tuple["np.ndarray[Any, Any]", "np.ndarray[Any, Any]", int]:
+    """
+    Return integer ids of the left and right keys, which are equal where the keys
+    are, and the number of distinct ids.
+
+    Only the keys of the smaller side are factorized, the keys of the larger side
+    are looked up in their hash table and get -1 where they have no match.
+    """
+    if len(left) > 1:
+        left_keys, right_keys = _combine_keys(left, right)
+    else:
+        left_keys, right_keys = left[0], right[0]
+    swap = len(left_keys) < len(right_keys)
+    small, large = (left_keys, right_keys) if swap else (right_keys, left_keys)
+    small_ids, uniques = pd.factorize(small)
+    large_ids = pd.Index(uniques).get_indexer(large)
+    n_ids = len(uniques)
+    small_na = small_ids < 0
+    if small_na.any():
+        # in `merge`, missing keys match each other
+        small_ids[small_na] = n_ids
+        large_ids[np.asarray(pd.isna(large))] = n_ids
+        n_ids += 1
+    if swap:
+        return small_ids, large_ids, n_ids
+    return large_ids, small_ids, n_ids
+
+
+def log_merge(
+    df: pd.DataFrame, function_name: str, *args: Any, **kwargs: Any
+) -> pd.DataFrame:
+    """
+    Perform a `merge` or `join` operation with logging.
+
+    Reports the rows of each side with and without a match, the extra rows due to
+    duplicate keys, and the resulting rows. Match statistics are computed from the
+    join keys alone, with hash-based vectorized operations (see `_key_ids`) and
+    counts of rows per key.
+    """
+    if not _enabled():
+        return _callattr(df, function_name, *args, **kwargs)
+
+    keys = _merge_keys(df, function_name, args, kwargs)
+
+    result, payload = _call(df, function_name, *args, **kwargs)
+
+    n_rows_after = payload["rows_after"]
+    if keys is None:
+        _log(
+            logging.INFO,
+            payload,
+            "%s: %s to %s",
+            function_name,
+            Lazy(plural, payload["rows_before"], ROW),
+            Lazy(plural, n_rows_after, ROW),
+        )
+        return result
+
+    left_ids, right_ids, n_ids = _key_ids(*keys)
+    left_counts = np.bincount(left_ids[left_ids >= 0], minlength=n_ids)
+    right_counts = np.bincount(right_ids[right_ids >= 0], minlength=n_ids)
+    n_left = len(left_ids)
+    n_right = len(right_ids)
+    n_left_matched = int(left_counts[right_counts > 0].sum())
+    n_right_matched = int(right_counts[left_counts > 0].sum())
+    n_fan_out = int((left_counts * right_counts).sum()) - n_left_matched
+    payload.update(
+        {
+            "left_rows": n_left,
+            "right_rows": n_right,
+            "left_matched": n_left_matched,
+            "right_matched": n_right_matched,
+            "left_only": n_left - n_left_matched,
+            "right_only": n_right - n_right_matched,
+            "fan_out": n_fan_out,
+        }
+    )
+
+    _log(
+        logging.INFO,
+        payload,
+        "%s: matched %s (%s) of left and %s (%s) of right, "
+        "%s left-only and %s right-only, %s from duplicate keys, %s remaining",
         function_name,
-        plural(n_filled, OBSERVATION),
-        percent(n_filled, n_obs),
+        Lazy(plural, n_left_matched, ROW),
+        Lazy(percent, n_left_matched, n_left),
+        Lazy(plural, n_right_matched, ROW),
+        Lazy(percent, n_right_matched, n_right),
+        n_left - n_left_matched,
+        n_right - n_right_matched,
+        Lazy(plural, n_fan_out, ROW),
+        Lazy(plural, n_rows_after, ROW),
     )
 
-    return df
+    return result
+
+
+def _dtypes(obj: Any) -> List[Tuple[Any, Any]]:
+    """Return the (label, dtype) of each column of a frame, or of a series."""
+    if obj.ndim == 2:
+        return list(zip(obj.columns, obj.dtypes))
+    return [(0 if obj.name is None else obj.name, obj.dtype)]
+
+
+def _upcasts(inputs: List[Any], result: Any, axis: int) -> Dict[Any, str]:
+    """
+    Return "before -> after" dtype transitions of the columns of `concat` inputs
+    whose dtype changed in the result, using the dtypes alone.
+    """
+    result_dtypes = _dtypes(result)
+    if axis == 0:
+        after = dict(result_dtypes)
+        transitions = (
+            (label, dtype, result.dtype if result.ndim == 1 else after.get(label))
+            for obj in inputs
+            for label, dtype in _dtypes(obj)
+        )
+    else:
+        # columns are concatenated in order, match them by position
+        before = [item for obj in inputs for item in _dtypes(obj)]
+        transitions = (
+            (label, dtype, after_dtype)
+            for (label, dtype), (_, after_dtype) in zip(before, result_dtypes)
+        )
+    upcasts: Dict[Any, str] = {}
+    for label, dtype, after_dtype in transitions:
+        if after_dtype is not None and dtype != after_dtype and label not in upcasts:
+            upcasts[label] = f"{dtype} -> {after_dtype}"
+    return upcasts
+
+
+def _schema_drift(
+    inputs: List[Any], result: pd.DataFrame
+) -> Tuple[Dict[Any, int], pd.Index]:
+    """
+    Return the rows filled with NA in each column missing from some `concat` inputs,
+    and the columns dropped because they were missing from some inputs.
+    """
+    missing: Dict[Any, int] = {}
+    columns = pd.Index([])
+    for obj in inputs:
+        obj_columns = pd.Index([label for label, _ in _dtypes(obj)])
+        columns = columns.union(obj_columns, sort=False)
+        for column in result.columns.difference(obj_columns, sort=False):
+            missing[column] = missing.get(column, 0) + len(obj)
+    return missing, columns.difference(result.columns, sort=False)
+
+
+def log_concat(objs: Any, *args: Any, **kwargs: Any) -> Any:
+    """
+    Concatenate pandas objects like `pd.concat`, with logging.
+
+    Reports the rows (or columns) contributed by each input, the columns missing
+    from some inputs that were filled with NA (or dropped with `join="inner"`), and
+    the dtypes that were upcast, e.g. int64 -> float64 or category -> object. All of
+    it is derived from the column labels and dtypes, without scanning the data.
+    """
+    if not _enabled():
+        return pd.concat(objs, *args, **kwargs)
+
+    if not isinstance(objs, Mapping):
+        # may be an iterator, consumed by both `pd.concat` and the diagnostics
+        objs = list(objs)
+    values = objs.values() if isinstance(objs, Mapping) else objs
+    inputs = [obj for obj in values if obj is not None]
+    try:
+        params = inspect.signature(pd.concat).bind(objs, *args, **kwargs).arguments
+    except TypeError:
+        params = {}
+    axis = 1 if params.get("axis", 0) in (1, "columns") else 0
+
+    result, payload = _measure(
+        inputs, "concat", partial(pd.concat, objs, *args, **kwargs)
+    )
+
+    if axis == 0:
+        noun, sizes = ROW, [len(obj) for obj in inputs]
+    else:
+        noun, sizes = COLUMN, [_shape(obj)[1] for obj in inputs]
+        payload["rows_before"] = max((len(obj) for obj in inputs), default=0)
+        payload["cols_before"] = sum(sizes)
+    msg = "concat: %s to %s, %ss per input: %s"
+    msg_args = [
+        Lazy(plural, len(inputs), "input"),
+        Lazy(plural, payload["rows_after" if axis == 0 else "cols_after"], noun),
+        noun,
+        Lazy(summarize, sizes, 5),
+    ]
+
+    if axis == 0 and result.ndim == 2:
+        missing, dropped = _schema_drift(inputs, result)
+        payload["missing_columns"] = missing
+        payload["dropped_columns"] = dropped.tolist()
+        if missing:
+            msg += ". columns missing from some inputs, rows filled with NA: %s"
+            msg_args.append(Lazy(summarize_counts, missing, 5))
+        if len(dropped):
+            msg += ". columns missing from some inputs, dropped: %s"
+            msg_args.append(Lazy(summarize, dropped, 5))
+    upcasts = _upcasts(inputs, result, axis)
+    payload["upcasts"] = upcasts
+    if upcasts:
+        msg += ". upcast dtypes: %s"
+        msg_args.append(Lazy(summarize_counts, upcasts, 5))
+
+    _log(logging.INFO, payload, msg, *msg_args)
+
+    return result
+
+
+def log_change_values(
+    series: pd.Series, function_name: str, *args: Any, **kwargs: Any
+) -> Any:
+    """
+    Perform an operation transforming the values of a series with logging, e.g.
+    `map`, `astype` or `str.lower`.
+
+    Reports the values changed, the values coerced to NA and the dtype transition,
+    if any. Results that aren't a series of the same length, such as the frame of
+    `str.split(expand=True)`, are only reported by their shape.
+    """
+    if not _enabled():
+        return _callattr(series, function_name, *args, **kwargs)
+
+    before = series
+
+    result, payload = _call(series, function_name, *args, **kwargs)
+
+    if getattr(result, "ndim", 0) != 1 or len(result) != len(before):
+        _log(
+            logging.INFO,
+            payload,
+            "%s: %s to %s",
+            function_name,
+            before.shape,
+            getattr(result, "shape", ()),
+        )
+        return result
+
+    n_changed, n_coerced = count_value_changes(before, result)
+    payload["changed"] = n_changed
+    payload["coerced"] = n_coerced
+    msg = "%s: changed %s (%s)"
+    msg_args = [
+        function_name,
+        Lazy(plural, n_changed, "value"),
+        Lazy(percent, n_changed, len(before)),
+    ]
+    if n_coerced:
+        msg += ", coerced %s to NA"
+        msg_args.append(Lazy(plural, n_coerced, "value"))
+    if result.dtype != before.dtype:
+        payload["changed_dtypes"] = {before.name: f"{before.dtype} -> {result.dtype}"}
+        msg += ", %s -> %s"
+        msg_args.extend([before.dtype, result.dtype])
+    _log(logging.INFO, payload, msg, *msg_args)
+
+    return result
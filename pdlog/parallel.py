@@ -0,0 +1,155 @@
+"""
+Apply a logged operation to the partitions of a dataframe in parallel, logging a
+single summary over all partitions, see `pdlog.partitioned`.
+"""
+import logging
+import queue
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Any
+from typing import Callable
+from typing import Collection
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+import pandas as pd
+
+from .handlers import MergingHandler
+from .handlers import init_worker
+from .logging import Collector
+from .logging import caching
+from .logging import collecting
+from .logging import context
+from .logging import logger
+from .streaming import StreamCollector
+
+
+class _PayloadCollector(Collector):
+    quiet = True
+
+    def __init__(self) -> None:
+        self.payloads: List[Dict[str, Any]] = []
+
+    def collect(self, payload: Dict[str, Any]) -> None:
+        self.payloads.append(payload)
+
+
+def _run_in_thread(
+    i: int, frame: pd.DataFrame, method: str, args: Any, kwargs: Any
+) -> Tuple[Any, List[Any]]:
+    # runs in a copy of the caller's context: collect this partition only, if its
+    # summary is logged, and don't share the caller's stats cache with other threads
+    collector = _PayloadCollector()
+    enabled = logger.isEnabledFor(logging.INFO)
+    with collecting(collector if enabled else None, exclusive=True):
+        with caching(), context(partition=i):
+            result = getattr(frame.log, method)(*args, **kwargs)
+    return result, collector.payloads
+
+
+# Records logged by the operation running in a worker process
+_records: "queue.Queue[logging.LogRecord]" = queue.Queue()
+
+
+def _init_process(level: int) -> None:
+    init_worker(_records, level)
+
+
+def _run_in_process(
+    i: int, frame: pd.DataFrame, method: str, args: Any, kwargs: Any
+) -> Tuple[Any, List[Any]]:
+    with context(partition=i):
+        result = getattr(frame.log, method)(*args, **kwargs)
+    records = []
+    while not _records.empty():
+        records.append(_records.get_nowait())
+    return result, records
+
+
+class Partitioned:
+    """
+    Partitions of a dataframe, whose `df.log` methods run on every partition in
+    parallel, see `pdlog.partitioned`.
+    """
+
+    def __init__(
+        self,
+        frames: Sequence[pd.DataFrame],
+        methods: Collection[str],
+        name: str,
+        executor: str,
+        max_workers: Optional[int],
+    ):
+        if executor not in ("thread", "process"):
+            raise ValueError(
+                f"executor must be 'thread' or 'process', got {executor!r}"
+            )
+        self._frames = frames
+        self._methods = methods
+        self._name = name
+        self._executor = executor
+        self._max_workers = max_workers
+
+    def __getattr__(self, name: str) -> Callable[..., List[Any]]:
+        if name.startswith("_") or name not in self._methods:
+            raise AttributeError(f"{name} can't be applied to partitions")
+
+        def method(*args: Any, **kwargs: Any) -> List[Any]:
+            return self._apply(name, args, kwargs)
+
+        return method
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def _pool(self) -> Executor:
+        if self._executor == "thread":
+            return ThreadPoolExecutor(self._max_workers)
+        level = logger.getEffectiveLevel()
+        return ProcessPoolExecutor(
+            self._max_workers, initializer=_init_process, initargs=(level,)
+        )
+
+    def _apply(self, method: str, args: Any, kwargs: Any) -> List[Any]:
+        with self._pool() as pool:
+            if self._executor == "thread":
+                futures = [
+                    pool.submit(
+                        copy_context().run,
+                        _run_in_thread,
+                        i,
+                        frame,
+                        method,
+                        args,
+                        kwargs,
+                    )
+                    for i, frame in enumerate(self._frames)
+                ]
+            else:
+                futures = [
+                    pool.submit(_run_in_process, i, frame, method, args, kwargs)
+                    for i, frame in enumerate(self._frames)
+                ]
+            outputs = [future.result() for future in futures]
+
+        collector = StreamCollector(self._name, unit="partition")
+        results = []
+        merge = MergingHandler(collector)
+        for result, logged in outputs:
+            results.append(result)
+            for item in logged:
+                if isinstance(item, logging.LogRecord):
+                    merge.handle(item)
+                else:
+                    collector.collect(item)
+        # logged like any operation in the caller's context, so with its tags and
+        # collected by e.g. an enclosing `pdlog.track`
+        collector.log(
+            logging.INFO, {"partitioned": self._name, "partitions": len(self._frames)}
+        )
+        return results
@@ -0,0 +1,105 @@
+"""
+Build a chain of logged operations lazily, and run it in one go.
+
+Running the chain as a whole lets `pdlog` reuse the statistics computed on the
+result of each step as the input statistics of the next one, and skip copying
+intermediate results that nobody else can reference.
+"""
+import inspect
+from functools import lru_cache
+from typing import Any
+from typing import Callable
+from typing import Collection
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import pandas as pd
+
+from .logging import caching
+
+
+class Pipeline:
+    """
+    A chain of `df.log` methods, recorded by calling them on the pipeline and
+    executed by `run`, see `LogAccessor.pipeline`.
+
+    >>> import pandas as pd
+    >>> df = pd.DataFrame({"x": [1, None, 3, 3]})
+    >>> pipeline = df.log.pipeline().dropna().drop_duplicates()
+    >>> pipeline
+    Pipeline(dropna(), drop_duplicates())
+    >>> pipeline.run()
+         x
+    0  1.0
+    2  3.0
+    """
+
+    def __init__(self, data: pd.DataFrame, methods: Collection[str]):
+        self._data = data
+        self._methods = methods
+        self._steps: List[Tuple[str, Tuple[Any, ...], Dict[str, Any]]] = []
+
+    def __getattr__(self, name: str) -> Callable[..., "Pipeline"]:
+        if name.startswith("_") or name not in self._methods:
+            raise AttributeError(f"{name} can't be a step of a pipeline")
+
+        def step(*args: Any, **kwargs: Any) -> "Pipeline":
+            self._steps.append((name, args, kwargs))
+            return self
+
+        return step
+
+    def __repr__(self) -> str:
+        steps = ", ".join(f"{name}()" for name, _, _ in self._steps)
+        return f"Pipeline({steps})"
+
+    def run(self) -> pd.DataFrame:
+        """
+        Run every step, logging each as usual, and return the result.
+
+        Statistics such as missing value counts are computed once per step and
+        reused by the next one. Steps following one that always returns a new copy
+        of the data, such as `dropna`, run on a result private to the pipeline, so
+        those accepting a `copy` argument, such as `astype` and `rename`, are passed
+        `copy=False` unless it's given.
+        """
+        result = self._data
+        private = False
+        with caching():
+            for name, args, kwargs in self._steps:
+                copy = kwargs.get("copy")
+                if private and copy is None and _accepts_copy(name):
+                    kwargs = {**kwargs, "copy": False}
+                    # the result may share data with the private input, and so is
+                    # private too
+                else:
+                    private = name in _COPIES and copy is not False
+                result = getattr(result.log, name)(*args, **kwargs)
+        return result
+
+
+# Methods returning a new copy of the data (unless passed `copy=False`), rather
+# than possibly a view of it, e.g. `head`
+_COPIES = frozenset(
+    (
+        "dropna",
+        "drop_duplicates",
+        "query",
+        "fillna",
+        "assign",
+        "astype",
+        "rename",
+        "set_index",
+        "reset_index",
+        "merge",
+    )
+)
+
+
+@lru_cache(maxsize=None)
+def _accepts_copy(name: str) -> bool:
+    try:
+        return "copy" in inspect.signature(getattr(pd.DataFrame, name)).parameters
+    except (AttributeError, TypeError, ValueError):
+        return False
@@ -0,0 +1,165 @@
+"""
+Statistics computed column chunk by column chunk.
+
+Operating on a bounded number of columns at a time keeps temporary arrays (such as
+`isna` masks) small and cache-friendly, even for very wide dataframes.
+"""
+from typing import Any
+from typing import Iterator
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import get_option
+
+
+def iter_chunks(
+    df: pd.DataFrame, chunk_size: Optional[int] = None
+) -> Iterator[Tuple[int, pd.DataFrame]]:
+    """
+    Yield `(start, chunk)` pairs covering the columns of `df` in order.
+
+    `chunk` holds the columns at positions `start` to `start + chunk_size`. Slicing
+    columns by position doesn't copy data that lives in a single pandas block.
+
+    >>> df = pd.DataFrame({"a": [1], "b": [2], "c": [3]})
+    >>> [(start, chunk.columns.tolist()) for start, chunk in iter_chunks(df, 2)]
+    [(0, ['a', 'b']), (2, ['c'])]
+    """
+    if chunk_size is None:
+        chunk_size = get_option("chunk_size")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    for start in range(0, df.shape[1], chunk_size):
+        yield start, df.iloc[:, start : start + chunk_size]
+
+
+def count_na(
+    df: pd.DataFrame, chunk_size: Optional[int] = None
+) -> "np.ndarray[Any, Any]":
+    """
+    Count missing values per column, or in a series.
+
+    Unlike `df.isna().sum()`, this never materializes a boolean mask the size of
+    the whole dataframe, only `chunk_size` columns' worth at a time.
+
+    >>> count_na(pd.DataFrame({"a": [1, None], "b": [None, None]}))
+    array([1, 2])
+    """
+    if df.ndim == 1:
+        return np.array([df.isna().sum()], dtype=np.int64)
+    counts = np.empty(df.shape[1], dtype=np.int64)
+    for start, chunk in iter_chunks(df, chunk_size):
+        counts[start : start + chunk.shape[1]] = chunk.isna().sum().to_numpy()
+    return counts
+
+
+def count_changed(
+    before: pd.DataFrame, after: pd.DataFrame, chunk_size: Optional[int] = None
+) -> "np.ndarray[Any, Any]":
+    """
+    Count values changed per column between two frames of the same shape, where
+    values missing in both don't count as changed.
+
+    >>> before = pd.DataFrame({"a": [1, None, 3], "b": [1, 2, 3]})
+    >>> count_changed(before, before.clip(upper=2))
+    array([1, 1])
+    """
+    counts = np.empty(before.shape[1], dtype=np.int64)
+    for start, chunk in iter_chunks(before, chunk_size):
+        other = after.iloc[:, start : start + chunk.shape[1]]
+        other = other.set_axis(chunk.columns, axis=1)
+        try:
+            equal = chunk.eq(other)
+        except TypeError:
+            # e.g. comparing categoricals to other dtypes
+            equal = chunk.astype(object).eq(other.astype(object))
+        equal |= chunk.isna() & other.isna()
+        counts[start : start + chunk.shape[1]] = (~equal).sum().to_numpy()
+    return counts
+
+
+def _different(
+    before: "np.ndarray[Any, Any]", after: "np.ndarray[Any, Any]"
+) -> "np.ndarray[Any, Any]":
+    try:
+        different = before != after
+    except (TypeError, ValueError):
+        different = None
+    if np.ndim(different) == 0:
+        # incompatible dtypes, e.g. strings and datetimes, can only be compared as
+        # objects
+        different = before.astype(object) != after.astype(object)
+    return different
+
+
+def count_value_changes(before: pd.Series, after: pd.Series) -> Tuple[int, int]:
+    """
+    Count values changed between two series of the same length, and values that
+    became missing.
+
+    Values missing in both don't count as changed. Values are compared as NumPy
+    arrays, which are views of the series' data for NumPy dtypes without missing
+    values.
+
+    >>> before = pd.Series(["1", "2", "x", None])
+    >>> count_value_changes(before, pd.to_numeric(before, errors="coerce"))
+    (3, 1)
+    """
+    na_before = before.isna().to_numpy()
+    na_after = after.isna().to_numpy()
+    values_before = before.to_numpy()
+    values_after = after.to_numpy()
+    changed = int((na_before != na_after).sum())
+    valid = ~(na_before | na_after)
+    if not valid.all():
+        values_before = values_before[valid]
+        values_after = values_after[valid]
+    changed += int(_different(values_before, values_after).sum())
+    return changed, int((na_after & ~na_before).sum())
+
+
+def sample_positions(n: int) -> "Optional[np.ndarray[Any, Any]]":
+    """
+    Return sorted random row positions to estimate statistics from, if any.
+
+    Returns `None` unless the "approximate" option is set and `n` exceeds the
+    "sample_size" option, in which case statistics should be computed exactly. The
+    sample is reproducible through the "random_state" option.
+
+    >>> from pdlog.config import option_context
+    >>> with option_context(approximate=True, sample_size=3):
+    ...     sample_positions(10)
+    array([5, 6, 9])
+    >>> sample_positions(10) is None
+    True
+    """
+    size = get_option("sample_size")
+    if not get_option("approximate") or n <= size:
+        return None
+    rng = np.random.default_rng(get_option("random_state"))
+    positions = rng.choice(n, size=size, replace=False)
+    positions.sort()
+    return positions
+
+
+def estimate(k: int, n_sample: int, n_total: int) -> Tuple[int, int]:
+    """
+    Estimate a count in a population from a count in a sample without replacement.
+
+    Returns the estimate and the half-width of its 95% confidence interval, using a
+    normal approximation with a finite population correction. An empty sample, e.g.
+    of a frame without columns, says nothing about the population: the count is
+    anywhere between 0 and `n_total`.
+
+    >>> estimate(10, 100, 1000)
+    (100, 56)
+    """
+    if n_sample == 0:
+        return 0, n_total
+    p = k / n_sample
+    fpc = (n_total - n_sample) / (n_total - 1) if n_total > 1 else 0.0
+    margin = 1.96 * np.sqrt(p * (1 - p) / n_sample * fpc) * n_total
+    return round(p * n_total), int(np.ceil(margin))
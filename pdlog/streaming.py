@@ -0,0 +1,189 @@
+import logging
+from contextlib import ExitStack
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import TypeVar
+
+from .logging import OBSERVATION
+from .logging import ROW
+from .logging import Collector
+from .logging import _log
+from .logging import collecting
+from .string import percent
+from .string import plural
+
+
+T = TypeVar("T")
+
+# Payload fields summed over the chunks of a stream
+_SUMMED = (
+    "rows_before",
+    "rows_after",
+    "observations",
+    "elapsed",
+    "cpu_time",
+    "memory_delta",
+    "filled",
+    "replaced",
+    "changed",
+    "coerced",
+)
+
+# Summed payload fields reported in summaries, with how to report them
+_DETAILS = (
+    ("filled", "filled", OBSERVATION),
+    ("replaced", "replaced", OBSERVATION),
+    ("changed", "changed", "value"),
+    ("coerced", "coerced to NA", "value"),
+)
+
+
+class StreamCollector(Collector):
+    """
+    Accumulates totals per function over the chunks of a stream, see `stream`, or
+    the partitions of a parallel pipeline, see `pdlog.handlers.merging`.
+
+    Memory use is constant in the number of chunks: one dictionary of totals per
+    function.
+    """
+
+    quiet = True
+
+    def __init__(self, name: str, unit: str = "chunk"):
+        self.name = name
+        self.unit = unit
+        self.chunks = 0
+        self.totals: Dict[str, Dict[str, Any]] = {}
+
+    def collect(self, payload: Dict[str, Any]) -> None:
+        totals = self.totals.setdefault(payload["function"], {"calls": 0})
+        totals["calls"] += 1
+        payload = {
+            **payload,
+            "observations": payload["rows_before"] * payload["cols_before"],
+        }
+        for field in _SUMMED:
+            if field in payload:
+                totals[field] = totals.get(field, 0) + payload[field]
+        # not summed, but needed for the totals to be collected in turn
+        totals["cols_before"] = payload["cols_before"]
+        totals["cols_after"] = payload["cols_after"]
+
+    def log(self, level: int, payload: Dict[str, Any]) -> None:
+        """
+        Log the summary of each function, with `payload` added to its totals.
+
+        Summaries are logged like any operation, so with the tags of `pdlog.context`
+        and collected by the collectors registered, e.g. by an enclosing
+        `pdlog.track`.
+        """
+        for function, totals in self.totals.items():
+            _log(
+                level,
+                {**payload, "function": function, **totals},
+                "%s",
+                self.summary(function),
+            )
+
+    def summary(self, function: str) -> str:
+        totals = self.totals[function]
+        rows_before = totals["rows_before"]
+        rows_after = totals["rows_after"]
+        details: List[str] = []
+        if rows_after < rows_before:
+            dropped = rows_before - rows_after
+            details.append(
+                f"dropped {plural(dropped, ROW)} ({percent(dropped, rows_before)})"
+            )
+        elif rows_after > rows_before:
+            details.append(f"added {plural(rows_after - rows_before, ROW)}")
+        for field, verb, noun in _DETAILS:
+            if totals.get(field):
+                n = totals[field]
+                total = totals["observations"] if noun == OBSERVATION else rows_before
+                details.append(f"{verb} {plural(n, noun)} ({percent(n, total)})")
+        return (
+            f"{self.name}: {function} over {plural(totals['calls'], self.unit)}: "
+            f"{plural(rows_before, ROW)} to {plural(rows_after, ROW)}"
+            + "".join(f", {detail}" for detail in details)
+        )
+
+
+class Stream(Iterator[T]):
+    """
+    Chunks whose logged operations are aggregated, see `stream`.
+
+    While iterating, operations are only collected by the stream. The summaries are
+    logged once the chunks are exhausted or the stream is closed, with `close` or
+    by using it as a context manager.
+    """
+
+    def __init__(self, chunks: Iterable[T], name: str, level: int):
+        self._chunks = iter(chunks)
+        self._level = level
+        self._registration = ExitStack()
+        self._closed = False
+        self.collector = StreamCollector(name)
+
+    def __iter__(self) -> "Stream[T]":
+        return self
+
+    def __next__(self) -> T:
+        if self._closed:
+            raise StopIteration
+        if not self.collector.chunks:
+            self._registration.enter_context(collecting(self.collector, exclusive=True))
+        try:
+            chunk = next(self._chunks)
+        except BaseException:
+            self.close()
+            raise
+        self.collector.chunks += 1
+        return chunk
+
+    def __enter__(self) -> "Stream[T]":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        # e.g. when a loop over `stream(...)` breaks, like a generator
+        self.close()
+
+    def close(self) -> None:
+        """Stop collecting operations and log the summaries, if not done yet."""
+        if self._closed:
+            return
+        self._closed = True
+        self._registration.close()
+        name = self.collector.name
+        self.collector.log(
+            self._level, {"stream": name, "chunks": self.collector.chunks}
+        )
+
+
+def stream(
+    chunks: Iterable[T], name: str = "stream", level: int = logging.INFO
+) -> Stream[T]:
+    """
+    Iterate over `chunks`, e.g. from `pd.read_csv(..., chunksize=...)`, aggregating
+    the operations logged by `pdlog` on them.
+
+    Per-chunk INFO messages aren't emitted. Instead, once the chunks are exhausted,
+    a single summary per function is logged at `level`, with totals and percentages
+    over all chunks. Every operation logged from the first chunk on counts towards
+    the summaries, and not towards enclosing `pdlog.track` blocks, which collect the
+    summaries instead. If iteration may stop early, use the stream as a context
+    manager (or call its `close` method) to log the summaries and stop collecting.
+
+    >>> import pandas as pd
+    >>> chunks = (pd.DataFrame({"x": [1, None]}) for _ in range(3))
+    >>> with stream(chunks, "ingest") as chunks:
+    ...     for chunk in chunks:
+    ...         chunk = chunk.log.dropna()
+    """
+    return Stream(chunks, name, level)
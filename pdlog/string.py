@@ -1,8 +1,46 @@
 from datetime import date
 from datetime import datetime
 from typing import Any
+from typing import Callable
+from typing import Mapping
 from typing import Sequence
 
+import numpy as np
+
+
+_UNSET = object()
+
+
+class Lazy:
+    """
+    Defer a call until its result is needed, typically formatted as a string.
+
+    Passed as an argument to a `logging` call, the call only happens if a handler
+    actually emits the record. The result is cached, and `Lazy` arguments are
+    themselves evaluated first, so lazy values can be shared and composed.
+
+    >>> Lazy(plural, Lazy(len, [1, 2]), "row")
+    2 rows
+    """
+
+    __slots__ = ("fn", "args", "_value")
+
+    def __init__(self, fn: Callable[..., Any], *args: Any):
+        self.fn = fn
+        self.args = args
+        self._value: Any = _UNSET
+
+    def value(self) -> Any:
+        if self._value is _UNSET:
+            args = [arg.value() if isinstance(arg, Lazy) else arg for arg in self.args]
+            self._value = self.fn(*args)
+        return self._value
+
+    def __str__(self) -> str:
+        return str(self.value())
+
+    __repr__ = __str__
+
 
 def plural(n: int, noun: str) -> str:
     if n == 1:
@@ -10,6 +48,22 @@ def plural(n: int, noun: str) -> str:
     return f"{n} {noun}s"
 
 
+def approximately(n: int, margin: int, noun: str) -> str:
+    """
+    >>> approximately(1200, 35, "row")
+    '~1200 rows (±35)'
+    """
+    return f"~{plural(n, noun)} (±{margin})"
+
+
+def sampled(n_sample: int, n_total: int) -> str:
+    """
+    >>> sampled(1000, 5000)
+    ' [approximate: sampled 1000 of 5000 rows]'
+    """
+    return f" [approximate: sampled {n_sample} of {n_total} rows]"
+
+
 def percent(n: int, total: int) -> str:
     if n == 0:
         return "0%"
@@ -23,6 +77,26 @@ def percent(n: int, total: int) -> str:
     return f"{round(p)}%"
 
 
+def nbytes(n: int, sign: bool = False) -> str:
+    """
+    >>> nbytes(512)
+    '512 B'
+    >>> nbytes(1536)
+    '1.5 KB'
+    >>> nbytes(-3 * 1024 ** 3, sign=True)
+    '-3.0 GB'
+    """
+    prefix = "+" if sign and n > 0 else "-" if n < 0 else ""
+    if abs(n) < 1024:
+        return f"{prefix}{abs(n)} B"
+    size = abs(n) / 1024
+    for unit in ("KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            break
+        size /= 1024
+    return f"{prefix}{size:.1f} {unit}"
+
+
 class _Ellipsis:
     def __repr__(self) -> str:
         return "..."
@@ -37,8 +111,18 @@ def summarize(items: Sequence[Any], max_items: int = 3) -> str:
     return str([prettify(x) for x in items])
 
 
-def prettify(obj: Any) -> str:
+def summarize_counts(counts: Mapping[Any, Any], max_items: int = 3) -> str:
+    items = [f"{prettify(k)!r}: {v}" for k, v in counts.items()]
+    if len(items) > max_items:
+        items = [items[0], repr(_ELLIPSIS), items[-1]]
+    return "{" + ", ".join(items) + "}"
+
+
+def prettify(obj: Any) -> Any:
     if isinstance(obj, (datetime, date)):
         # use str(datetime) instead of repr(datetime), it's more concise
         return str(obj)
+    if isinstance(obj, (np.integer, np.floating, np.bool_)):
+        # items taken from an index are numpy scalars, show them like python ones
+        return obj.item()
     return obj
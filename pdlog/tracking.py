@@ -0,0 +1,98 @@
+import logging
+from contextlib import contextmanager
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+
+import pandas as pd
+
+from .logging import Collector
+from .logging import collecting
+from .logging import logger
+from .string import Lazy
+from .string import plural
+
+
+# Payload fields kept for each step, the rest may hold large objects
+_FIELDS = (
+    "function",
+    "rows_before",
+    "rows_after",
+    "cols_before",
+    "cols_after",
+    "elapsed",
+    "memory_delta",
+)
+
+
+class Tracker(Collector):
+    """Collects the steps of a pipeline logged by `pdlog`, see `track`."""
+
+    def __init__(self, name: str, quiet: bool = False):
+        self.name = name
+        self.quiet = quiet
+        self.steps: List[Dict[str, Any]] = []
+
+    def collect(self, payload: Dict[str, Any]) -> None:
+        self.steps.append({k: payload[k] for k in _FIELDS if k in payload})
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Return one row per step with its rows in and out, time spent, memory delta
+        (if profiled) and cumulative row loss.
+        """
+        steps = pd.DataFrame(self.steps, columns=_FIELDS)
+        return pd.DataFrame(
+            {
+                "step": steps["function"],
+                "rows_in": steps["rows_before"],
+                "rows_out": steps["rows_after"],
+                "time": steps["elapsed"],
+                "memory_delta": steps["memory_delta"],
+                "rows_lost": (steps["rows_before"] - steps["rows_after"]).cumsum(),
+            }
+        )
+
+    def summary(self) -> str:
+        if not self.steps:
+            return f"{self.name}: no steps"
+        table = self.to_frame()
+        if table["memory_delta"].isna().all():
+            table = table.drop(columns="memory_delta")
+        return (
+            f"{self.name}: {plural(len(self.steps), 'step')} "
+            f"in {table['time'].sum():.3f}s, "
+            f"{table['rows_in'].iat[0]} -> {table['rows_out'].iat[-1]} rows\n"
+            + table.to_string(index=False)
+        )
+
+
+@contextmanager
+def track(
+    name: str, level: int = logging.INFO, quiet: bool = False
+) -> Iterator[Tracker]:
+    """
+    Track every operation logged by `pdlog` within a `with` block.
+
+    On exit, a single summary table is logged at `level`, with the rows in and out,
+    time spent, memory delta (with the "profile" option) and cumulative row loss of
+    each step. If `quiet`, the per-step INFO messages aren't emitted, only the
+    summary.
+
+    >>> import pandas as pd
+    >>> df = pd.DataFrame({"x": [1, None, 3]})
+    >>> with track("etl", quiet=True) as tracker:
+    ...     df = df.log.dropna().log.head(1)
+    >>> tracker.to_frame()[["step", "rows_in", "rows_out", "rows_lost"]]
+         step  rows_in  rows_out  rows_lost
+    0  dropna        3         2          1
+    1    head        2         1          2
+    """
+    tracker = Tracker(name, quiet=quiet)
+    try:
+        with collecting(tracker):
+            yield tracker
+    finally:
+        payload = {"track": name, "steps": len(tracker.steps)}
+        logger.log(level, "%s", Lazy(tracker.summary), extra={"pdlog": payload})
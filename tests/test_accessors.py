@@ -3,8 +3,10 @@ import pandas as pd
 import pytest
 from numpy import nan
 from pandas.testing import assert_frame_equal
+from pandas.testing import assert_series_equal
 
 import pdlog  # noqa
+from pdlog.config import option_context
 
 
 @pytest.fixture
@@ -121,21 +123,30 @@ def _test_log_accessor_method(
             "fillna",
             {"value": 0},
             logging.INFO,
-            "fillna: filled 869 observations (7.0%)",
+            (
+                "fillna: filled 869 observations (7%): "
+                "{'age': 177, ..., 'embark_town': 2}"
+            ),
             id="fillna",
         ),
         pytest.param(
             "ffill",
             {},
             logging.INFO,
-            "ffill: filled 868 observations (6.0%)",
+            (
+                "ffill: filled 868 observations (6%): "
+                "{'age': 177, ..., 'embark_town': 2}"
+            ),
             id="ffill",
         ),
         pytest.param(
             "bfill",
             {},
             logging.INFO,
-            "bfill: filled 868 observations (6.0%)",
+            (
+                "bfill: filled 868 observations (6%): "
+                "{'age': 177, ..., 'embark_town': 2}"
+            ),
             id="bfill",
         ),
     ),
@@ -186,3 +197,457 @@ def test_log_accessor_melt(caplog):
             "new columns: ['date', 'variable', 'value']"
         ),
     )
+
+
+@pytest.fixture
+def groups_df():
+    return pd.DataFrame({"g": list("aabbbc"), "x": range(6)})
+
+
+@pytest.mark.parametrize(
+    ("keys", "method", "kwargs", "expected_level", "expected_message"),
+    (
+        pytest.param(
+            "g",
+            "filter",
+            {"func": lambda d: len(d) > 1},
+            logging.INFO,
+            "groupby.filter: dropped 1 group (33%): ['c'] and 1 row (17%), "
+            "5 rows remaining",
+            id="filter",
+        ),
+        pytest.param(
+            "g",
+            "filter",
+            {"func": lambda d: False},
+            logging.CRITICAL,
+            "groupby.filter: dropped all rows",
+            id="filter_all",
+        ),
+        pytest.param(
+            ["g", "x"],
+            "filter",
+            {"func": lambda d: d["x"].sum() > 3},
+            logging.INFO,
+            "groupby.filter: dropped 4 groups (67%): [('a', 0), ..., ('b', 3)] "
+            "and 4 rows (67%), 2 rows remaining",
+            id="filter_multiple_keys",
+        ),
+        pytest.param(
+            "g",
+            "agg",
+            {"func": "sum"},
+            logging.INFO,
+            "groupby.agg: 3 groups, 6 rows to 3 rows",
+            id="agg",
+        ),
+        pytest.param(
+            "g",
+            "apply",
+            {"func": lambda d: d.head(1)},
+            logging.INFO,
+            "groupby.apply: 3 groups, 6 rows to 3 rows",
+            id="apply",
+        ),
+        pytest.param(
+            "g",
+            "apply",
+            {"func": lambda d: d[d["x"] > 2]},
+            logging.INFO,
+            "groupby.apply: dropped 1 group (33%): ['a'] and 3 rows (50%), "
+            "3 rows remaining",
+            id="apply_drop_group",
+        ),
+        pytest.param(
+            "g",
+            "transform",
+            {"func": "sum"},
+            logging.INFO,
+            "groupby.transform: 3 groups, 6 rows to 6 rows",
+            id="transform",
+        ),
+    ),
+)
+def test_log_accessor_groupby(
+    caplog, groups_df, keys, method, kwargs, expected_level, expected_message
+):
+    result = getattr(groups_df.log.groupby(keys), method)(**kwargs)
+    expected = getattr(groups_df.groupby(keys), method)(**kwargs)
+    assert_frame_equal(result, expected)
+    assert len(caplog.records) == 1
+    record = caplog.records[0]
+    assert record.levelno == expected_level
+    assert record.message == expected_message
+
+
+def test_log_accessor_groupby_apply_without_group_keys(caplog, groups_df):
+    result = groups_df.log.groupby("g", group_keys=False).apply(lambda d: d[d["x"] > 2])
+    assert result.index.tolist() == [3, 4, 5]
+    assert caplog.records[0].message == (
+        "groupby.apply: dropped 1 group (33%): ['a'] and 3 rows (50%), "
+        "3 rows remaining"
+    )
+
+
+def test_log_accessor_groupby_duplicate_index(caplog):
+    df = pd.DataFrame({"g": list("aabb"), "x": range(4)}, index=[0, 1, 0, 1])
+    result = df.log.groupby("g").filter(lambda d: d.name == "a")
+    assert_frame_equal(result, df.iloc[:2])
+    assert caplog.records[0].message == "groupby.filter: 2 groups, 4 rows to 2 rows"
+    assert caplog.records[0].pdlog["groups_after"] is None
+
+
+def test_log_accessor_groupby_selection(caplog, groups_df):
+    result = groups_df.log.groupby("g")["x"].filter(lambda s: s.sum() > 3)
+    assert result.tolist() == [2, 3, 4, 5]
+    assert caplog.records[0].message == (
+        "groupby.filter: dropped 1 group (33%): ['a'] and 2 rows (33%), "
+        "4 rows remaining"
+    )
+    assert caplog.records[0].pdlog["groups_before"] == 3
+    assert caplog.records[0].pdlog["groups_after"] == 2
+
+
+@pytest.fixture
+def left_df():
+    return pd.DataFrame({"k": [1, 2, 3, nan], "a": range(4)})
+
+
+@pytest.fixture
+def right_df():
+    return pd.DataFrame({"k": [2, 2, 3, 4, nan], "b": range(5)})
+
+
+@pytest.mark.parametrize(
+    ("method", "how", "kwargs", "expected_message"),
+    (
+        pytest.param(
+            "merge",
+            "inner",
+            {"on": "k"},
+            "merge: matched 3 rows (75%) of left and 4 rows (80%) of right, "
+            "1 left-only and 1 right-only, 1 row from duplicate keys, "
+            "4 rows remaining",
+            id="merge_inner",
+        ),
+        pytest.param(
+            "merge",
+            "outer",
+            {"left_on": "k", "right_on": "k"},
+            "merge: matched 3 rows (75%) of left and 4 rows (80%) of right, "
+            "1 left-only and 1 right-only, 1 row from duplicate keys, "
+            "6 rows remaining",
+            id="merge_outer",
+        ),
+        pytest.param(
+            "merge",
+            "cross",
+            {},
+            "merge: 4 rows to 20 rows",
+            id="merge_cross",
+        ),
+        pytest.param(
+            "join",
+            "left",
+            {"on": "k", "rsuffix": "_r"},
+            "join: matched 3 rows (75%) of left and 4 rows (80%) of right, "
+            "1 left-only and 1 right-only, 1 row from duplicate keys, "
+            "5 rows remaining",
+            id="join_on",
+        ),
+    ),
+)
+def test_log_accessor_merge(
+    caplog, left_df, right_df, method, how, kwargs, expected_message
+):
+    if method == "join":
+        right_df = right_df.set_index("k")
+    result = getattr(left_df.log, method)(right_df, how=how, **kwargs)
+    expected = getattr(left_df, method)(right_df, how=how, **kwargs)
+    assert_frame_equal(result, expected)
+    assert len(caplog.records) == 1
+    assert caplog.records[0].levelno == logging.INFO
+    assert caplog.records[0].message == expected_message
+
+
+def test_log_accessor_merge_index(caplog, left_df, right_df):
+    left_df.log.merge(right_df.set_index("k"), left_on="k", right_index=True)
+    payload = caplog.records[0].pdlog
+    assert payload["left_only"] == 1
+    assert payload["right_only"] == 1
+    assert payload["fan_out"] == 1
+
+
+@pytest.mark.parametrize(
+    ("right_index", "expected_message"),
+    (
+        pytest.param(
+            pd.Index(["a", "b"], name="s"),
+            "join: matched 3 rows (100%) of left and 2 rows (100%) of right, "
+            "0 left-only and 0 right-only, 0 rows from duplicate keys, "
+            "3 rows remaining",
+            id="level",
+        ),
+        pytest.param(
+            pd.MultiIndex.from_tuples([("a", 0), ("b", 1)], names=["s", "t"]),
+            "join: 3 rows to 3 rows",
+            id="some_levels",
+        ),
+    ),
+)
+def test_log_accessor_join_multiindex(caplog, right_index, expected_message):
+    index = pd.MultiIndex.from_tuples([(1, "a"), (2, "b"), (3, "a")], names=["n", "s"])
+    left = pd.DataFrame({"v": [1, 2, 3]}, index=index)
+    right = pd.DataFrame({"w": [10, 20]}, index=right_index)
+    assert_frame_equal(left.log.join(right), left.join(right))
+    assert caplog.records[0].message == expected_message
+
+
+@pytest.fixture
+def concat_dfs():
+    return [
+        pd.DataFrame({"x": [1, 2], "c": pd.Categorical(["a", "b"])}),
+        pd.DataFrame({"x": [1.5], "c": pd.Categorical(["z"]), "y": [1]}),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expected_message"),
+    (
+        pytest.param(
+            {},
+            "concat: 2 inputs to 3 rows, rows per input: [2, 1]. "
+            "columns missing from some inputs, rows filled with NA: {'y': 2}. "
+            "upcast dtypes: {'x': int64 -> float64, 'c': category -> object, "
+            "'y': int64 -> float64}",
+            id="outer",
+        ),
+        pytest.param(
+            {"join": "inner"},
+            "concat: 2 inputs to 3 rows, rows per input: [2, 1]. "
+            "columns missing from some inputs, dropped: ['y']. "
+            "upcast dtypes: {'x': int64 -> float64, 'c': category -> object}",
+            id="inner",
+        ),
+        pytest.param(
+            {"axis": 1},
+            "concat: 2 inputs to 5 columns, columns per input: [2, 3]. "
+            "upcast dtypes: {'y': int64 -> float64}",
+            id="columns",
+        ),
+    ),
+)
+def test_concat(caplog, concat_dfs, kwargs, expected_message):
+    result = pdlog.concat(iter(concat_dfs), **kwargs)
+    assert_frame_equal(result, pd.concat(concat_dfs, **kwargs))
+    assert len(caplog.records) == 1
+    assert caplog.records[0].message == expected_message
+
+
+def test_concat_same_schema(caplog):
+    df = pd.DataFrame({"x": [1, 2]})
+    pdlog.concat({"a": df, "b": None, "c": df})
+    assert caplog.records[0].message == (
+        "concat: 2 inputs to 4 rows, rows per input: [2, 2]"
+    )
+    assert caplog.records[0].pdlog["rows_before"] == 4
+
+
+def test_log_accessor_assign_coerced(caplog):
+    df = pd.DataFrame({"x": ["1", "a", None], "y": [1, 2, 3]})
+    result = df.log.assign(x=lambda d: pd.to_numeric(d["x"], errors="coerce"))
+    assert result["x"].tolist()[:1] == [1.0]
+    payload = caplog.records[0].pdlog
+    assert payload["changed_dtypes"] == {"x": "object -> float64"}
+    assert payload["coerced"] == 1
+    assert payload["coerced_columns"].value() == {"x": 1}
+
+
+def test_log_accessor_astype_memory_deep(caplog):
+    df = pd.DataFrame({"s": ["a", "b"] * 50})
+    df.log.astype({"s": "category"})
+    with pdlog.option_context(memory_deep=True):
+        df.log.astype({"s": "category"})
+    shallow, deep = (record.pdlog for record in caplog.records)
+    assert shallow["memory_before"] < deep["memory_before"]
+    assert deep["memory_delta"] < 0
+
+
+@pytest.fixture
+def values_df():
+    return pd.DataFrame({"x": [1, 5, nan, 8], "y": [0, 1, 2, 3]}, index=list("abcd"))
+
+
+@pytest.mark.parametrize(
+    ("method", "args", "kwargs", "expected_message"),
+    (
+        pytest.param(
+            "where",
+            (lambda d: d > 1,),
+            {},
+            "where: replaced 3 observations (38%): {'x': 1, 'y': 2}",
+            id="where",
+        ),
+        pytest.param(
+            "mask",
+            (lambda d: d > 4,),
+            {"other": 0},
+            "mask: replaced 2 observations (25%): {'x': 2}",
+            id="mask",
+        ),
+        pytest.param(
+            "clip",
+            (),
+            {"upper": 2},
+            "clip: replaced 3 observations (38%): {'x': 2, 'y': 1}",
+            id="clip",
+        ),
+        pytest.param(
+            "replace",
+            (0, 10),
+            {},
+            "replace: replaced 1 observation (12%): {'y': 1}",
+            id="replace",
+        ),
+        pytest.param(
+            "interpolate",
+            (),
+            {},
+            "interpolate: filled 1 observation (12%): {'x': 1}",
+            id="interpolate",
+        ),
+        pytest.param(
+            "nlargest",
+            (2, "y"),
+            {},
+            "nlargest: dropped 2 rows (50%), 2 rows remaining",
+            id="nlargest",
+        ),
+        pytest.param(
+            "stack",
+            (),
+            {},
+            "stack: reshaped from (4, 2) to (7,). old columns: ['x', 'y']. "
+            "new columns: []",
+            id="stack",
+        ),
+    ),
+)
+def test_log_accessor_generated(
+    caplog, values_df, method, args, kwargs, expected_message
+):
+    result = getattr(values_df.log, method)(*args, **kwargs)
+    expected = getattr(values_df, method)(*args, **kwargs)
+    assert result.equals(expected)
+    assert len(caplog.records) == 1
+    assert caplog.records[0].message == expected_message
+
+
+def test_log_accessor_indexers(caplog, values_df):
+    assert values_df.log.loc[values_df["y"] > 1, ["x"]].shape == (2, 1)
+    assert values_df.log.iloc[:3].shape == (3, 2)
+    assert values_df.log.loc["a", "x"] == 1
+    assert values_df.log.loc[:, "y"].tolist() == [0, 1, 2, 3]
+    assert [record.message for record in caplog.records] == [
+        "loc[]: dropped 1 column (50%): ['y'] and 2 rows (50%), 2 rows remaining",
+        "iloc[]: dropped 1 row (25%), 3 rows remaining",
+    ]
+
+
+@pytest.mark.parametrize("level", [logging.INFO, logging.WARNING])
+def test_log_accessor_indexers_repeat_rows(caplog, values_df, level, tmp_path):
+    caplog.set_level(level)
+    with option_context(audit_path=tmp_path):
+        result = values_df.log.loc[["a", "a", "b"], ["x", "x"]]
+        assert_frame_equal(result, values_df.loc[["a", "a", "b"], ["x", "x"]])
+        values_df.log.iloc[[0, 0]]
+    assert not list(tmp_path.iterdir())
+    assert [record.message for record in caplog.records] == (
+        [
+            "loc[]: 4 rows to 3 rows, 2 columns to 2 columns",
+            "iloc[]: 4 rows to 2 rows, 2 columns to 2 columns",
+        ]
+        if level == logging.INFO
+        else []
+    )
+
+
+def test_register_method(caplog, values_df, monkeypatch):
+    monkeypatch.setattr(pdlog.accessor, "METHODS", dict(pdlog.accessor.METHODS))
+    monkeypatch.setattr(pdlog.accessor, "STRATEGIES", dict(pdlog.accessor.STRATEGIES))
+    monkeypatch.setattr(pdlog.accessor.LogAccessor, "truncate", None, raising=False)
+    monkeypatch.setattr(pdlog.accessor.LogAccessor, "round", None, raising=False)
+    calls = []
+
+    def log_rounding(df, function_name, *args, **kwargs):
+        calls.append(function_name)
+        return getattr(df, function_name)(*args, **kwargs)
+
+    pdlog.register_method("truncate", "filter")
+    pdlog.register_strategy("rounding", log_rounding)
+    pdlog.register_method("round", "rounding")
+
+    assert values_df.log.truncate(after="b").shape == (2, 2)
+    assert values_df.log.round().equals(values_df.round())
+    assert calls == ["round"]
+    assert caplog.records[0].message == (
+        "truncate: dropped 2 rows (50%), 2 rows remaining"
+    )
+    with pytest.raises(KeyError, match="unknown strategy: nope"):
+        pdlog.register_method("abs", "nope")
+    with pytest.raises(ValueError, match="can't override the groupby method"):
+        pdlog.register_method("groupby", "filter")
+
+
+@pytest.fixture
+def series():
+    return pd.Series(["1", "2", "x", None, "B"], name="v")
+
+
+@pytest.mark.parametrize(
+    ("method", "args", "expected_message"),
+    (
+        pytest.param(
+            "dropna", (), "dropna: dropped 1 row (20%), 4 rows remaining", id="dropna"
+        ),
+        pytest.param(
+            "fillna", ("0",), "fillna: filled 1 observation (20%)", id="fillna"
+        ),
+        pytest.param(
+            "map",
+            ({"1": "one", "2": "two", "x": "x"},),
+            "map: changed 3 values (60%), coerced 1 value to NA",
+            id="map",
+        ),
+        pytest.param(
+            "replace", ("x", "y"), "replace: changed 1 value (20%)", id="replace"
+        ),
+        pytest.param(
+            "astype",
+            ("category",),
+            "astype: changed 0 values (0%), object -> category",
+            id="astype",
+        ),
+    ),
+)
+def test_log_series_accessor(caplog, series, method, args, expected_message):
+    result = getattr(series.log, method)(*args)
+    assert_series_equal(result, getattr(series, method)(*args))
+    assert len(caplog.records) == 1
+    assert caplog.records[0].message == expected_message
+
+
+def test_log_series_accessor_namespaces(caplog, series):
+    assert_series_equal(series.log.str.lower(), series.str.lower())
+    assert series.log.str.split("x", expand=True).shape == (5, 2)
+    dates = pd.Series(pd.to_datetime(["2020-01-01 10:00", None]))
+    assert dates.log.dt.year.tolist()[:1] == [2020]
+    assert [record.message for record in caplog.records] == [
+        "str.lower: changed 1 value (20%)",
+        "str.split: (5,) to (5, 2)",
+        "dt.year: changed 1 value (50%), datetime64[ns] -> float64",
+    ]
+    with pytest.raises(AttributeError):
+        series.log.dt
+    with pytest.raises(AttributeError):
+        series.log.str.nope
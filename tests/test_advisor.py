@@ -0,0 +1,116 @@
+import logging
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pdlog  # noqa
+from pdlog.advisor import memory_report
+from pdlog.advisor import suggest_dtypes
+from pdlog.config import option_context
+
+
+@pytest.mark.parametrize(
+    ("values", "expected"),
+    (
+        pytest.param([0, 100], np.dtype("int8"), id="int8"),
+        pytest.param([-1, 40_000], np.dtype("int32"), id="int32"),
+        pytest.param([0, 2**40], None, id="int64"),
+        pytest.param(np.array([0, 255], dtype="uint64"), np.dtype("uint8"), id="uint"),
+        pytest.param([0.5, np.nan], np.dtype("float32"), id="float32"),
+        pytest.param([0.5, 1e300], None, id="float64"),
+        pytest.param(["a", "b", "a", "a"], "category", id="category"),
+        pytest.param(["a", "b", "c", None], None, id="object"),
+        pytest.param([True, False], None, id="bool"),
+        pytest.param(pd.array([1, None], dtype="Int64"), pd.Int8Dtype(), id="Int8"),
+        pytest.param(
+            pd.array([0.5, None], dtype="Float64"), pd.Float32Dtype(), id="Float32"
+        ),
+        pytest.param(pd.array([None, None], dtype="Int64"), None, id="all_na"),
+        pytest.param([[1], [2], [1], [1]], None, id="unhashable"),
+    ),
+)
+def test_suggest_dtypes(values, expected):
+    df = pd.DataFrame({"x": values})
+    assert suggest_dtypes(df).get("x") == expected
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    (
+        pytest.param([[1, 2.0], [3, None]], {}, id="different"),
+        pytest.param([[1, 2], [3, 4]], {"a": np.dtype("int8")}, id="same"),
+    ),
+)
+def test_suggest_dtypes_duplicate_columns(data, expected):
+    df = pd.DataFrame(data, columns=["a", "a"])
+    assert suggest_dtypes(df) == expected
+    assert memory_report(df)["suggested"].tolist()[0] == np.dtype("int8")
+
+
+def test_suggest_dtypes_sampled():
+    df = pd.DataFrame({"s": np.arange(1000).astype(str)})
+    with option_context(sample_size=10):
+        assert suggest_dtypes(df) == {}
+        assert suggest_dtypes(df.iloc[:, :0]) == {}
+
+
+def test_memory_report():
+    df = pd.DataFrame({"i": np.arange(10), "s": ["a"] * 10})
+    report = df.log.memory_report()
+    assert report.index.tolist() == ["i", "s"]
+    assert report["suggested"].tolist() == [np.dtype("int8"), "category"]
+    assert report.loc["i", "memory"] == 80
+    assert report.loc["i", "saved"] == 70
+    assert report.loc["s", "saved"] == 80 - (10 + 8)
+    deep = memory_report(df, deep=True)
+    assert deep.loc["s", "memory"] > report.loc["s", "memory"]
+    assert deep.loc["s", "saved"] > report.loc["s", "saved"]
+
+
+def test_advise(caplog):
+    caplog.set_level(logging.INFO)
+    df = pd.DataFrame({"i": np.arange(10), "s": ["a"] * 10})
+
+    with option_context(advise=True):
+        result = df.log.head(5)
+
+    assert result.dtypes.tolist() == df.dtypes.tolist()
+    assert caplog.records[-1].message == (
+        "advisor: downcast {'i': int64 -> int8, 's': object -> category} to save 62 B"
+    )
+    assert caplog.records[-1].pdlog["saved"] == 62
+
+
+def test_advise_apply(caplog):
+    caplog.set_level(logging.INFO)
+    df = pd.DataFrame({"i": np.arange(10), "s": ["a"] * 10})
+
+    with option_context(advise=True, advise_apply=True):
+        result = df.log.groupby("s").filter(lambda d: True)
+
+    assert result.dtypes.tolist() == [np.dtype("int8"), "category"]
+    assert [record.pdlog["function"] for record in caplog.records[::2]] == [
+        "groupby.filter",
+        "astype",
+    ]
+
+
+def test_advise_apply_duplicate_columns(caplog):
+    caplog.set_level(logging.INFO)
+    df = pd.DataFrame([[1, 2.0, 3], [3, None, 4]], columns=["a", "a", "b"])
+    with option_context(advise=True, advise_apply=True):
+        result = df.log.head(2)
+    assert result.dtypes.tolist() == [np.dtype("int64"), np.dtype("float64"), "int8"]
+    assert caplog.records[-1].pdlog["function"] == "astype"
+
+
+def test_advise_apply_unhashable_and_nullable(caplog):
+    caplog.set_level(logging.INFO)
+    df = pd.DataFrame(
+        {"i": pd.array([1, None, 3], dtype="Int64"), "l": [[1], [2], [1]]}
+    )
+    with option_context(advise=True, advise_apply=True):
+        result = df.log.head(3)
+    assert result.dtypes.tolist() == [pd.Int8Dtype(), np.dtype(object)]
+    assert result["i"].isna().tolist() == [False, True, False]
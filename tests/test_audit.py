@@ -0,0 +1,133 @@
+import itertools
+import logging
+
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+import pdlog
+from pdlog.audit import read
+from pdlog.config import option_context
+
+
+@pytest.fixture
+def caplog(caplog):
+    caplog.set_level(logging.INFO)
+    return caplog
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame(
+        {"x": [1, None, 3, None, 5], "y": list("abcde")}, index=list("vwxyz")
+    )
+
+
+def test_audit(caplog, df, tmp_path):
+    with option_context(audit_path=tmp_path):
+        df.log.dropna()
+        df.log.query("y == 'a'")
+        df.log.dropna(axis=1)
+
+    assert len(list(tmp_path.iterdir())) == 2
+    trail = read(tmp_path)
+    assert_frame_equal(
+        trail.drop(columns="audit_file"), df.loc[["w", "y", "w", "x", "y", "z"]]
+    )
+    assert trail["audit_file"].str.rsplit("-", 1).str[-1].tolist() == (
+        ["dropna.pkl"] * 2 + ["query.pkl"] * 4
+    )
+    assert caplog.records[0].pdlog["audit_file"].endswith("dropna.pkl")
+    assert "audit_file" not in caplog.records[2].pdlog
+
+
+def test_audit_disabled_logger(caplog, df, tmp_path):
+    caplog.set_level(logging.WARNING)
+    with option_context(audit_path=tmp_path):
+        df.log.head(2)
+    assert_frame_equal(read(tmp_path).drop(columns="audit_file"), df.iloc[2:])
+
+
+@pytest.mark.parametrize(
+    ("sampling", "expected"),
+    (
+        pytest.param("first", ["v", "w"], id="first"),
+        pytest.param("random", ["w", "x"], id="random"),
+    ),
+)
+def test_audit_max_rows(caplog, df, tmp_path, sampling, expected):
+    options = {"audit_max_rows": 2, "audit_sampling": sampling, "random_state": 1}
+    with option_context(audit_path=tmp_path, **options):
+        df.log.tail(1)
+    assert read(tmp_path).index.tolist() == expected
+
+
+def test_audit_series(caplog, tmp_path):
+    with option_context(audit_path=tmp_path):
+        pd.Series([1, None], name="x").log.dropna()
+    assert_frame_equal(
+        read(tmp_path).drop(columns="audit_file"),
+        pd.DataFrame({"x": [float("nan")]}, [1]),
+    )
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "feather"])
+def test_audit_arrow(caplog, df, tmp_path, file_format):
+    pytest.importorskip("pyarrow")
+    with option_context(audit_path=tmp_path, audit_format=file_format):
+        df.log.dropna()
+    trail = read(tmp_path)
+    assert trail["index"].tolist() == ["w", "y"]
+
+
+def test_audit_duplicate_labels(caplog, tmp_path):
+    df = pd.DataFrame({"x": [1, None, 3, None, 5]}, index=[0, 0, 1, 1, 1])
+    with option_context(audit_path=tmp_path):
+        df.log.dropna()
+        df.log.drop(index=1)
+    trail = read(tmp_path).drop(columns="audit_file")
+    assert_frame_equal(trail, df.iloc[[1, 4, 2, 3, 4]])
+
+
+@pytest.mark.parametrize("level", [logging.INFO, logging.WARNING])
+def test_audit_ignore_index(caplog, tmp_path, level):
+    caplog.set_level(level)
+    df = pd.DataFrame({"x": [1, 1, 2, 3]})
+    with option_context(audit_path=tmp_path, dropped_labels=2):
+        result = df.log.drop_duplicates(ignore_index=True)
+    assert_frame_equal(result, df.drop_duplicates(ignore_index=True))
+    assert_frame_equal(read(tmp_path).drop(columns="audit_file"), df.iloc[[1]])
+    if level == logging.INFO:
+        assert caplog.records[0].message == (
+            "drop_duplicates: dropped 1 row (25%): [1], 3 rows remaining"
+        )
+
+
+def test_audit_never_overwrites(caplog, df, tmp_path, monkeypatch):
+    monkeypatch.setattr(pdlog.audit, "_sequence", itertools.count())
+    with option_context(audit_path=tmp_path):
+        df.log.dropna()
+        # a later run, in a process with the same ID
+        monkeypatch.setattr(pdlog.audit, "_sequence", itertools.count())
+        with pytest.raises(FileExistsError):
+            df.log.dropna()
+        monkeypatch.setattr(pdlog.audit, "_run", "later")
+        df.log.dropna()
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_audit_invalid_format(caplog, df, tmp_path):
+    with option_context(audit_path=tmp_path, audit_format="csv"):
+        with pytest.raises(ValueError, match="audit_format must be one of"):
+            df.log.dropna()
+
+
+def test_read_empty(tmp_path):
+    assert read(tmp_path).empty
+
+
+def test_stream(caplog, df, tmp_path):
+    with option_context(audit_path=tmp_path):
+        for chunk in pdlog.stream([df.iloc[:2], df.iloc[2:]]):
+            chunk.log.dropna()
+    assert read(tmp_path).index.tolist() == ["w", "y"]
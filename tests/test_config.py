@@ -0,0 +1,35 @@
+import pytest
+
+from pdlog.config import get_option
+from pdlog.config import option_context
+from pdlog.config import set_option
+
+
+def test_set_option():
+    before = get_option("chunk_size")
+    try:
+        set_option("chunk_size", 3)
+        assert get_option("chunk_size") == 3
+    finally:
+        set_option("chunk_size", before)
+
+
+def test_option_context_restores_on_error():
+    before = get_option("chunk_size")
+    with pytest.raises(RuntimeError):
+        with option_context(chunk_size=3):
+            raise RuntimeError
+    assert get_option("chunk_size") == before
+
+
+@pytest.mark.parametrize(
+    "fn",
+    (
+        lambda: get_option("foo"),
+        lambda: set_option("foo", 1),
+        lambda: option_context(foo=1).__enter__(),
+    ),
+)
+def test_unknown_option(fn):
+    with pytest.raises(KeyError, match="unknown option: foo"):
+        fn()
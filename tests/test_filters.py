@@ -0,0 +1,97 @@
+import logging
+
+import pandas as pd
+import pytest
+from numpy import nan
+
+import pdlog  # noqa
+from pdlog.filters import AggregatingFilter
+
+
+@pytest.fixture
+def caplog(caplog):
+    caplog.set_level(logging.INFO)
+    return caplog
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr("pdlog.filters.time.monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def add_filter():
+    pdlog_logger = logging.getLogger("pdlog")
+    filters = []
+
+    def add_filter(f):
+        filters.append(f)
+        pdlog_logger.addFilter(f)
+        return f
+
+    yield add_filter
+    for f in filters:
+        pdlog_logger.removeFilter(f)
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({"x": [1, nan, 3]})
+
+
+def test_aggregating_filter_flush(caplog, clock, add_filter, df):
+    aggregate = add_filter(AggregatingFilter(window=10))
+    for _ in range(5):
+        df.log.dropna()
+        df.log.fillna(0)
+    assert len(caplog.records) == 2
+
+    clock[0] = 2.5
+    aggregate.flush()
+
+    assert [r.message for r in caplog.records[2:]] == [
+        "dropna called 4 more times in 2.5s: dropped 4 rows total",
+        "fillna called 4 more times in 2.5s: filled 4 observations total",
+    ]
+    assert caplog.records[2].pdlog == {
+        "function": "dropna",
+        "calls": 4,
+        "rows_dropped": 4,
+        "filled": 0,
+    }
+
+
+def test_aggregating_filter_max_count(caplog, clock, add_filter, df):
+    add_filter(AggregatingFilter(window=10, max_count=2))
+    for _ in range(5):
+        df.log.dropna()
+    assert [r.message for r in caplog.records] == [
+        "dropna: dropped 1 row (33%), 2 rows remaining",
+        "dropna called 2 more times in 0.0s: dropped 2 rows total",
+        "dropna called 2 more times in 0.0s: dropped 2 rows total",
+    ]
+
+
+def test_aggregating_filter_window(caplog, clock, add_filter, df):
+    add_filter(AggregatingFilter(window=1))
+    df.log.dropna()
+    df.log.dropna()
+    clock[0] = 1.5
+    df.log.dropna()
+    clock[0] = 3.0
+    df.log.dropna()
+
+    assert [r.message for r in caplog.records] == [
+        "dropna: dropped 1 row (33%), 2 rows remaining",
+        "dropna called 2 more times in 1.5s: dropped 2 rows total",
+        "dropna: dropped 1 row (33%), 2 rows remaining",
+    ]
+
+
+def test_aggregating_filter_other_records(caplog, add_filter):
+    add_filter(AggregatingFilter(window=10))
+    for _ in range(3):
+        logging.getLogger("pdlog").info("hello")
+    assert len(caplog.records) == 3
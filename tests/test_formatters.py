@@ -0,0 +1,49 @@
+import json
+import logging
+import sys
+from unittest.mock import Mock
+
+import pandas as pd
+import pytest
+from numpy import nan
+
+from pdlog.formatters import JSONFormatter
+from pdlog.logging import log_fillna
+
+
+@pytest.fixture
+def caplog(caplog):
+    caplog.set_level(logging.INFO)
+    return caplog
+
+
+def test_json_formatter(caplog):
+    before_df = pd.DataFrame({"x": [1, nan], 0: [nan, nan]})
+    before_df.fn = Mock(return_value=before_df.fillna(0))
+    log_fillna(before_df, "fn")
+
+    data = json.loads(JSONFormatter().format(caplog.records[0]))
+
+    assert data["level"] == "INFO"
+    assert data["logger"] == "pdlog"
+    assert data["message"] == "fn: filled 3 observations (75%): {'x': 1, 0: 2}"
+    assert data["function"] == "fn"
+    assert data["rows_before"] == data["rows_after"] == 2
+    assert data["filled"] == 3
+    assert data["filled_columns"] == {"x": 1, "0": 2}
+
+
+def test_json_formatter_plain_record():
+    record = logging.LogRecord("foo", logging.WARNING, "", 0, "%s!", ("hi",), None)
+    data = json.loads(JSONFormatter().format(record))
+    assert data["message"] == "hi!"
+    assert set(data) == {"time", "level", "logger", "message"}
+
+
+def test_json_formatter_exc_info():
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.makeLogRecord({"msg": "failed", "exc_info": sys.exc_info()})
+    data = json.loads(JSONFormatter().format(record))
+    assert "ValueError: boom" in data["exc_info"]
@@ -0,0 +1,149 @@
+import logging
+import multiprocessing
+import pickle
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+import pytest
+
+import pdlog  # noqa
+from pdlog.handlers import WorkerQueueHandler
+from pdlog.handlers import flush
+from pdlog.handlers import init_worker
+from pdlog.handlers import merging
+from pdlog.handlers import start_async
+from pdlog.handlers import stop_async
+from pdlog.logging import context
+
+
+class _SlowHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.unblock = threading.Event()
+        self.messages = []
+        self.threads = set()
+
+    def emit(self, record):
+        self.unblock.wait(timeout=5)
+        self.messages.append(self.format(record))
+        self.threads.add(threading.get_ident())
+
+
+@pytest.fixture
+def handler():
+    logging.getLogger("pdlog").setLevel(logging.INFO)
+    handler = _SlowHandler()
+    yield handler
+    handler.unblock.set()
+    stop_async()
+    logging.getLogger("pdlog").setLevel(logging.NOTSET)
+
+
+def test_start_async(handler):
+    start_async([handler])
+    pd.DataFrame({"x": [1, None]}).log.dropna()
+    assert handler.messages == []
+
+    handler.unblock.set()
+    flush()
+
+    assert handler.messages == ["dropna: dropped 1 row (50%), 1 row remaining"]
+    assert threading.get_ident() not in handler.threads
+
+
+def test_start_async_drop(caplog, handler):
+    queue_handler = start_async([handler], maxsize=1)
+    for _ in range(10):
+        logging.getLogger("pdlog").info("hello")
+    assert queue_handler.dropped > 0
+
+    handler.unblock.set()
+    stop_async()
+
+    assert 0 < len(handler.messages) < 10
+    assert caplog.records[-1].message == (
+        f"dropped {queue_handler.dropped} records, the queue was full"
+    )
+
+
+def test_start_async_block(handler):
+    start_async([handler], maxsize=1, policy="block")
+    threading.Timer(0.1, handler.unblock.set).start()
+    for _ in range(10):
+        logging.getLogger("pdlog").info("hello")
+    stop_async()
+    assert len(handler.messages) == 10
+
+
+def test_start_async_defaults_to_root_handlers(caplog):
+    pdlog_logger = logging.getLogger("pdlog")
+    caplog.set_level(logging.INFO)
+    start_async()
+    try:
+        assert not pdlog_logger.propagate
+        pdlog_logger.info("hello")
+        flush()
+        assert [r.message for r in caplog.records] == ["hello"]
+    finally:
+        stop_async()
+    assert pdlog_logger.propagate
+    assert pdlog_logger.handlers == []
+
+
+def test_start_async_twice(handler):
+    start_async([handler])
+    with pytest.raises(RuntimeError, match="already logging asynchronously"):
+        start_async([handler])
+
+
+def test_invalid_policy(handler):
+    with pytest.raises(ValueError, match="policy must be 'drop' or 'block'"):
+        start_async([handler], policy="foo")
+    assert logging.getLogger("pdlog").propagate
+
+
+def test_worker_queue_handler(caplog):
+    caplog.set_level(logging.INFO)
+    records = queue.Queue()
+    pdlog_logger = logging.getLogger("pdlog")
+    handler = WorkerQueueHandler(records)
+    pdlog_logger.addHandler(handler)
+    try:
+        pd.DataFrame({"x": [1, 2], "y": [None, None]}).log.dropna(axis=1)
+    finally:
+        pdlog_logger.removeHandler(handler)
+
+    record = pickle.loads(pickle.dumps(records.get_nowait()))
+    assert record.getMessage() == "dropna: dropped 1 column (50%): ['y']"
+    assert record.pdlog["dropped_columns"] == ["y"]
+
+
+def _clean(i):
+    with context(partition=i):
+        df = pd.DataFrame({"x": [1.0] + [None] * i})
+        if i == 2:
+            logging.getLogger("pdlog").critical("partition %s is empty", i)
+        return len(df.log.dropna())
+
+
+def test_merging(caplog):
+    caplog.set_level(logging.INFO)
+    with multiprocessing.Manager() as manager:
+        records = manager.Queue()
+        with merging(records, "clean"):
+            with ProcessPoolExecutor(
+                2, initializer=init_worker, initargs=(records,)
+            ) as pool:
+                assert list(pool.map(_clean, range(4))) == [1, 1, 1, 1]
+
+    assert [(r.levelno, r.message) for r in caplog.records] == [
+        (logging.CRITICAL, "partition 2 is empty"),
+        (
+            logging.INFO,
+            "clean: dropna over 4 partitions: 10 rows to 4 rows, "
+            "dropped 6 rows (60%)",
+        ),
+    ]
+    assert caplog.records[-1].pdlog["calls"] == 4
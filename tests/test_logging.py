@@ -1,15 +1,30 @@
 import logging
+import re
+import threading
+import tracemalloc as tracing
 from unittest.mock import Mock
 
 import pandas as pd
 import pytest
 from numpy import nan
 
+from pdlog.config import option_context
+from pdlog.logging import Collector
+from pdlog.logging import _dropped_rows
+from pdlog.logging import _key_ids
+from pdlog.logging import _renamed
+from pdlog.logging import collecting
+from pdlog.logging import context
+from pdlog.logging import log_change_dtype
 from pdlog.logging import log_change_index
 from pdlog.logging import log_fillna
 from pdlog.logging import log_filter
+from pdlog.logging import _summarize_rows
 from pdlog.logging import log_rename
+from pdlog.logging import log_replace
 from pdlog.logging import log_reshape
+from pdlog.string import Lazy
+from pdlog.string import nbytes
 
 
 @pytest.fixture
@@ -40,13 +55,31 @@ def _test_log_function(
     (
         pytest.param([], [], logging.INFO, "fn: empty input dataframe", id="empty_df"),
         pytest.param(
-            [0, 1, 2], [], logging.CRITICAL, "fn: dropped all rows", id="all_rows"
+            {"x": []},
+            {},
+            logging.INFO,
+            "fn: empty input dataframe, dropped 1 column (100%): ['x']",
+            id="empty_df_cols",
+        ),
+        pytest.param(
+            {"x": [0, 1, 2]},
+            {"x": []},
+            logging.CRITICAL,
+            "fn: dropped all rows",
+            id="all_rows",
+        ),
+        pytest.param(
+            {"x": [0, 1, 2], "y": [0, 1, 2]},
+            {"x": []},
+            logging.CRITICAL,
+            "fn: dropped 1 column (50%): ['y'] and all rows",
+            id="all_rows_and_cols",
         ),
         pytest.param(
             {"x": [1, 2, 3], "y": [4, 5, 6], "z": [7, 8, 9]},
             {"x": [1]},
             logging.INFO,
-            "fn: dropped 2 columns (67%) and 2 rows (67%), 1 row remaining",
+            "fn: dropped 2 columns (67%): ['y', 'z'] and 2 rows (67%), 1 row remaining",
             id="some_rows_and_cols",
         ),
         pytest.param(
@@ -220,9 +253,75 @@ def test_log_reshape(caplog, before_df, after_df, expected_level, expected_msg):
     )
 
 
+@pytest.mark.parametrize(
+    ("before", "after", "expected_msg"),
+    (
+        pytest.param(
+            {"x": [1, 2]},
+            {"x": [1.0, 2.0]},
+            "fn: changed dtypes: {'x': int64 -> float64}, ",
+            id="changed",
+        ),
+        pytest.param(
+            {"x": [1, 2]},
+            {"x": [1, 2], "y": [nan, nan]},
+            "fn: new columns: {'y': float64}, ",
+            id="new",
+        ),
+        pytest.param(
+            {"x": ["1", "a"]},
+            {"x": [1, nan]},
+            "fn: changed dtypes: {'x': object -> float64}, "
+            "coerced 1 observation to NA: {'x': 1}, ",
+            id="coerced",
+        ),
+        pytest.param(
+            {"x": [1, 2]},
+            {"x": [1, 2]},
+            "fn: no dtype changes, ",
+            id="nothing",
+        ),
+    ),
+)
+def test_log_change_dtype(caplog, before, after, expected_msg):
+    before_df = pd.DataFrame(before)
+    after_df = pd.DataFrame(after)
+    memory_before = before_df.memory_usage().sum()
+    memory_after = after_df.memory_usage().sum()
+    expected_msg += (
+        f"memory {nbytes(memory_before)} -> {nbytes(memory_after)} "
+        f"({nbytes(memory_after - memory_before, sign=True)})"
+    )
+    _test_log_function(
+        log_change_dtype, caplog, before_df, after_df, logging.INFO, expected_msg
+    )
+
+
 @pytest.mark.parametrize(
     ("before", "after", "expected_level", "expected_msg"),
-    (([0, 1, nan], [0, 1, 1], logging.INFO, "fn: filled 1 observation (33.0%)"),),
+    (
+        pytest.param(
+            [0, 1, nan],
+            [0, 1, 1],
+            logging.INFO,
+            "fn: filled 1 observation (33%): {0: 1}",
+            id="one_column",
+        ),
+        pytest.param(
+            {"x": [nan, nan, 1], "y": [nan, 1, 2], "z": [0, 1, 2]},
+            {"x": [0, 0, 1], "y": [nan, 1, 2], "z": [0, 1, 2]},
+            logging.INFO,
+            "fn: filled 2 observations (22%): {'x': 2}",
+            id="some_columns",
+        ),
+        pytest.param(
+            [0, 1, nan],
+            [0, 1, nan],
+            logging.INFO,
+            "fn: filled 0 observations (0%)",
+            id="nothing",
+        ),
+    ),
 )
 def test_log_fillna(caplog, before, after, expected_level, expected_msg):
     before_df = pd.DataFrame(before)
@@ -230,3 +329,458 @@ def test_log_fillna(caplog, before, after, expected_level, expected_msg):
     _test_log_function(
         log_fillna, caplog, before_df, after_df, expected_level, expected_msg
     )
+
+
+@pytest.mark.parametrize(
+    "log_fn", (log_filter, log_change_index, log_rename, log_reshape, log_fillna)
+)
+def test_disabled_logger_falls_through(caplog, log_fn):
+    caplog.set_level(logging.WARNING, logger="pdlog")
+    before_df = pd.DataFrame([0, 1, nan])
+    after_df = pd.DataFrame([0, 1])
+    before_df.fn = Mock(return_value=after_df)
+
+    result = log_fn(before_df, "fn", 42, key="value")
+
+    before_df.fn.assert_called_once_with(42, key="value")
+    assert result is after_df
+    assert not caplog.records
+
+
+@pytest.mark.parametrize(
+    ("before", "after", "expected_msg"),
+    (
+        pytest.param(
+            {"x": [0, 1, nan], "y": [1, 2, 3]},
+            {"x": [0, 0, nan], "y": [1, 2, 0]},
+            "fn: replaced 2 observations (33%): {'x': 1, 'y': 1}",
+            id="some",
+        ),
+        pytest.param(
+            {"x": [0, 1, nan]},
+            {"x": [0, 1, nan]},
+            "fn: replaced 0 observations (0%)",
+            id="nothing",
+        ),
+    ),
+)
+def test_log_replace(caplog, before, after, expected_msg):
+    before_df = pd.DataFrame(before)
+    after_df = pd.DataFrame(after)
+    _test_log_function(
+        log_replace, caplog, before_df, after_df, logging.INFO, expected_msg
+    )
+
+
+def test_log_replace_raises(caplog):
+    df = pd.DataFrame({"x": [0, 1]})
+    df.fn = Mock(return_value=df.head(1))
+    with pytest.raises(AssertionError, match="not a valid replace operation"):
+        log_replace(df, "fn")
+
+
+def test_disabled_logger_log_filter_dropped_all_rows(caplog):
+    caplog.set_level(logging.WARNING, logger="pdlog")
+    _test_log_function(
+        log_filter,
+        caplog,
+        pd.DataFrame({"x": [0, 1, 2], "y": [0, 1, 2]}),
+        pd.DataFrame({"x": []}),
+        logging.CRITICAL,
+        "fn: dropped 1 column (50%): ['y'] and all rows",
+    )
+
+
+def test_log_fillna_approximate(caplog):
+    before_df = pd.DataFrame({"x": [nan, 1.0] * 500})
+    before_df.fn = Mock(return_value=before_df.fillna(0))
+
+    with option_context(approximate=True, sample_size=100):
+        log_fillna(before_df, "fn")
+
+    message = caplog.records[0].message
+    assert message.startswith("fn: filled ~")
+    assert message.endswith(" [approximate: sampled 100 of 1000 rows]")
+
+
+def test_log_fillna_approximate_unnamed_series(caplog):
+    with option_context(approximate=True, sample_size=3):
+        pd.Series([1.0, None] * 5).log.fillna(0)
+
+    assert caplog.records[0].message.startswith("fillna: filled ~")
+    assert caplog.records[0].pdlog["filled"] > 0
+
+
+def test_log_fillna_approximate_no_columns(caplog):
+    before_df = pd.DataFrame(index=range(10))
+    before_df.fn = Mock(return_value=before_df)
+
+    with option_context(approximate=True, sample_size=3):
+        log_fillna(before_df, "fn")
+
+    assert caplog.records[0].message == (
+        "fn: filled ~0 observations (±0) (0%) [approximate: sampled 3 of 10 rows]"
+    )
+
+
+def test_log_fillna_approximate_small_frame_is_exact(caplog):
+    before_df = pd.DataFrame([0, 1, nan])
+    before_df.fn = Mock(return_value=before_df.fillna(0))
+
+    with option_context(approximate=True, sample_size=100):
+        log_fillna(before_df, "fn")
+
+    assert caplog.records[0].message == "fn: filled 1 observation (33%): {0: 1}"
+
+
+def test_log_rename_approximate(caplog):
+    before_df = pd.DataFrame(index=range(1000), columns=["x"])
+    before_df.fn = Mock(return_value=before_df.rename(index=lambda i: i + 1000))
+
+    with option_context(approximate=True, sample_size=100):
+        log_rename(before_df, "fn")
+
+    message = caplog.records[0].message
+    assert message.startswith("fn: renamed ~1000 rows (±0): [")
+    assert message.endswith(" [approximate: sampled 100 of 1000 rows]")
+
+
+@pytest.mark.parametrize(
+    ("args", "kwargs", "expected_msg"),
+    (
+        pytest.param(
+            (), {"index": {1: 10, 7: 70}}, "fn: renamed 1 row: [10]", id="index"
+        ),
+        pytest.param(
+            ({1: 10},), {"axis": "index"}, "fn: renamed 1 row: [10]", id="mapper"
+        ),
+        pytest.param(
+            (), {"columns": {"a": "b"}}, "fn: renamed 1 column: ['b']", id="columns"
+        ),
+        pytest.param((), {"index": {1: 2}}, "fn: renamed nothing", id="existing_label"),
+        pytest.param(
+            (),
+            {"index": lambda i: i * 10},
+            "fn: renamed 4 rows: [10, ..., 40]",
+            id="fn",
+        ),
+    ),
+)
+def test_log_rename_mappers(caplog, args, kwargs, expected_msg):
+    before_df = pd.DataFrame(index=range(5), columns=["a"])
+    before_df.fn = Mock(return_value=before_df.rename(*args, **kwargs))
+
+    log_rename(before_df, "fn", *args, **kwargs)
+
+    assert caplog.records[0].message == expected_msg
+
+
+@pytest.mark.parametrize(
+    ("before", "after", "mapper", "expected"),
+    (
+        pytest.param(["a", "b"], ["a", "b"], None, [], id="equal"),
+        pytest.param(["a", "b"], ["c", "c"], None, ["c"], id="unique"),
+        pytest.param(["a", "a"], ["b", "a"], {"a": "b"}, ["b"], id="non_unique"),
+        pytest.param(["a", "b", "c"], ["c", "b", "a"], None, [], id="swapped"),
+        pytest.param(["a", "b", "c"], ["c", "x", "a"], {"b": "x"}, ["x"], id="map"),
+    ),
+)
+def test_renamed(before, after, mapper, expected):
+    result = _renamed(pd.Index(before), pd.Index(after), mapper)
+    assert result.tolist() == expected
+
+
+def test_renamed_same_data():
+    index = pd.RangeIndex(10)
+    assert _renamed(index, index.view(), None).empty
+
+
+def test_filtered_records_are_not_formatted(caplog, monkeypatch):
+    summarize = Mock()
+    monkeypatch.setattr("pdlog.logging.summarize", summarize)
+    before_df = pd.DataFrame({"x": [1, 2]})
+    before_df.fn = Mock(return_value=before_df.T)
+    pdlog_logger = logging.getLogger("pdlog")
+    reject_all = logging.Filter("nothing")
+
+    pdlog_logger.addFilter(reject_all)
+    try:
+        log_reshape(before_df, "fn")
+    finally:
+        pdlog_logger.removeFilter(reject_all)
+
+    summarize.assert_not_called()
+    assert not caplog.records
+
+
+@pytest.mark.parametrize(
+    ("log_fn", "before", "after", "expected"),
+    (
+        pytest.param(
+            log_filter,
+            {"x": [1, 2, 3], "y": [4, 5, 6]},
+            {"x": [1]},
+            {"dropped_columns": ["y"]},
+            id="filter",
+        ),
+        pytest.param(
+            log_fillna,
+            {"x": [1, nan, nan], "y": [nan, 5, 6]},
+            {"x": [1, 0, 0], "y": [nan, 5, 6]},
+            {"approximate": False, "filled": 2, "filled_columns": {"x": 2}},
+            id="fillna",
+        ),
+        pytest.param(
+            log_rename,
+            {"x": [1, 2, 3], "y": [4, 5, 6]},
+            {"x": [1, 2, 3], "z": [4, 5, 6]},
+            {"approximate": False, "renamed_rows": 0, "renamed_columns": 1},
+            id="rename",
+        ),
+    ),
+)
+def test_record_payload(caplog, log_fn, before, after, expected):
+    before_df = pd.DataFrame(before)
+    after_df = pd.DataFrame(after)
+    before_df.fn = Mock(return_value=after_df)
+
+    log_fn(before_df, "fn")
+
+    payload = caplog.records[0].pdlog
+    assert payload["function"] == "fn"
+    assert payload["rows_before"] == before_df.shape[0]
+    assert payload["cols_before"] == before_df.shape[1]
+    assert payload["rows_after"] == after_df.shape[0]
+    assert payload["cols_after"] == after_df.shape[1]
+    assert payload["elapsed"] >= 0
+    for key, value in expected.items():
+        actual = payload[key]
+        assert (actual.value() if isinstance(actual, Lazy) else actual) == value
+
+
+@pytest.mark.parametrize("tracemalloc", (False, True))
+def test_profile(caplog, tracemalloc):
+    before_df = pd.DataFrame({"x": range(1000)})
+    before_df.fn = Mock(return_value=before_df.head())
+
+    with option_context(profile=True, profile_tracemalloc=tracemalloc):
+        log_filter(before_df, "fn")
+
+    record = caplog.records[0]
+    payload = record.pdlog
+    assert payload["cpu_time"] >= 0
+    assert payload["memory_before"] > payload["memory_after"]
+    assert payload["memory_delta"] == (
+        payload["memory_after"] - payload["memory_before"]
+    )
+    assert ("memory_peak" in payload) == tracemalloc
+    assert re.fullmatch(
+        r"fn: dropped 995 rows \(>99%\), 5 rows remaining "
+        r"\[\d+\.\d{3}s wall, \d+\.\d{3}s cpu, memory -\d+\.\d KB"
+        + (r", peak \d+(\.\d)? K?B\]" if tracemalloc else r"\]"),
+        record.message,
+    )
+
+
+def test_profile_stops_tracing_on_error(caplog):
+    df = pd.DataFrame({"x": [1]})
+    with option_context(profile=True, profile_tracemalloc=True):
+        with pytest.raises(KeyError):
+            df.log.drop(columns="nope")
+    assert not tracing.is_tracing()
+
+
+def test_key_ids_multiple_keys():
+    left = [pd.Series([1, 1, 2, nan]), pd.Series(["a", "b", "a", "a"])]
+    right = [pd.Series([1, 2, nan]), pd.Series(["b", "a", "a"])]
+    left_ids, right_ids, n_ids = _key_ids(left, right)
+    assert n_ids == 3
+    assert left_ids[0] == -1
+    assert left_ids[1] == right_ids[0]
+    assert left_ids[2] == right_ids[1]
+    assert left_ids[3] == right_ids[2]
+
+
+def test_key_ids_missing_keys():
+    left_ids, right_ids, n_ids = _key_ids([pd.Series([nan, 1.0])], [pd.Series([nan])])
+    assert n_ids == 1
+    assert left_ids.tolist() == [0, -1]
+    assert right_ids.tolist() == [0]
+
+
+def test_context(caplog):
+    df = pd.DataFrame({"x": [1, None]})
+    with context(partition=3):
+        with context(worker="a"):
+            df.log.dropna()
+        df.log.dropna()
+    df.log.dropna()
+
+    assert [r.message for r in caplog.records] == [
+        "[partition=3, worker=a] dropna: dropped 1 row (50%), 1 row remaining",
+        "[partition=3] dropna: dropped 1 row (50%), 1 row remaining",
+        "dropna: dropped 1 row (50%), 1 row remaining",
+    ]
+    assert caplog.records[0].pdlog["context"] == {"partition": 3, "worker": "a"}
+    assert "context" not in caplog.records[2].pdlog
+
+
+class _ListCollector(Collector):
+    def __init__(self):
+        self.payloads = []
+
+    def collect(self, payload):
+        self.payloads.append(payload)
+
+
+def test_collector_is_abstract():
+    with pytest.raises(TypeError, match="abstract"):
+        Collector()
+
+
+def test_collecting_exclusive(caplog):
+    outer, inner = _ListCollector(), _ListCollector()
+    with collecting(outer):
+        with collecting(inner, exclusive=True):
+            pd.DataFrame({"x": [1]}).log.head(1)
+        with collecting(None, exclusive=True):
+            pd.DataFrame({"x": [1]}).log.head(1)
+        pd.DataFrame({"x": [1, 2]}).log.head(1)
+    assert [p["rows_before"] for p in inner.payloads] == [1]
+    assert [p["rows_before"] for p in outer.payloads] == [2]
+
+
+def test_collectors_are_thread_local(caplog):
+    collectors = [_ListCollector() for _ in range(4)]
+    barrier = threading.Barrier(len(collectors))
+
+    def work(collector, rows):
+        with collecting(collector):
+            barrier.wait()
+            pd.DataFrame({"x": range(rows)}).log.head(1)
+
+    threads = [
+        threading.Thread(target=work, args=(collector, i + 1))
+        for i, collector in enumerate(collectors)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for i, collector in enumerate(collectors):
+        assert [p["rows_before"] for p in collector.payloads] == [i + 1]
+
+
+@pytest.mark.parametrize(
+    ("function_name", "before", "after", "expected"),
+    (
+        pytest.param(
+            "head", pd.Index([5, 3, 5]), pd.Index([5, 3]), pd.Index([5]), id="head"
+        ),
+        pytest.param(
+            "tail", pd.Index([5, 3, 5]), pd.Index([5]), pd.Index([5, 3]), id="tail"
+        ),
+        pytest.param(
+            "fn",
+            pd.RangeIndex(10),
+            pd.RangeIndex(5),
+            pd.RangeIndex(5, 10),
+            id="range",
+        ),
+        pytest.param(
+            "fn",
+            pd.Index(["a", "b", "c", "d"]),
+            pd.Index(["d", "b"]),
+            pd.Index(["a", "c"]),
+            id="labels",
+        ),
+        pytest.param(
+            "fn",
+            pd.Index([0, 0, 1, 1]),
+            pd.Index([0, 1]),
+            pd.Index([0, 1]),
+            id="duplicate_labels",
+        ),
+    ),
+)
+def test_dropped_rows(function_name, before, after, expected):
+    pd.testing.assert_index_equal(
+        _dropped_rows(function_name, before, after), expected, exact=False
+    )
+
+
+@pytest.mark.parametrize(
+    ("before", "dropped", "n", "expected"),
+    (
+        pytest.param(
+            pd.RangeIndex(100), pd.RangeIndex(20, 100), 2, "[20:100]", id="range"
+        ),
+        pytest.param(
+            pd.RangeIndex(100),
+            pd.Index([0, 1, 2, 5, 7, 8, 10, 20, 21]),
+            2,
+            "[0:3, 5, ..., 10, 20:22]",
+            id="runs",
+        ),
+        pytest.param(
+            pd.Index(list("abcdef")),
+            pd.Index(list("abcef")),
+            2,
+            "['a', 'b', ..., 'e', 'f']",
+            id="labels",
+        ),
+        pytest.param(
+            pd.date_range("2020-01-01", periods=3),
+            pd.date_range("2020-01-02", periods=2),
+            2,
+            "['2020-01-02 00:00:00', '2020-01-03 00:00:00']",
+            id="timestamps",
+        ),
+    ),
+)
+def test_summarize_rows(before, dropped, n, expected):
+    assert _summarize_rows(before, dropped, n) == expected
+
+
+def test_log_filter_dropped_labels(caplog):
+    df = pd.DataFrame({"x": [1, None, None, 4, None], "y": [1, 2, 3, 4, 5]})
+    with option_context(dropped_labels=3):
+        df.log.dropna()
+        df.log.head(1)
+        df.set_index("y").log.dropna()
+        df.set_index(pd.Index([0, 0, 1, 1, 1])).log.dropna()
+
+    assert [r.message for r in caplog.records] == [
+        "dropna: dropped 3 rows (60%): [1:3, 4], 2 rows remaining",
+        "head: dropped 4 rows (80%): [1:5], 1 row remaining",
+        "dropna: dropped 3 rows (60%): [2, 3, 5], 2 rows remaining",
+        "dropna: dropped 3 rows (60%): [0, 1, 1], 2 rows remaining",
+    ]
+    assert caplog.records[0].pdlog["dropped_rows"].value() == "[1:3, 4]"
+
+
+@pytest.mark.parametrize(
+    ("convert", "expected_msg"),
+    (
+        pytest.param(
+            lambda df: df.log.astype(float),
+            "astype: changed dtypes: {'a': int64 -> float64}, memory",
+            id="all",
+        ),
+        pytest.param(
+            lambda df: df.log.astype({"a": "Float64"}),
+            "astype: changed dtypes: {'a': float64 -> Float64}, memory",
+            id="subset",
+        ),
+        pytest.param(
+            lambda df: df.log.assign(b=1),
+            "assign: new columns: {'b': int64}, memory",
+            id="assign",
+        ),
+    ),
+)
+def test_log_change_dtype_duplicate_columns(caplog, convert, expected_msg):
+    df = pd.DataFrame([[1, 2.0], [3, None]], columns=["a", "a"])
+    convert(df)
+    assert caplog.records[0].message.startswith(expected_msg)
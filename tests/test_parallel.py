@@ -0,0 +1,79 @@
+import logging
+
+import pandas as pd
+import pytest
+
+import pdlog
+
+
+@pytest.fixture
+def caplog(caplog):
+    caplog.set_level(logging.INFO)
+    return caplog
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_partitioned(caplog, executor):
+    frames = [pd.DataFrame({"x": [1.0] + [None] * i}) for i in range(4)]
+    frames.append(pd.DataFrame({"x": [None, None]}))
+
+    results = pdlog.partitioned(frames, "clean", executor, max_workers=2).dropna()
+
+    assert [len(df) for df in results] == [1, 1, 1, 1, 0]
+    assert [(r.levelno, r.message) for r in caplog.records] == [
+        (logging.CRITICAL, "[partition=4] dropna: dropped all rows"),
+        (
+            logging.INFO,
+            "clean: dropna over 5 partitions: 12 rows to 4 rows, "
+            "dropped 8 rows (67%)",
+        ),
+    ]
+    payload = caplog.records[-1].pdlog
+    assert payload["partitions"] == 5
+    assert payload["calls"] == 5
+
+
+def test_partitioned_keeps_context(caplog):
+    frames = [pd.DataFrame({"x": [None]})]
+    with pdlog.context(job="nightly"):
+        pdlog.partitioned(frames).dropna()
+    assert caplog.records[0].message == (
+        "[job=nightly, partition=0] dropna: dropped all rows"
+    )
+
+
+def test_partitioned_disabled(caplog):
+    caplog.set_level(logging.WARNING)
+    results = pdlog.partitioned([pd.DataFrame({"x": [1, None]})]).dropna()
+    assert len(results[0]) == 1
+    assert caplog.records == []
+
+
+def test_partitioned_invalid_method():
+    with pytest.raises(AttributeError, match="to_csv can't be applied to partitions"):
+        pdlog.partitioned([]).to_csv
+
+
+def test_partitioned_invalid_executor():
+    with pytest.raises(ValueError, match="executor must be 'thread' or 'process'"):
+        pdlog.partitioned([], executor="gpu")
+
+
+def test_partitioned_in_track(caplog):
+    frames = [pd.DataFrame({"x": [1, None]})] * 2
+    with pdlog.track("job", quiet=True) as tracker:
+        pdlog.partitioned(frames).dropna()
+
+    assert caplog.records[0].message.startswith("job: 1 step in ")
+    assert tracker.steps[0]["rows_before"] == 4
+    assert tracker.steps[0]["rows_after"] == 2
+    assert caplog.records[0].pdlog["steps"] == 1
+
+
+def test_partitioned_context(caplog):
+    with pdlog.context(job="nightly"):
+        pdlog.partitioned([pd.DataFrame({"x": [1, None]})]).dropna()
+    assert caplog.records[0].message == (
+        "[job=nightly] partitioned: dropna over 1 partition: 2 rows to 1 row, "
+        "dropped 1 row (50%)"
+    )
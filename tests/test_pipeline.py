@@ -0,0 +1,100 @@
+import logging
+
+import numpy as np
+import pandas as pd
+import pytest
+from numpy import nan
+from pandas.testing import assert_frame_equal
+
+import pdlog  # noqa
+from pdlog import logging as pdlog_logging
+from pdlog.config import option_context
+
+
+@pytest.fixture
+def caplog(caplog):
+    caplog.set_level(logging.INFO)
+    return caplog
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({"x": [1, nan, 3, 3], "y": ["a", "b", nan, "a"]})
+
+
+def test_pipeline_matches_chain(caplog, df):
+    expected = (
+        df.log.fillna({"x": 0})
+        .log.drop_duplicates()
+        .log.astype({"x": int})
+        .log.rename(columns={"x": "z"})
+    )
+    expected_messages = [record.message for record in caplog.records]
+    caplog.clear()
+
+    pipeline = (
+        df.log.pipeline()
+        .fillna({"x": 0})
+        .drop_duplicates()
+        .astype({"x": int})
+        .rename(columns={"x": "z"})
+    )
+    assert not caplog.records
+    assert repr(pipeline) == (
+        "Pipeline(fillna(), drop_duplicates(), astype(), rename())"
+    )
+    assert_frame_equal(pipeline.run(), expected)
+    assert [record.message for record in caplog.records] == expected_messages
+
+
+def test_pipeline_reuses_stats(caplog, df, monkeypatch):
+    calls = []
+    count_na = pdlog_logging.count_na
+
+    def counting(frame, *args):
+        calls.append(frame.shape)
+        return count_na(frame, *args)
+
+    monkeypatch.setattr(pdlog_logging, "count_na", counting)
+    with option_context(profile=True):
+        df.log.pipeline().fillna({"x": 0}).fillna("z").astype("category").run()
+    # before and after the first fillna, after the second one and after astype
+    assert len(calls) == 4
+    assert caplog.records[-1].pdlog["memory_before"] == (
+        caplog.records[-2].pdlog["memory_after"]
+    )
+
+
+def test_pipeline_passes_copy_false(df, monkeypatch):
+    calls = []
+    astype = pd.DataFrame.astype
+
+    def recording(self, *args, **kwargs):
+        calls.append(kwargs.get("copy"))
+        return astype(self, *args, **kwargs)
+
+    monkeypatch.setattr(pd.DataFrame, "astype", recording)
+    df.log.pipeline().astype({"x": float}).dropna().astype({"x": int}).run()
+    df.log.pipeline().dropna().astype({"x": int}, copy=True).run()
+    df.log.pipeline().head(2).astype({"x": float}).run()
+    assert calls == [None, False, True, None]
+
+
+@pytest.mark.parametrize(
+    "steps",
+    (
+        pytest.param(lambda p: p.head(2).rename(columns={"x": "z"}), id="head"),
+        pytest.param(lambda p: p.dropna().rename(columns={"x": "z"}), id="dropna"),
+    ),
+)
+def test_pipeline_result_does_not_alias_input(steps):
+    df = pd.DataFrame({"x": [1.0, 2.0, 3.0]})
+    result = steps(df.log.pipeline()).run()
+    assert not np.shares_memory(result.to_numpy(), df.to_numpy())
+    result.iloc[0, 0] = 99
+    assert df.iloc[0, 0] == 1
+
+
+def test_pipeline_unknown_step(df):
+    with pytest.raises(AttributeError, match="groupby can't be a step"):
+        df.log.pipeline().groupby("x")
@@ -0,0 +1,132 @@
+import pandas as pd
+import pytest
+from numpy import nan
+from numpy.testing import assert_array_equal
+
+from pdlog.config import option_context
+from pdlog.stats import count_changed
+from pdlog.stats import count_na
+from pdlog.stats import count_value_changes
+from pdlog.stats import estimate
+from pdlog.stats import iter_chunks
+from pdlog.stats import sample_positions
+
+
+@pytest.fixture
+def wide_df():
+    return pd.DataFrame(
+        {f"c{i}": [nan if j % (i + 2) == 0 else j for j in range(6)] for i in range(10)}
+    )
+
+
+@pytest.mark.parametrize("chunk_size", (1, 3, 10, 100))
+def test_iter_chunks_covers_all_columns(wide_df, chunk_size):
+    starts = []
+    columns = []
+    for start, chunk in iter_chunks(wide_df, chunk_size):
+        assert chunk.shape[1] <= chunk_size
+        starts.append(start)
+        columns.extend(chunk.columns)
+    assert starts == list(range(0, 10, chunk_size))
+    assert columns == wide_df.columns.tolist()
+
+
+def test_iter_chunks_uses_option(wide_df):
+    with option_context(chunk_size=4):
+        assert [start for start, _ in iter_chunks(wide_df)] == [0, 4, 8]
+
+
+def test_iter_chunks_invalid_chunk_size(wide_df):
+    with pytest.raises(ValueError, match="chunk_size must be positive"):
+        list(iter_chunks(wide_df, 0))
+
+
+@pytest.mark.parametrize("chunk_size", (1, 3, 10, 100))
+def test_count_na(wide_df, chunk_size):
+    assert_array_equal(count_na(wide_df, chunk_size), wide_df.isna().sum())
+
+
+def test_count_na_duplicate_columns():
+    df = pd.DataFrame([[nan, 1, nan], [nan, nan, 2]], columns=["a", "a", "b"])
+    assert_array_equal(count_na(df, 2), [2, 1, 1])
+
+
+@pytest.mark.parametrize("chunk_size", (1, 3, 100))
+def test_count_changed(wide_df, chunk_size):
+    after = wide_df.fillna(-1).clip(upper=4)
+    expected = (wide_df.fillna(-1) != after).sum() + wide_df.isna().sum()
+    assert_array_equal(count_changed(wide_df, after, chunk_size), expected)
+
+
+def test_count_changed_categorical():
+    before = pd.DataFrame({"a": pd.Categorical(["x", "y"]), "b": ["x", "y"]})
+    after = pd.DataFrame({"a": ["x", "z"], "b": ["x", "y"]})
+    assert_array_equal(count_changed(before, after), [1, 0])
+
+
+def test_count_na_series():
+    assert_array_equal(count_na(pd.Series([nan, 1, nan])), [2])
+
+
+@pytest.mark.parametrize(
+    ("before", "after", "expected"),
+    (
+        pytest.param(pd.Series([1, 2]), pd.Series([1.0, 3.0]), (1, 0), id="numbers"),
+        pytest.param(
+            pd.Series(["a", None]), pd.Series(["b", None]), (1, 0), id="missing_both"
+        ),
+        pytest.param(
+            pd.Series(["1", "x"]), pd.Series([1.0, nan]), (2, 1), id="coerced"
+        ),
+        pytest.param(
+            pd.Series([1, None]),
+            pd.Series([1, None]).astype("Int64"),
+            (0, 0),
+            id="nullable",
+        ),
+        pytest.param(
+            pd.Series(["2020-01-01", "x"]),
+            pd.Series(pd.to_datetime(["2020-01-01", None])),
+            (2, 1),
+            id="incompatible",
+        ),
+    ),
+)
+def test_count_value_changes(before, after, expected):
+    assert count_value_changes(before, after) == expected
+
+
+def test_sample_positions_is_reproducible():
+    with option_context(approximate=True, sample_size=10, random_state=1):
+        first = sample_positions(1000)
+        second = sample_positions(1000)
+    assert_array_equal(first, second)
+    assert len(set(first)) == 10
+    assert list(first) == sorted(first)
+
+
+@pytest.mark.parametrize(
+    ("options", "n"),
+    (
+        pytest.param({"approximate": False, "sample_size": 10}, 1000, id="exact"),
+        pytest.param({"approximate": True, "sample_size": 10}, 10, id="small"),
+    ),
+)
+def test_sample_positions_none(options, n):
+    with option_context(**options):
+        assert sample_positions(n) is None
+
+
+@pytest.mark.parametrize(
+    ("k", "n_sample", "n_total", "expected"),
+    (
+        pytest.param(0, 100, 1000, (0, 0), id="none"),
+        pytest.param(100, 100, 1000, (1000, 0), id="all"),
+        pytest.param(50, 100, 100, (50, 0), id="census"),
+        pytest.param(10, 100, 1000, (100, 56), id="some"),
+        pytest.param(0, 0, 0, (0, 0), id="empty"),
+        pytest.param(0, 0, 10, (0, 10), id="empty_sample"),
+    ),
+)
+def test_estimate(k, n_sample, n_total, expected):
+    assert estimate(k, n_sample, n_total) == expected
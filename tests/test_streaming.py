@@ -0,0 +1,78 @@
+import logging
+
+import pandas as pd
+import pytest
+from numpy import nan
+
+import pdlog
+from pdlog.streaming import stream
+from pdlog.tracking import track
+
+
+@pytest.fixture
+def caplog(caplog):
+    caplog.set_level(logging.INFO)
+    return caplog
+
+
+def _chunks(n):
+    for i in range(n):
+        yield pd.DataFrame({"x": [i, nan, nan, i], "y": [0, 1, 2, 3]})
+
+
+def test_stream(caplog):
+    for chunk in stream(_chunks(3), "ingest"):
+        chunk.log.dropna().log.head(1)
+        chunk.log.fillna(0)
+
+    assert [record.message for record in caplog.records] == [
+        "ingest: dropna over 3 chunks: 12 rows to 6 rows, dropped 6 rows (50%)",
+        "ingest: head over 3 chunks: 6 rows to 3 rows, dropped 3 rows (50%)",
+        "ingest: fillna over 3 chunks: 12 rows to 12 rows, "
+        "filled 6 observations (25%)",
+    ]
+    payload = caplog.records[0].pdlog
+    assert payload["stream"] == "ingest"
+    assert payload["chunks"] == 3
+    assert payload["calls"] == 3
+    assert payload["rows_before"] == 12
+
+
+def test_stream_stopped_early(caplog):
+    chunks = stream(_chunks(3), level=logging.WARNING)
+    for chunk in chunks:
+        chunk.log.dropna()
+        break
+    assert not caplog.records
+    chunks.close()
+    assert len(caplog.records) == 1
+    assert caplog.records[0].levelno == logging.WARNING
+    assert caplog.records[0].message == (
+        "stream: dropna over 1 chunk: 4 rows to 2 rows, dropped 2 rows (50%)"
+    )
+
+
+def test_stream_context_manager(caplog):
+    with stream(_chunks(3), "ingest") as chunks:
+        for chunk in chunks:
+            chunk.log.dropna()
+            break
+    pd.DataFrame({"x": [nan]}).log.dropna()
+    assert [record.message for record in caplog.records] == [
+        "ingest: dropna over 1 chunk: 4 rows to 2 rows, dropped 2 rows (50%)",
+        "dropna: dropped all rows",
+    ]
+
+
+def test_stream_within_track(caplog):
+    with track("etl") as tracker:
+        with pdlog.context(job="nightly"):
+            for chunk in stream(_chunks(2)):
+                chunk.log.dropna()
+    assert [(step["function"], step["rows_before"]) for step in tracker.steps] == [
+        ("dropna", 8)
+    ]
+    assert caplog.records[0].message == (
+        "[job=nightly] stream: dropna over 2 chunks: 8 rows to 4 rows, "
+        "dropped 4 rows (50%)"
+    )
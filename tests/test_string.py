@@ -4,12 +4,15 @@ from typing import Any
 from typing import Sequence
 
 import pytest
+from pandas import Index
 from pandas import Timestamp
 
+from pdlog.string import nbytes
 from pdlog.string import percent
 from pdlog.string import plural
 from pdlog.string import prettify
 from pdlog.string import summarize
+from pdlog.string import summarize_counts
 
 
 @pytest.mark.parametrize(
@@ -40,6 +43,20 @@ def test_percent(n, total, expected):
     assert percent(n, total) == expected
 
 
+@pytest.mark.parametrize(
+    ("n", "sign", "expected"),
+    (
+        pytest.param(0, True, "0 B", id="zero"),
+        pytest.param(1023, False, "1023 B", id="bytes"),
+        pytest.param(1024, True, "+1.0 KB", id="kilobytes"),
+        pytest.param(-5 * 1024 ** 2, False, "-5.0 MB", id="megabytes"),
+        pytest.param(2048 * 1024 ** 3, False, "2048.0 GB", id="gigabytes"),
+    ),
+)
+def test_nbytes(n, sign, expected):
+    assert nbytes(n, sign=sign) == expected
+
+
 class _FakeSequence(Sequence[Any]):
     def __init__(self, data):
         self.data = data
@@ -69,12 +86,29 @@ class _FakeSequence(Sequence[Any]):
             [datetime(2020, 1, 1)], "['2020-01-01 00:00:00']", id="summarize_datetimes"
         ),
         pytest.param([date(2020, 1, 1)], "['2020-01-01']", id="summarize_dates"),
+        pytest.param(Index([1, 2, 3, 4]), "[1, ..., 4]", id="summarize_index"),
     ),
 )
 def test_summarize(items, expected):
     assert summarize(items, max_items=3) == expected
 
 
+@pytest.mark.parametrize(
+    ("counts", "expected"),
+    (
+        pytest.param({"a": 1, "b": 2}, "{'a': 1, 'b': 2}", id="show_all"),
+        pytest.param({0: 1, 1: 2, 2: 3, 3: 4}, "{0: 1, ..., 3: 4}", id="summarize"),
+        pytest.param(
+            {datetime(2020, 1, 1): 1},
+            "{'2020-01-01 00:00:00': 1}",
+            id="summarize_datetimes",
+        ),
+    ),
+)
+def test_summarize_counts(counts, expected):
+    assert summarize_counts(counts, max_items=3) == expected
+
+
 @pytest.mark.parametrize(
     ("obj", "expected"),
     (
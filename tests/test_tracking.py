@@ -0,0 +1,71 @@
+import logging
+
+import pandas as pd
+import pytest
+from numpy import nan
+
+import pdlog  # noqa
+from pdlog.config import option_context
+from pdlog.tracking import track
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({"x": [1, nan, 3, 4], "y": [1, 2, 3, 4]})
+
+
+def test_track(caplog, df):
+    caplog.set_level(logging.INFO)
+
+    with track("etl") as tracker:
+        df.log.dropna().log.drop(columns="y").log.head(1)
+
+    assert len(caplog.records) == 4
+    summary = caplog.records[-1]
+    assert summary.pdlog == {"track": "etl", "steps": 3}
+    assert summary.message.startswith("etl: 3 steps in ")
+    assert summary.message.splitlines()[0].endswith(", 4 -> 1 rows")
+    assert "memory_delta" not in summary.message
+    table = tracker.to_frame()
+    assert table["step"].tolist() == ["dropna", "drop", "head"]
+    assert table["rows_in"].tolist() == [4, 3, 3]
+    assert table["rows_out"].tolist() == [3, 3, 1]
+    assert table["rows_lost"].tolist() == [1, 1, 3]
+
+
+def test_track_quiet(caplog, df):
+    caplog.set_level(logging.INFO)
+
+    with track("etl", quiet=True):
+        df.log.dropna()
+        df.log.query("x > 100")
+
+    assert [r.levelno for r in caplog.records] == [logging.CRITICAL, logging.INFO]
+
+
+def test_track_collects_when_logger_disabled(caplog, df):
+    caplog.set_level(logging.WARNING)
+
+    with option_context(profile=True):
+        with track("etl", level=logging.WARNING) as tracker:
+            df.log.dropna()
+
+    assert len(caplog.records) == 1
+    assert "memory_delta" in caplog.records[0].message
+    assert tracker.to_frame()["memory_delta"].notna().all()
+
+
+def test_track_no_steps(caplog):
+    caplog.set_level(logging.INFO)
+    with track("etl"):
+        pass
+    assert caplog.records[0].message == "etl: no steps"
+
+
+def test_track_logs_on_error(caplog, df):
+    caplog.set_level(logging.INFO)
+    with pytest.raises(ValueError):
+        with track("etl", quiet=True):
+            df.log.dropna()
+            raise ValueError
+    assert caplog.records[0].message.startswith("etl: 1 step in ")